@@ -0,0 +1,118 @@
+"""
+Query plan benchmark for the hot queries
+
+Seeds a throwaway SQLite database, then prints the query plan and the
+average run time of each hot query without and with the model indexes.
+
+Usage: python -m benchmarks.query_plans [thumbnail_rows]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from tortoise import Tortoise
+from database.models import Creator, Editor, ThumbnailCategory, ThumbnailDesigner, Thumbnail
+
+INDEXES = [
+    "idx_creators_name_fd0106",
+    "idx_editors_discord_22ed1d",
+    "idx_thumbnails_created_54773c",
+]
+
+
+def hot_queries():
+    """The queries the bot runs most, keyed by a short label"""
+    start_of_month = datetime(2025, 6, 1)
+    end_of_month = datetime(2025, 7, 1)
+    return {
+        "month export": Thumbnail.filter(
+            created_at__gte=start_of_month,
+            created_at__lt=end_of_month
+        ).order_by("created_at").values(
+            "id",
+            "designer__discord_username",
+            "creator__name",
+            "category__name",
+            "youtube_url",
+            "created_at"
+        ),
+        "creator by name": Creator.filter(name="creator-42", is_active=True).limit(1),
+        "editor by username": Editor.filter(discord_username="editor-42", is_active=True).limit(1),
+        "category by name": ThumbnailCategory.filter(name="category-3", is_active=True).limit(1),
+    }
+
+
+async def seed(thumbnail_rows: int):
+    await Creator.bulk_create([Creator(name=f"creator-{i}") for i in range(500)])
+    await Editor.bulk_create([Editor(discord_id=i, discord_username=f"editor-{i}") for i in range(500)])
+    await ThumbnailCategory.bulk_create([ThumbnailCategory(name=f"category-{i}") for i in range(20)])
+    await ThumbnailDesigner.bulk_create(
+        [ThumbnailDesigner(discord_id=i, discord_username=f"designer-{i}") for i in range(50)]
+    )
+    creators = await Creator.all()
+    categories = await ThumbnailCategory.all()
+    designers = await ThumbnailDesigner.all()
+
+    # spread the records over two years
+    first_day = datetime(2024, 7, 1)
+    batch = []
+    for i in range(thumbnail_rows):
+        batch.append(Thumbnail(
+            designer=random.choice(designers),
+            creator=random.choice(creators),
+            category=random.choice(categories),
+            youtube_url=f"https://youtu.be/{i:011d}",
+            created_at=first_day + timedelta(minutes=random.randrange(60 * 24 * 730))
+        ))
+        if len(batch) == 5000:
+            await Thumbnail.bulk_create(batch)
+            batch = []
+    if batch:
+        await Thumbnail.bulk_create(batch)
+
+
+async def report(connection, label: str, repeat: int = 20):
+    print(f"\n=== {label} ===")
+    for name, query in hot_queries().items():
+        sql = query.sql(params_inline=True)
+        plan = await connection.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await hot_queries()[name]
+        elapsed = (time.perf_counter() - start) / repeat * 1000
+        print(f"{name}: {elapsed:.2f} ms")
+        for step in plan:
+            print(f"    {step['detail']}")
+
+
+async def main(thumbnail_rows: int):
+    with tempfile.TemporaryDirectory() as directory:
+        await Tortoise.init(
+            db_url=f"sqlite://{os.path.join(directory, 'bench.sqlite3')}",
+            modules={"models": ["database.models"]},
+            use_tz=False,
+            timezone="UTC"
+        )
+        await Tortoise.generate_schemas()
+        connection = Tortoise.get_connection("default")
+        print(f"Seeding {thumbnail_rows} thumbnail records...")
+        await seed(thumbnail_rows)
+
+        for index in INDEXES:
+            await connection.execute_script(f'DROP INDEX IF EXISTS "{index}"')
+        await connection.execute_script("ANALYZE")
+        await report(connection, "before (no secondary indexes)")
+
+        # put the indexes back the same way startup does
+        await Tortoise.generate_schemas(safe=True)
+        await connection.execute_script("ANALYZE")
+        await report(connection, "after (model indexes)")
+
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000))
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
-from database.models import GuildConfig, ThumbnailCategory
+from database.models import ThumbnailCategory
+from database.cache import guild_configs, category_index
 
 class Config(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -12,13 +13,9 @@ class Config(commands.Cog):
 
     async def category_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for categories"""
-        categories = await ThumbnailCategory.filter(
-            name__icontains=current,
-            is_active=True
-        ).limit(10)
         choices = [
-            discord.app_commands.Choice(name=category.name, value=category.name)
-            for category in categories
+            discord.app_commands.Choice(name=name, value=name)
+            for name in category_index.search(current)
         ]
         return choices
 
@@ -39,6 +36,7 @@ class Config(commands.Cog):
                 else:
                     existing.is_active = True
                     await existing.save()
+                    category_index.add(existing.name, existing.id)
                     await interaction.response.send_message(
                         f"✅ Category **{category}** has been reactivated successfully!",
                         ephemeral=True
@@ -47,6 +45,7 @@ class Config(commands.Cog):
             
             # create the category
             category_obj = await ThumbnailCategory.create(name=category)
+            category_index.add(category_obj.name, category_obj.id)
 
             await interaction.response.send_message(
                 f"✅ Category **{category}** added successfully!",
@@ -82,6 +81,7 @@ class Config(commands.Cog):
             # if the category is found, mark it as inactive
             category_obj.is_active = False
             await category_obj.save()
+            category_index.set_active(category_obj.id, False)
             
             await interaction.response.send_message(
                 f"✅ Category **{category}** removed successfully!",
@@ -122,11 +122,11 @@ class Config(commands.Cog):
         """Toggle single thumbnail channel"""
         try:
             # get or create guild config
-            guild_config, just_created = await GuildConfig.get_or_create(guild_id=interaction.guild.id)
+            guild_config, just_created = await guild_configs.get_or_create(interaction.guild.id)
             # enable/disable single thumbnail channel
             guild_config.single_thumbnail_channel = not guild_config.single_thumbnail_channel
             # push changes to the database
-            await guild_config.save()
+            await guild_configs.save(guild_config)
 
             await interaction.response.send_message(
                 f"✅ Single thumbnail channel toggled {"on" if guild_config.single_thumbnail_channel else "off"}!",
@@ -145,13 +145,13 @@ class Config(commands.Cog):
         """Set the channel for single thumbnail requests"""
         try:  
             # get or create guild config
-            guild_config, just_created = await GuildConfig.get_or_create(guild_id=interaction.guild.id)
+            guild_config, just_created = await guild_configs.get_or_create(interaction.guild.id)
             
             # set the single thumbnail channel by storing the channel id
             guild_config.single_thumbnail_channel_id = channel.id
 
             # push changes to the database
-            await guild_config.save()
+            await guild_configs.save(guild_config)
 
             await interaction.response.send_message(
                 f"✅ Single thumbnail channel set to {channel.mention}!",
@@ -164,6 +164,53 @@ class Config(commands.Cog):
             )
 
 
+    @category.command(name="toggle-thread-workspaces", description="Toggle private threads instead of private channels for claims")
+    async def toggle_thread_workspaces(self, interaction: discord.Interaction):
+        """Toggle thread workspaces"""
+        try:
+            # get or create guild config
+            guild_config, just_created = await guild_configs.get_or_create(interaction.guild.id)
+            # enable/disable thread workspaces
+            guild_config.thread_workspaces = not guild_config.thread_workspaces
+            # push changes to the database
+            await guild_configs.save(guild_config)
+
+            message = f"✅ Thread workspaces toggled {"on" if guild_config.thread_workspaces else "off"}!"
+            if guild_config.thread_workspaces and not guild_config.workspace_parent_channel_id:
+                message += "\nUse `/category set-workspace-parent-channel` to choose where the threads are created"
+            await interaction.response.send_message(message, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(
+                f"❌ Error toggling thread workspaces: {str(e)}",
+                ephemeral=True
+            )
+
+
+    @category.command(name="set-workspace-parent-channel", description="Set the channel that claim threads are created in")
+    @discord.app_commands.describe(channel="The channel to create private claim threads in")
+    async def set_workspace_parent_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
+        """Set the parent channel for thread workspaces"""
+        try:
+            # get or create guild config
+            guild_config, just_created = await guild_configs.get_or_create(interaction.guild.id)
+
+            # set the parent channel by storing the channel id
+            guild_config.workspace_parent_channel_id = channel.id
+
+            # push changes to the database
+            await guild_configs.save(guild_config)
+
+            await interaction.response.send_message(
+                f"✅ Claim threads will be created in {channel.mention}!",
+                ephemeral=True
+            )
+        except Exception as e:
+            await interaction.response.send_message(
+                f"❌ Error setting workspace parent channel: {str(e)}",
+                ephemeral=True
+            )
+
+
     @category.command(name="set-category-channel", description="Set an existing channel as a thumbnail category channel")
     @discord.app_commands.describe(
         channel="The channel to add as a thumbnail category channel",
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 from database.models import Creator
+from database.cache import creator_index
 
 class Creators(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -25,6 +26,7 @@ class Creators(commands.Cog):
                 else: # if creator is marked as inactive
                     existing.is_active = True
                     await existing.save()
+                    creator_index.add(existing.name, existing.id)
                     view = discord.ui.LayoutView()
                     container = discord.ui.Container(
                         discord.ui.TextDisplay(
@@ -37,6 +39,7 @@ class Creators(commands.Cog):
                     return
             # if creator does not exist, create it
             creator = await Creator.create(name=name, is_active=True)
+            creator_index.add(creator.name, creator.id)
             view = discord.ui.LayoutView()
             container = discord.ui.Container(
                 discord.ui.TextDisplay(
@@ -67,6 +70,7 @@ class Creators(commands.Cog):
                 return
             existing.is_active = False
             await existing.save()
+            creator_index.set_active(existing.id, False)
             view = discord.ui.LayoutView()
             container = discord.ui.Container(
                 discord.ui.TextDisplay(
@@ -1,178 +1,874 @@
 import discord
 from discord.ext import commands
-from datetime import datetime
-from database.models import Thumbnail
-import pandas as pd
+from datetime import datetime, timedelta
+from database.models import Thumbnail, ThumbnailMonthlyStat, ExportCursor, Creator, ThumbnailDesigner, ThumbnailCategory
+from database.cache import creator_index, category_index
+from tortoise import timezone
+from tortoise.expressions import Q
+from tortoise.functions import Count, Max, Sum
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import asyncio
+import calendar
+import csv
+import gzip
+import hashlib
 import io
+import json
+import math
+import os
+import shutil
+import threading
+
+# database field -> csv header, in column order
+EXPORT_COLUMNS = {
+    "id": "Thumbnail Record ID",
+    "designer__discord_username": "Designer (Discord Username)",
+    "creator__name": "Creator",
+    "category__name": "Category",
+    "youtube_url": "YouTube URL",
+    "created_at": "Created Date"
+}
+# rows fetched from the database per query
+EXPORT_CHUNK_SIZE = 1000
+# attachment limit for servers without boosts
+DEFAULT_ATTACHMENT_LIMIT = 10 * 1024 * 1024
+# export format -> label
+EXPORT_FORMATS = {
+    "csv": "CSV",
+    "parquet": "Parquet",
+    "xlsx": "Excel (XLSX)"
+}
+# incremental exports stop this far in the past, so records still being
+# committed can't end up behind the cursor
+CURSOR_SETTLE_TIME = timedelta(minutes=1)
+# full month name (any case) -> month number
+MONTHS = {calendar.month_name[number].lower(): number for number in range(1, 13)}
+# stats grouping -> (rollup field, label)
+STATS_GROUPS = {
+    "designer": ("designer__discord_username", "Designer"),
+    "creator": ("creator__name", "Creator"),
+    "category": ("category__name", "Category")
+}
+
+
+def db_datetime(value: datetime):
+    """A datetime in the form thumbnail timestamps are stored in, for comparing against them
+
+    Timestamps are saved in UTC with their offset but read back naive. On SQLite
+    they are compared as text, so a naive value read back never equals the
+    stored one, and keyset pagination would return the boundary record twice.
+    """
+    return timezone.make_aware(value, "UTC") if timezone.is_naive(value) else value
+
+
+@dataclass
+class ExportQuery:
+    """Thumbnail records created in [start, end), optionally filtered"""
+    start: datetime
+    end: datetime
+    creator: str = None
+    designer: str = None
+    category: str = None
+    # (created_at, id) of the last record already exported, only later records are included
+    after: tuple = None
+    # driven by an export cursor, never cached since the next run starts somewhere else
+    incremental: bool = False
+
+    def filters(self):
+        """Tortoise filter kwargs for this query"""
+        filters = {"created_at__gte": db_datetime(self.start), "created_at__lt": db_datetime(self.end)}
+        if self.creator:
+            filters["creator__name"] = self.creator
+        if self.designer:
+            filters["designer__discord_username"] = self.designer
+        if self.category:
+            filters["category__name"] = self.category
+        return filters
+
+    def describe_filters(self):
+        """Human readable list of the optional filters"""
+        return ", ".join(
+            f"{label}: {value}"
+            for label, value in (("Creator", self.creator), ("Designer", self.designer), ("Category", self.category))
+            if value
+        )
+
+
+async def iter_thumbnail_rows(query: ExportQuery, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield chunks of thumbnail export rows matching the query, oldest first"""
+    queryset = Thumbnail.filter(**query.filters())
+    last_row = None
+    if query.after:
+        last_row = {"created_at": query.after[0], "id": query.after[1]}
+    while True:
+        page = queryset
+        # keyset pagination on (created_at, id) so each chunk is an index range scan
+        if last_row:
+            last_created_at = db_datetime(last_row["created_at"])
+            page = page.filter(
+                Q(created_at__gt=last_created_at)
+                | Q(created_at=last_created_at, id__gt=last_row["id"])
+            )
+        rows = await page.order_by("created_at", "id").limit(chunk_size).values(*EXPORT_COLUMNS)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last_row = rows[-1]
+
+
+async def new_thumbnails_query(guild_id: int, now: datetime):
+    """The guild's export cursor and the incremental query for the records after it"""
+    cursor, _ = await ExportCursor.get_or_create(guild_id=guild_id)
+    after = None
+    if cursor.last_created_at is not None:
+        after = (cursor.last_created_at, cursor.last_thumbnail_id)
+    start = after[0] if after else datetime.min
+    return cursor, ExportQuery(start=start, end=now - CURSOR_SETTLE_TIME, after=after, incremental=True)
+
+
+async def advance_export_cursor(cursor: ExportCursor, after: tuple, last_row: tuple):
+    """Move the cursor to the last exported record, False if another export moved it first"""
+    # only move the cursor if it is still where this export started from, so
+    # two exports running at once can't skip or rewind it
+    if after:
+        unchanged = {"last_created_at": db_datetime(after[0]), "last_thumbnail_id": after[1]}
+    else:
+        unchanged = {"last_created_at__isnull": True}
+    advanced = await ExportCursor.filter(id=cursor.id, **unchanged).update(
+        last_created_at=db_datetime(last_row[0]),
+        last_thumbnail_id=last_row[1]
+    )
+    return bool(advanced)
+
+
+def package_csv(header: bytes, records: list, filename: str, size_limit: int):
+    """Fit a CSV file under the attachment limit (runs in the export pool)
+
+    Sends the CSV as is if it fits, otherwise gzipped, otherwise as numbered
+    gzipped parts that each repeat the header. records holds one encoded
+    record per row, so parts are cut between records and never inside a
+    quoted field with a line break. Returns (bytes, filename) pairs.
+    """
+    data = header + b"".join(records)
+    if len(data) <= size_limit:
+        return [(data, f"{filename}.csv")]
+
+    compressed = gzip.compress(data)
+    if len(compressed) <= size_limit:
+        return [(compressed, f"{filename}.csv.gz")]
+
+    def encode(start, stop):
+        return gzip.compress(header + b"".join(records[start:stop]))
+
+    return package_parts(len(records), encode, filename, "csv.gz", size_limit, whole_size=len(compressed))
+
+
+def package_parts(row_count: int, encode, filename: str, extension: str, size_limit: int, whole_size: int = None):
+    """Fit a file that can't be split after encoding under the attachment limit (runs in the export pool)
+
+    encode(start, stop) returns the file for rows [start, stop). If the whole
+    file is too big it is encoded again as numbered parts with fewer rows each.
+    Callers that already know the whole file is too big pass its size as whole_size.
+    """
+    if whole_size is None:
+        data = encode(0, row_count)
+        if len(data) <= size_limit:
+            return [(data, f"{filename}.{extension}")]
+        whole_size = len(data)
+
+    # leave some room since rows don't compress evenly
+    part_count = math.ceil(whole_size / (size_limit * 0.9))
+    while True:
+        rows_per_part = math.ceil(row_count / part_count)
+        parts = [
+            encode(start, min(start + rows_per_part, row_count))
+            for start in range(0, row_count, rows_per_part)
+        ]
+        if all(len(part) <= size_limit for part in parts):
+            return [
+                (part, f"{filename}_part{number}of{len(parts)}.{extension}")
+                for number, part in enumerate(parts, start=1)
+            ]
+        part_count += 1
+
+
+class ExportFormatUnavailable(Exception):
+    """Raised when the package an export format needs isn't installed"""
+
+
+class CsvRecords(list):
+    """csv.writer target that keeps every written row as its own item
+
+    The csv module writes each row with a single write() call, so an item is
+    always one whole record, line breaks inside quoted fields included.
+    """
+    write = list.append
+
+
+class CsvExport:
+    """Streams rows into CSV records, gzipped and split between records if it's too big"""
+
+    def __init__(self):
+        header = CsvRecords()
+        csv.writer(header).writerow(EXPORT_COLUMNS.values())
+        self._header = header[0].encode("utf-8")
+        self._text = CsvRecords()
+        self._writer = csv.writer(self._text)
+        # encoded records, one per row
+        self._records = []
+
+    def write(self, rows: list):
+        """Write a chunk of export rows (runs in the export pool)"""
+        self._writer.writerows([row[column] for column in EXPORT_COLUMNS] for row in rows)
+        self._records.extend(record.encode("utf-8") for record in self._text)
+        self._text.clear()
+
+    def package(self, filename: str, size_limit: int, row_count: int):
+        return package_csv(self._header, self._records, filename, size_limit)
+
+
+class ParquetExport:
+    """Collects rows as typed Arrow batches and writes a zstd compressed Parquet file"""
+
+    def __init__(self):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportFormatUnavailable("Parquet exports need the pyarrow package installed")
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self._schema = pyarrow.schema([
+            (EXPORT_COLUMNS["id"], pyarrow.int64()),
+            (EXPORT_COLUMNS["designer__discord_username"], pyarrow.string()),
+            (EXPORT_COLUMNS["creator__name"], pyarrow.string()),
+            (EXPORT_COLUMNS["category__name"], pyarrow.string()),
+            (EXPORT_COLUMNS["youtube_url"], pyarrow.string()),
+            (EXPORT_COLUMNS["created_at"], pyarrow.timestamp("us"))
+        ])
+        self._batches = []
+
+    def write(self, rows: list):
+        """Convert a chunk of export rows to an Arrow batch (runs in the export pool)"""
+        self._batches.append(self._pyarrow.RecordBatch.from_arrays(
+            [
+                self._pyarrow.array([row[column] for row in rows], type=field.type)
+                for column, field in zip(EXPORT_COLUMNS, self._schema)
+            ],
+            schema=self._schema
+        ))
+
+    def package(self, filename: str, size_limit: int, row_count: int):
+        table = self._pyarrow.Table.from_batches(self._batches, schema=self._schema)
+
+        def encode(start, stop):
+            buffer = io.BytesIO()
+            self._parquet.write_table(table.slice(start, stop - start), buffer, compression="zstd")
+            return buffer.getvalue()
+
+        return package_parts(row_count, encode, filename, "parquet", size_limit)
+
+
+class XlsxExport:
+    """Collects rows and writes them to an Excel workbook with native number and date cells"""
+
+    def __init__(self):
+        try:
+            import openpyxl
+        except ImportError:
+            raise ExportFormatUnavailable("Excel exports need the openpyxl package installed")
+        self._openpyxl = openpyxl
+        self._rows = []
+
+    def write(self, rows: list):
+        """Collect a chunk of export rows (runs in the export pool)"""
+        self._rows.extend([row[column] for column in EXPORT_COLUMNS] for row in rows)
+
+    def package(self, filename: str, size_limit: int, row_count: int):
+        def encode(start, stop):
+            # write-only mode streams rows out instead of keeping every cell object
+            workbook = self._openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet("Thumbnails")
+            sheet.append(list(EXPORT_COLUMNS.values()))
+            for row in self._rows[start:stop]:
+                sheet.append(row)
+            buffer = io.BytesIO()
+            workbook.save(buffer)
+            return buffer.getvalue()
+
+        return package_parts(row_count, encode, filename, "xlsx", size_limit)
+
+
+# export format -> writer class
+EXPORT_WRITERS = {
+    "csv": CsvExport,
+    "parquet": ParquetExport,
+    "xlsx": XlsxExport
+}
+
+
+async def export_data_version(query: ExportQuery):
+    """Fingerprint of the data an export of the query's period is built from
+
+    Part of the cache key, so a cached export is only used while the data is
+    unchanged, no matter which process or kind of query changed it. Inserts and
+    deletes in the period change the count or the highest id, edits move the
+    latest updated_at, and the joined names are covered by the latest updated_at
+    of their tables. Queryset .update() and bulk_update() don't set updated_at
+    on their own, writes through them have to include it.
+    """
+    period = Thumbnail.filter(created_at__gte=db_datetime(query.start), created_at__lt=db_datetime(query.end))
+    thumbnails = await period.annotate(
+        count=Count("id"),
+        last_id=Max("id"),
+        last_update=Max("updated_at")
+    ).values_list("count", "last_id", "last_update")
+    names = [
+        await model.all().annotate(last_update=Max("updated_at")).values_list("last_update", flat=True)
+        for model in (ThumbnailDesigner, Creator, ThumbnailCategory)
+    ]
+    return repr((thumbnails, names))
+
+
+class ExportCache:
+    """On-disk cache of finished export files, evicting the least recently used first
+
+    Only periods that have already ended are cached, keyed on the data version
+    from export_data_version so entries built from older data are never hit
+    again and age out of the cache.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # key -> metadata, least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        # entries are read and written from several export pool threads
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for key in os.listdir(self.directory):
+            meta_path = os.path.join(self.directory, key, "meta.json")
+            try:
+                with open(meta_path) as meta_file:
+                    meta = json.load(meta_file)
+                # entries from before the data version was part of the key can never be hit
+                if "start" in meta or "size" not in meta:
+                    raise ValueError(f"outdated cache entry {key}")
+                entries.append((os.path.getmtime(meta_path), key, meta))
+            except (OSError, ValueError):
+                # half written or from an older version, just drop it
+                shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        for last_used, key, meta in sorted(entries):
+            self._entries[key] = meta
+            self._size += meta["size"]
+
+    @staticmethod
+    def key(query: ExportQuery, export_format: str, size_limit: int, data_version: str):
+        """Cache key for a query, its file format, the attachment limit it was packaged for and the data version"""
+        parts = (
+            query.start.isoformat(),
+            query.end.isoformat(),
+            query.creator,
+            query.designer,
+            query.category,
+            export_format,
+            size_limit,
+            data_version
+        )
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def get(self, key: str):
+        """Get the cached (files, row_count, last_row) for a key, or None"""
+        with self._lock:
+            meta = self._entries.get(key)
+            if meta is None:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            files = []
+            for filename in meta["files"]:
+                with open(os.path.join(self.directory, key, filename), "rb") as cached_file:
+                    files.append((cached_file.read(), filename))
+            os.utime(os.path.join(self.directory, key, "meta.json"))
+        except OSError:
+            self._remove(key)
+            return None
+        last_row = meta["last_row"]
+        if last_row:
+            last_row = (datetime.fromisoformat(last_row[0]), last_row[1])
+        return files, meta["row_count"], last_row
+
+    def put(self, key: str, files: list, row_count: int, last_row: tuple):
+        """Store finished export files"""
+        entry_directory = os.path.join(self.directory, key)
+        os.makedirs(entry_directory, exist_ok=True)
+        for data, filename in files:
+            with open(os.path.join(entry_directory, filename), "wb") as cached_file:
+                cached_file.write(data)
+        meta = {
+            "row_count": row_count,
+            "last_row": [last_row[0].isoformat(), last_row[1]] if last_row else None,
+            "files": [filename for data, filename in files],
+            "size": sum(len(data) for data, filename in files)
+        }
+        # meta.json is written last, an entry without it is incomplete
+        with open(os.path.join(entry_directory, "meta.json"), "w") as meta_file:
+            json.dump(meta, meta_file)
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries[key]["size"]
+            self._entries[key] = meta
+            self._size += meta["size"]
+            evicted = []
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                evicted_key, evicted_meta = self._entries.popitem(last=False)
+                self._size -= evicted_meta["size"]
+                evicted.append(evicted_key)
+        for evicted_key in evicted:
+            shutil.rmtree(os.path.join(self.directory, evicted_key), ignore_errors=True)
+
+    def _remove(self, key: str):
+        with self._lock:
+            meta = self._entries.pop(key, None)
+            if meta:
+                self._size -= meta["size"]
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+
+
+export_cache = ExportCache(
+    directory=os.getenv("EXPORT_CACHE_DIR", "export_cache"),
+    max_bytes=int(os.getenv("EXPORT_CACHE_MAX_MB", "200")) * 1024 * 1024
+)
+
+
+class ExportQueueFull(Exception):
+    """Raised when too many exports are already waiting for the pool"""
+
+
+class ExportPipeline:
+    """Fetches export rows on the event loop and serializes them in a bounded thread pool
+
+    At most `workers` exports run at once, and at most `queue_size` more wait
+    for a slot, anything past that is rejected with ExportQueueFull.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+        self._slots = asyncio.Semaphore(workers)
+        self._queue_size = queue_size
+        self._waiting = 0
+
+    async def run_in_pool(self, func, *args):
+        """Run a blocking function in the export pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def export(self, query: ExportQuery, filename: str, size_limit: int, export_format: str = "csv"):
+        """Export the records matching a query as files of the given format under the size limit
+
+        Returns a list of (bytes, filename) pairs, the number of records and
+        the (created_at, id) of the last record
+        """
+        if self._waiting >= self._queue_size:
+            raise ExportQueueFull()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            # closed periods rarely change, so they are served from the cache when
+            # their data hasn't changed since
+            cacheable = not query.incremental and query.end <= datetime.now()
+            if cacheable:
+                # the version is read before the rows, an edit made while exporting
+                # leaves the entry under the older version where it won't be hit
+                data_version = await export_data_version(query)
+                cache_key = export_cache.key(query, export_format, size_limit, data_version)
+                cached = await self.run_in_pool(export_cache.get, cache_key)
+                if cached:
+                    return cached
+
+            writer = EXPORT_WRITERS[export_format]()
+            row_count, last_row = await self._write_rows(query, writer)
+            files = []
+            if row_count:
+                files = await self.run_in_pool(writer.package, filename, size_limit, row_count)
+
+            if cacheable:
+                await self.run_in_pool(export_cache.put, cache_key, files, row_count, last_row)
+            return files, row_count, last_row
+        finally:
+            self._slots.release()
+
+    async def _write_rows(self, query: ExportQuery, writer):
+        row_count = 0
+        last_row = None
+        pending_write = None
+        async for rows in iter_thumbnail_rows(query):
+            # the next chunk is fetched while the previous one is being written
+            if pending_write:
+                await pending_write
+            pending_write = asyncio.ensure_future(self.run_in_pool(writer.write, rows))
+            row_count += len(rows)
+            last_row = (rows[-1]["created_at"], rows[-1]["id"])
+        if pending_write:
+            await pending_write
+        return row_count, last_row
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def month_range(year: int, month: int):
+    """Start of the month and start of the next month"""
+    start_of_month = datetime(year, month, 1)
+    if month == 12:
+        return start_of_month, datetime(year + 1, 1, 1)
+    return start_of_month, datetime(year, month + 1, 1)
+
+
+FORMAT_CHOICES = [
+    discord.app_commands.Choice(name=label, value=export_format)
+    for export_format, label in EXPORT_FORMATS.items()
+]
+FORMAT_DESCRIPTION = "File format (CSV by default)"
+
+
+async def creator_all_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete for all creators (past exports can include inactive ones)"""
+    return [
+        discord.app_commands.Choice(name=name, value=name)
+        for name in creator_index.search(current, active_only=False)
+    ]
+
+
+async def category_all_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete for all categories (past exports can include inactive ones)"""
+    return [
+        discord.app_commands.Choice(name=name, value=name)
+        for name in category_index.search(current, active_only=False)
+    ]
+
 
 class Export(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-    
+        self.pipeline = ExportPipeline()
+
+    async def cog_unload(self):
+        self.pipeline.shutdown()
+
     export = discord.app_commands.Group(name="export", description="Export commands")
 
 
-    @export.command(name="thumbnails-current-month", description="Export thumbnails for the current month")
-    async def export_thumbnails_current_month(self, interaction: discord.Interaction):
-        """Export thumbnail records for the current month as CSV file"""
+    async def send_export(
+        self,
+        interaction: discord.Interaction,
+        query: ExportQuery,
+        title: str,
+        filename: str,
+        empty_label: str,
+        export_format: str = "csv"
+    ):
+        """Run an export and send the file(s), splitting them if needed
+
+        Returns the (created_at, id) of the last record delivered, or None if nothing was sent
+        """
         try:
-            now = datetime.now()
-            start_of_month = datetime(now.year, now.month, 1)
-            if now.month == 12:
-                end_of_month = datetime(now.year + 1, 1, 1)
-            else:
-                end_of_month = datetime(now.year, now.month + 1, 1)
-
-            # query the db 
-            rows = await Thumbnail.filter(
-            created_at__gte=start_of_month,
-            created_at__lt=end_of_month
-            ).values(
-                "id",
-                "designer__discord_username",
-                "creator__name",
-                "category__name",
-                "youtube_url",
-                "created_at"
-            ).order_by('created_at')
-            
-            # convert to dataframe, then to csv
-            df = pd.DataFrame(rows)
-
-            if df.empty:
-                await interaction.response.send_message(
-                    f"❌ No thumbnail records found for {now.strftime('%B %Y')}",
+            # exports can take longer than the 3 second interaction window
+            await interaction.response.defer(ephemeral=True)
+
+            size_limit = interaction.guild.filesize_limit if interaction.guild else DEFAULT_ATTACHMENT_LIMIT
+            files, row_count, last_row = await self.pipeline.export(query, filename, size_limit, export_format)
+
+            if not row_count:
+                await interaction.followup.send(
+                    f"❌ No thumbnail records found for {empty_label}",
                     ephemeral=True
                 )
                 return
 
-            # rename columns for better csv headers
-            df.rename(columns={
-                "id": "Thumbnail Record ID",
-                "designer__discord_username": "Designer (Discord Username)",
-                "creator__name": "Creator",
-                "category__name": "Category",
-                "youtube_url": "YouTube URL",
-                "created_at": "Created Date"
-            }, inplace=True)
-
-            # create csv string
-            csv_string = df.to_csv(index=False)
-
-            # write to file and send
-            filename = f"thumbnails_{now.strftime('%B_%Y')}.csv"
-            file = discord.File(io.StringIO(csv_string), filename=filename)
-
-            # view containing file
-            view = discord.ui.LayoutView(
-                discord.ui.TextDisplay(
-                    f"📊 **Thumbnail Export of the Current Month**"
-                ),
-                discord.ui.File(file=file)
-            )
+            # one message per file, since the attachment limit is per message
+            for number, (data, part_filename) in enumerate(files, start=1):
+                file = discord.File(io.BytesIO(data), filename=part_filename)
+                heading = f"📊 **{title}**"
+                if len(files) > 1:
+                    heading += f" (part {number} of {len(files)})"
+                else:
+                    heading += f"\n{row_count} records"
 
-            await interaction.response.send_message(view=view, ephemeral=True)
+                # view containing file
+                view = discord.ui.LayoutView()
+                view.add_item(discord.ui.TextDisplay(heading))
+                view.add_item(discord.ui.File(file))
+                await interaction.followup.send(view=view, file=file, ephemeral=True)
+            return last_row
 
+        except ExportQueueFull:
+            await interaction.followup.send(
+                "❌ Too many exports are running right now, please try again in a minute",
+                ephemeral=True
+            )
+        except ExportFormatUnavailable as e:
+            await interaction.followup.send(
+                f"❌ {e}, please pick another format",
+                ephemeral=True
+            )
         except Exception as e:
-            await interaction.response.send_message(
+            send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+            await send(
                 f"❌ Error exporting thumbnails: {str(e)}",
                 ephemeral=True
             )
 
 
+    @export.command(name="thumbnails-current-month", description="Export thumbnails for the current month")
+    @discord.app_commands.describe(file_format=FORMAT_DESCRIPTION)
+    @discord.app_commands.choices(file_format=FORMAT_CHOICES)
+    async def export_thumbnails_current_month(self, interaction: discord.Interaction, file_format: str = "csv"):
+        """Export thumbnail records for the current month"""
+        now = datetime.now()
+        start_of_month, end_of_month = month_range(now.year, now.month)
+        await self.send_export(
+            interaction,
+            ExportQuery(start=start_of_month, end=end_of_month),
+            title="Thumbnail Export of the Current Month",
+            filename=f"thumbnails_{now.strftime('%B_%Y')}",
+            empty_label=now.strftime('%B %Y'),
+            export_format=file_format
+        )
+
+
     @export.command(name="thumbnails-month", description="Export thumbnails for a specific month")
     @discord.app_commands.describe(
         month="The month to export thumbnails for",
-        year="The year to export thumbnails for"
+        year="The year to export thumbnails for",
+        file_format=FORMAT_DESCRIPTION
     )
-    async def export_thumbnails_month(self, interaction: discord.Interaction, month: str, year: int):
-        """Export thumbnail records for a specific month and year as CSV file"""
+    @discord.app_commands.choices(file_format=FORMAT_CHOICES)
+    async def export_thumbnails_month(self, interaction: discord.Interaction, month: str, year: int, file_format: str = "csv"):
+        """Export thumbnail records for a specific month and year"""
+        # Convert month name to number (full names only, any case)
+        month_lower = month.strip().lower()
+        if month_lower not in MONTHS:
+            await interaction.response.send_message(
+                "❌ Invalid month! Please use a full month name (e.g. January)",
+                ephemeral=True
+            )
+            return
+
+        if not 2000 <= year <= 9998:
+            await interaction.response.send_message(
+                "❌ Invalid year!",
+                ephemeral=True
+            )
+            return
+
+        month_num = MONTHS[month_lower]
+        month_name = calendar.month_name[month_num]
+        start_of_month, end_of_month = month_range(year, month_num)
+        await self.send_export(
+            interaction,
+            ExportQuery(start=start_of_month, end=end_of_month),
+            title=f"Thumbnail Export for the Month of {month_name} {year}",
+            filename=f"thumbnails_{month_name}_{year}",
+            empty_label=f"{month_name} {year}",
+            export_format=file_format
+        )
+
+
+    @export.command(name="thumbnails-range", description="Export thumbnails for a date range, optionally filtered")
+    @discord.app_commands.describe(
+        start_date="First day to export (YYYY-MM-DD)",
+        end_date="Last day to export, inclusive (YYYY-MM-DD)",
+        creator="Only export thumbnails for this creator",
+        designer="Only export thumbnails by this designer (Discord username)",
+        category="Only export thumbnails in this category",
+        file_format=FORMAT_DESCRIPTION
+    )
+    @discord.app_commands.choices(file_format=FORMAT_CHOICES)
+    @discord.app_commands.autocomplete(creator=creator_all_autocomplete)
+    @discord.app_commands.autocomplete(category=category_all_autocomplete)
+    async def export_thumbnails_range(
+        self,
+        interaction: discord.Interaction,
+        start_date: str,
+        end_date: str,
+        creator: str = None,
+        designer: str = None,
+        category: str = None,
+        file_format: str = "csv"
+    ):
+        """Export thumbnail records for a date range"""
         try:
-            # Month name to number mapping (full names only)
-            month_mapping = {
-                'January': 1,
-                'February': 2,
-                'March': 3,
-                'April': 4,
-                'May': 5,
-                'June': 6,
-                'July': 7,
-                'August': 8,
-                'September': 9,
-                'October': 10,
-                'November': 11,
-                'December': 12
-            }
-            
-            # Convert month name to number
-            month_lower = month.lower()
-            if month_lower not in month_mapping:
+            start = datetime.strptime(start_date.strip(), "%Y-%m-%d")
+            last_day = datetime.strptime(end_date.strip(), "%Y-%m-%d")
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Invalid date! Please use the YYYY-MM-DD format (e.g. 2025-01-31)",
+                ephemeral=True
+            )
+            return
+
+        if last_day < start:
+            await interaction.response.send_message(
+                "❌ The end date must not be before the start date!",
+                ephemeral=True
+            )
+            return
+
+        query = ExportQuery(
+            start=start,
+            end=last_day + timedelta(days=1),
+            creator=creator,
+            designer=designer,
+            category=category
+        )
+        period = f"{start:%Y-%m-%d} to {last_day:%Y-%m-%d}"
+        filters = query.describe_filters()
+        await self.send_export(
+            interaction,
+            query,
+            title=f"Thumbnail Export for {period}" + (f"\n{filters}" if filters else ""),
+            filename=f"thumbnails_{start:%Y-%m-%d}_to_{last_day:%Y-%m-%d}",
+            empty_label=period + (f" ({filters})" if filters else ""),
+            export_format=file_format
+        )
+
+
+    @export.command(name="thumbnails-new", description="Export thumbnails added since the last incremental export")
+    @discord.app_commands.describe(file_format=FORMAT_DESCRIPTION)
+    @discord.app_commands.choices(file_format=FORMAT_CHOICES)
+    async def export_thumbnails_new(self, interaction: discord.Interaction, file_format: str = "csv"):
+        """Export the thumbnail records after this server's cursor, then move the cursor past them"""
+        # the cursor decides what the next accounting export contains, only administrators may move it
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(
+                "❌ You are not authorized to use this command! (Administrators only)",
+                ephemeral=True
+            )
+            return
+
+        now = datetime.now()
+        cursor, query = await new_thumbnails_query(interaction.guild.id, now)
+        after = query.after
+        since = f"{after[0]:%Y-%m-%d %H:%M}" if after else "the beginning"
+        last_row = await self.send_export(
+            interaction,
+            query,
+            title=f"New Thumbnails since {since}",
+            filename=f"thumbnails_new_{now:%Y-%m-%d_%H%M}",
+            empty_label=f"new records since {since}",
+            export_format=file_format
+        )
+        if not last_row:
+            return
+
+        advanced = await advance_export_cursor(cursor, after, last_row)
+        if not advanced:
+            await interaction.followup.send(
+                "⚠️ Another incremental export finished at the same time, some of these records may be repeated there",
+                ephemeral=True
+            )
+
+
+    @export.command(name="stats", description="Thumbnail totals for a month or a year")
+    @discord.app_commands.describe(
+        year="The year to show totals for",
+        month="The month to show totals for (leave empty for the whole year)",
+        group_by="What to total the thumbnails by"
+    )
+    @discord.app_commands.choices(group_by=[
+        discord.app_commands.Choice(name=label, value=group)
+        for group, (field, label) in STATS_GROUPS.items()
+    ])
+    async def export_stats(self, interaction: discord.Interaction, year: int, month: str = None, group_by: str = "designer"):
+        """Show thumbnail totals from the monthly rollup (never scans the thumbnail records)"""
+        try:
+            if not 2000 <= year <= 9998:
                 await interaction.response.send_message(
-                    "❌ Invalid month! Please use a full month name (e.g. January)",
+                    "❌ Invalid year!",
                     ephemeral=True
                 )
                 return
-        
-            month_num = month_mapping[month_lower]
 
-            # Calculate start and end of month
-            start_of_month = datetime(year, month_num, 1)
-            if month_num == 12:
-                end_of_month = datetime(year + 1, 1, 1)
+            if month:
+                month_lower = month.strip().lower()
+                if month_lower not in MONTHS:
+                    await interaction.response.send_message(
+                        "❌ Invalid month! Please use a full month name (e.g. January)",
+                        ephemeral=True
+                    )
+                    return
+                month_num = MONTHS[month_lower]
+                start, end = month_range(year, month_num)
+                period = f"{calendar.month_name[month_num]} {year}"
             else:
-                end_of_month = datetime(year, month_num + 1, 1)
-
-            # query the db 
-            rows = await Thumbnail.filter(
-            created_at__gte=start_of_month,
-            created_at__lt=end_of_month
-            ).values(
-                "id",
-                "designer__discord_username",
-                "creator__name",
-                "category__name",
-                "youtube_url",
-                "created_at"
-            ).order_by('created_at')
-            
-            # convert to dataframe, then to csv
-            df = pd.DataFrame(rows)
-
-            if df.empty:
+                start, end = datetime(year, 1, 1), datetime(year + 1, 1, 1)
+                period = str(year)
+
+            field, label = STATS_GROUPS[group_by]
+            totals = await ThumbnailMonthlyStat.filter(
+                month__gte=start.date(),
+                month__lt=end.date()
+            ).annotate(
+                total=Sum("count")
+            ).group_by(field).order_by("-total", field).values(field, "total")
+
+            if not totals:
                 await interaction.response.send_message(
-                    f"❌ No thumbnail records found for {month} {year}",
+                    f"❌ No thumbnail records found for {period}",
                     ephemeral=True
                 )
                 return
 
-            # rename columns for better csv headers
-            df.rename(columns={
-                "id": "Thumbnail Record ID",
-                "designer__discord_username": "Designer (Discord Username)",
-                "creator__name": "Creator",
-                "category__name": "Category",
-                "youtube_url": "YouTube URL",
-                "created_at": "Created Date"
-            }, inplace=True)
-
-            # create csv string
-            csv_string = df.to_csv(index=False)
-
-            # write to file and send
-            filename = f"thumbnails_{month}_{year}.csv"
-            file = discord.File(io.StringIO(csv_string), filename=filename)
-
-            view = discord.ui.LayoutView(
+            grand_total = sum(row["total"] for row in totals)
+            lines = "\n".join(f"• {row[field]}: {row['total']}" for row in totals)
+            view = discord.ui.LayoutView()
+            container = discord.ui.Container(
                 discord.ui.TextDisplay(
-                    f"📊 **Thumbnail Export for the Month of {month} {year}**"
+                    f"### 📊 Thumbnails by {label} for {period}\n"
+                    f"**Total:** {grand_total}"
                 ),
-                discord.ui.File(file=file)
+                discord.ui.Separator()
             )
-            await interaction.response.send_message(view=view, ephemeral=True)
 
+            # long lists don't fit in a message, send them as a csv instead
+            if len(lines) <= 3500:
+                container.add_item(discord.ui.TextDisplay(lines))
+                view.add_item(container)
+                await interaction.response.send_message(view=view, ephemeral=True)
+                return
+
+            text = io.StringIO()
+            writer = csv.writer(text)
+            writer.writerow([label, "Thumbnails"])
+            writer.writerows([row[field], row["total"]] for row in totals)
+            file = discord.File(
+                io.BytesIO(text.getvalue().encode("utf-8")),
+                filename=f"thumbnail_stats_{period.replace(' ', '_')}_by_{group_by}.csv"
+            )
+            view.add_item(container)
+            view.add_item(discord.ui.File(file))
+            await interaction.response.send_message(view=view, file=file, ephemeral=True)
 
         except Exception as e:
             await interaction.response.send_message(
-                f"❌ Error exporting thumbnails: {str(e)}",
+                f"❌ Error getting thumbnail stats: {str(e)}",
                 ephemeral=True
-            )
\ No newline at end of file
+            )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Export(bot))
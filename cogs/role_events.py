@@ -4,7 +4,11 @@ Handles automatic staff management based on Discord roles
 """
 import discord
 from discord.ext import commands
-from database.models import Editor, ThumbnailDesigner, Overseer, GuildConfig
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from database.models import Editor, ThumbnailDesigner, Overseer
+from database.cache import guild_configs, editor_index
+from database.role_queue import role_event_queue
 
 
 class RoleEvents(commands.Cog):
@@ -17,17 +21,17 @@ class RoleEvents(commands.Cog):
     async def on_member_update(self, before: discord.Member, after: discord.Member):
         try:
             # Get roles that were added and removed
-            added_roles = set(after.roles) - set(before.roles)
-            removed_roles = set(before.roles) - set(after.roles)
-            
-            # Handle added roles
-            for role in added_roles:
-                await self._handle_role_added(after, role)
-            
-            # Handle removed roles
-            for role in removed_roles:
-                await self._handle_role_removed(after, role)
-                
+            before_role_ids = {role.id for role in before.roles}
+            after_role_ids = {role.id for role in after.roles}
+            added_role_ids = after_role_ids - before_role_ids
+            removed_role_ids = before_role_ids - after_role_ids
+
+            # nickname/avatar updates etc. don't change any roles
+            if not added_role_ids and not removed_role_ids:
+                return
+
+            await self._handle_role_changes(after, added_role_ids, removed_role_ids)
+
         except Exception as e:
             print(f"Error in on_member_update: {e}")
     
@@ -35,102 +39,135 @@ class RoleEvents(commands.Cog):
     @commands.Cog.listener("on_member_remove")
     async def on_member_remove(self, member: discord.Member):
         try:
-            for role in member.roles:
-                await self._handle_role_removed(member, role)
+            await self._handle_role_changes(member, set(), {role.id for role in member.roles})
         except Exception as e:
             print(f"Error in on_member_remove: {e}")
 
 
-    async def _handle_role_added(self, member: discord.Member, role: discord.Role):
-        print(f"Role '{role.name}' (ID: {role.id}) added to {member.name}")
-        
-        # Get guild config to check if this role is configured
-        guild_config = await GuildConfig.filter(guild_id=member.guild.id).first()
-        if not guild_config:
-            return
-        
-        # Determine which type of role this is
-        model_class = None
-        role_type = None
-        
-        if role.id == guild_config.editor_role_id:
-            model_class = Editor
-            role_type = "Editor"
-        elif role.id == guild_config.thumbnail_designer_role_id:
-            model_class = ThumbnailDesigner
-            role_type = "Thumbnail Designer"
-        elif role.id == guild_config.overseer_role_id:
-            model_class = Overseer
-            role_type = "Overseer"
-        else:
-            return
-        
-        try:
-            # Check if the user is already assigned to the added role
-            existing = await model_class.filter(discord_id=member.id).first()
-            
-            if existing:
-                # if the user already has the role, and is marked as active, do nothing
-                if existing.is_active:
-                    return
-                # if the user already has the role, but is marked as inactive, reactivate them
-                else:
-                    existing.is_active = True
-                    # update the username if it's different
-                    if existing.discord_username != member.name:
-                        existing.discord_username = member.name
-                    await existing.save()
-                    print(f"Reactivated {role_type} role for {member.name}")
-            else:
-                # Create new staff member
-                staff_member = await model_class.create(
-                    discord_id=member.id,
-                    discord_username=member.name,
-                    is_active=True
-                )
-                
-                print(f"Added {role_type} role for {member.name}")
-                
-        except Exception as e:
-            print(f"Error adding {role_type} role for {member.name}: {e}")
+    def _staff_roles(self, guild_config):
+        """Map each configured staff role ID to its model class and role type"""
+        staff_roles = {}
+        # setdefault keeps the first match if the same role is configured twice
+        if guild_config.editor_role_id:
+            staff_roles.setdefault(guild_config.editor_role_id, (Editor, "Editor"))
+        if guild_config.thumbnail_designer_role_id:
+            staff_roles.setdefault(guild_config.thumbnail_designer_role_id, (ThumbnailDesigner, "Thumbnail Designer"))
+        if guild_config.overseer_role_id:
+            staff_roles.setdefault(guild_config.overseer_role_id, (Overseer, "Overseer"))
+        return staff_roles
 
 
-    async def _handle_role_removed(self, member, role):
-        print(f"Role '{role.name}' (ID: {role.id}) removed from {member.name}")
-        
-        # Get guild config to check if this role is configured
-        guild_config = await GuildConfig.filter(guild_id=member.guild.id).first()
+    async def _handle_role_changes(self, member: discord.Member, added_role_ids: set, removed_role_ids: set):
+        """Queue the staff part of a member's role diff"""
+        # Get guild config to check which roles are configured (cached, no DB access)
+        guild_config = await guild_configs.get(member.guild.id)
         if not guild_config:
             return
-        
-        # Determine which type of role this is
-        model_class = None
-        role_type = None
-        
-        if role.id == guild_config.editor_role_id:
-            model_class = Editor
-            role_type = "Editor"
-        elif role.id == guild_config.thumbnail_designer_role_id:
-            model_class = ThumbnailDesigner
-            role_type = "Thumbnail Designer"
-        elif role.id == guild_config.overseer_role_id:
-            model_class = Overseer
-            role_type = "Overseer"
-        else:
+
+        # Only keep the roles that are staff roles, everything else is skipped
+        staff_roles = self._staff_roles(guild_config)
+        changes = [
+            (*staff_roles[role_id], True) for role_id in added_role_ids & staff_roles.keys()
+        ] + [
+            (*staff_roles[role_id], False) for role_id in removed_role_ids & staff_roles.keys()
+        ]
+        if not changes:
             return
-        
+
+        # queued writes are coalesced and flushed in one transaction
+        for model_class, role_type, is_active in changes:
+            print(f"{role_type} role {'added to' if is_active else 'removed from'} {member.name}")
+            role_event_queue.push(member.id, member.name, model_class, role_type, is_active)
+
+
+    """" Staff Reconciliation """
+
+    @commands.Cog.listener("on_ready")
+    async def reconcile_on_ready(self):
+        # pick up role changes that happened while the bot was offline
         try:
-            # Find and deactivate the staff member
-            existing = await model_class.filter(discord_id=member.id).first()
-
-            if existing and existing.is_active:
-                existing.is_active = False
-                await existing.save()
-                print(f"Deactivated {role_type} role for {member.name}")
-                
+            await self.reconcile_staff()
         except Exception as e:
-            print(f"Error removing {role_type} role for {member.name}: {e}")
-        
+            print(f"Error reconciling staff on startup: {e}")
+
+
+    async def reconcile_staff(self):
+        """Sync the staff tables with the current members of every configured staff role"""
+        # write out queued role events first so they can't overwrite the reconciled state
+        await role_event_queue.flush()
+
+        # staff tables are shared between guilds, so collect the role members of every
+        # configured guild before diffing, otherwise one guild would deactivate another's staff
+        members_by_model = {Editor: {}, ThumbnailDesigner: {}, Overseer: {}}
+        role_types = {}
+        for guild in self.bot.guilds:
+            guild_config = await guild_configs.get(guild.id)
+            if not guild_config:
+                continue
+
+            # make sure role.members is complete before walking it
+            if not guild.chunked:
+                await guild.chunk()
+
+            for role_id, (model_class, role_type) in self._staff_roles(guild_config).items():
+                role = guild.get_role(role_id)
+                # a deleted role is left alone rather than deactivating all of its staff
+                if role is None:
+                    continue
+                role_types[model_class] = role_type
+                for member in role.members:
+                    members_by_model[model_class][member.id] = member
+
+        summary = {}
+        async with in_transaction() as connection:
+            for model_class, role_type in role_types.items():
+                summary[role_type] = await self._reconcile_model(
+                    model_class, members_by_model[model_class], connection
+                )
+
+        # rebuild the editor autocomplete index from the reconciled table
+        if Editor in role_types:
+            editor_index.load(await Editor.all().values_list("discord_username", "discord_id", "is_active"))
+        print(f"Reconciled staff: {summary}")
+        return summary
+
+
+    async def _reconcile_model(self, model_class, members: dict, connection):
+        """Diff one staff table against the members holding its role and apply it in bulk"""
+        rows = {row.discord_id: row for row in await model_class.all().using_db(connection)}
+
+        to_create = [
+            model_class(discord_id=member.id, discord_username=member.name, is_active=True)
+            for member_id, member in members.items()
+            if member_id not in rows
+        ]
+        to_activate = [row.id for row in rows.values() if row.discord_id in members and not row.is_active]
+        to_deactivate = [row.id for row in rows.values() if row.discord_id not in members and row.is_active]
+        to_rename = []
+        for row in rows.values():
+            member = members.get(row.discord_id)
+            if member and row.discord_username != member.name:
+                row.discord_username = member.name
+                # bulk_update doesn't set updated_at, exports notice renames by it
+                row.updated_at = timezone.now()
+                to_rename.append(row)
+
+        if to_create:
+            await model_class.bulk_create(to_create, using_db=connection)
+        if to_activate:
+            await model_class.filter(id__in=to_activate).using_db(connection).update(is_active=True)
+        if to_deactivate:
+            await model_class.filter(id__in=to_deactivate).using_db(connection).update(is_active=False)
+        if to_rename:
+            await model_class.bulk_update(to_rename, fields=["discord_username", "updated_at"], using_db=connection)
+
+        return {
+            "added": len(to_create),
+            "reactivated": len(to_activate),
+            "deactivated": len(to_deactivate),
+            "renamed": len(to_rename)
+        }
+
 
 
     """" Role Setting Commands """
@@ -142,14 +179,11 @@ class RoleEvents(commands.Cog):
         """Set the role ID for editors in the database"""
         try:
             # Get or create guild config
-            guild_config, created = await GuildConfig.get_or_create(
-                guild_id=interaction.guild.id,
-                defaults={}
-            )
+            guild_config, created = await guild_configs.get_or_create(interaction.guild.id)
             
             # Update the role ID of the role to be set for editors
             guild_config.editor_role_id = role.id
-            await guild_config.save()
+            await guild_configs.save(guild_config)
 
             view = discord.ui.LayoutView()
             container = discord.ui.Container(
@@ -174,14 +208,11 @@ class RoleEvents(commands.Cog):
         """Set the role ID for thumbnail designers in the database"""
         try:
             # Get or create guild config
-            guild_config, created = await GuildConfig.get_or_create(
-                guild_id=interaction.guild.id,
-                defaults={}
-            )
+            guild_config, created = await guild_configs.get_or_create(interaction.guild.id)
             
             # Update the designer role ID
             guild_config.thumbnail_designer_role_id = role.id
-            await guild_config.save()
+            await guild_configs.save(guild_config)
             
             view = discord.ui.LayoutView()
             container = discord.ui.Container(
@@ -206,14 +237,11 @@ class RoleEvents(commands.Cog):
         """Set the role ID for overseers in the database"""
         try:
             # Get or create guild config
-            guild_config, created = await GuildConfig.get_or_create(
-                guild_id=interaction.guild.id,
-                defaults={}
-            )
+            guild_config, created = await guild_configs.get_or_create(interaction.guild.id)
             
             # Update the overseer role ID
             guild_config.overseer_role_id = role.id
-            await guild_config.save()
+            await guild_configs.save(guild_config)
             
             view = discord.ui.LayoutView()
             container = discord.ui.Container(
@@ -237,7 +265,7 @@ class RoleEvents(commands.Cog):
         """List the current role configuration for this server"""
         try:
             # Get guild config
-            guild_config = await GuildConfig.filter(guild_id=interaction.guild.id).first()
+            guild_config = await guild_configs.get(interaction.guild.id)
 
             if not guild_config:
                 await interaction.response.send_message(
@@ -293,5 +321,48 @@ class RoleEvents(commands.Cog):
             await interaction.response.send_message(f"❌ Error listing role config: {str(e)}", ephemeral=True)
 
 
+    @role.command(name="reconcile-staff", description="Sync staff records with the current role members")
+    async def reconcile_staff_command(self, interaction: discord.Interaction):
+        """Sync staff records with the members of the configured staff roles"""
+        try:
+            if not interaction.user.guild_permissions.administrator:
+                await interaction.response.send_message(
+                    "❌ You are not authorized to use this command! (Administrators only)",
+                    ephemeral=True
+                )
+                return
+
+            # chunking a large guild can take longer than the interaction window
+            await interaction.response.defer(ephemeral=True)
+            summary = await self.reconcile_staff()
+
+            if not summary:
+                await interaction.followup.send(
+                    "❌ No staff roles configured! Please set up roles first.",
+                    ephemeral=True
+                )
+                return
+
+            view = discord.ui.LayoutView()
+            container = discord.ui.Container(
+                discord.ui.TextDisplay(
+                    "## ✅ Staff Reconciled"
+                ),
+                discord.ui.Separator(),
+                accent_color=discord.Color.green(),
+            )
+            for role_type, counts in summary.items():
+                container.add_item(discord.ui.TextDisplay(
+                    f"**{role_type}:**\n"
+                    f"Added: {counts['added']}, Reactivated: {counts['reactivated']}, "
+                    f"Deactivated: {counts['deactivated']}, Renamed: {counts['renamed']}"
+                ))
+            view.add_item(container)
+            await interaction.followup.send(view=view, ephemeral=True)
+
+        except Exception as e:
+            await interaction.followup.send(f"❌ Error reconciling staff: {str(e)}", ephemeral=True)
+
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(RoleEvents(bot))
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 from database.models import Editor, Creator
+from database.cache import creator_index, editor_index, assignments
 
 class StaffManagement(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -10,26 +11,18 @@ class StaffManagement(commands.Cog):
 
     async def editor_active_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for editors"""
-        editors = await Editor.filter(
-            is_active=True,
-            discord_username__icontains=current
-        ).limit(10)
         choices = [
-            discord.app_commands.Choice(name=editor.discord_username, value=editor.discord_username)
-            for editor in editors
+            discord.app_commands.Choice(name=name, value=name)
+            for name in editor_index.search(current)
         ]
         return choices
     
 
     async def creator_active_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for creators"""
-        creators = await Creator.filter(
-            is_active=True,
-            name__icontains=current
-        ).limit(10)
         choices = [
-            discord.app_commands.Choice(name=creator.name, value=creator.name)
-            for creator in creators
+            discord.app_commands.Choice(name=name, value=name)
+            for name in creator_index.search(current)
         ]
         return choices
 
@@ -74,8 +67,7 @@ class StaffManagement(commands.Cog):
                 return
             
             # Check if assignment already exists
-            existing_assignments = await editor.assigned_creators.filter(name=creator_name)
-            if existing_assignments:
+            if assignments.is_assigned(editor.discord_id, creator.id):
                 await interaction.response.send_message(
                     f"❌ Editor '{editor_name}' is already assigned to creator '{creator_name}'!",
                     ephemeral=True
@@ -84,6 +76,7 @@ class StaffManagement(commands.Cog):
             
             # Assign creator to editor
             await editor.assigned_creators.add(creator)
+            assignments.assign(editor.discord_id, creator.id)
             await interaction.response.send_message(
                 f"✅ **Editor:** {editor_name} has been assigned to **Creator:** {creator_name}",
                 ephemeral=True
@@ -102,23 +95,13 @@ class StaffManagement(commands.Cog):
         creator_name = interaction.namespace.creator_name
 
         if not creator_name:
-            editors = await Editor.filter(is_active=True).limit(10)
-            choices = [
-                discord.app_commands.Choice(name=editor.discord_username, value=editor.discord_username)
-                for editor in editors
-            ]
-            return choices
+            names = editor_index.search(current)
         else:
-            editors = await Editor.filter(
-                assigned_creators__name=creator_name,
-                discord_username__icontains=current,
-                is_active=True
-            ).limit(10)
-            choices = [
-                discord.app_commands.Choice(name=editor.discord_username, value=editor.discord_username)
-                for editor in editors
-            ]
-            return choices
+            # creators can share a name, offer the editors of any of them
+            editor_ids = set().union(*(assignments.editors_for(creator_id) for creator_id in creator_index.keys(creator_name)))
+            names = editor_index.search(current, keys=editor_ids)
+        choices = [discord.app_commands.Choice(name=name, value=name) for name in names]
+        return choices
 
 
     async def find_creator_given_editor(self, interaction: discord.Interaction, current: str):
@@ -126,24 +109,14 @@ class StaffManagement(commands.Cog):
         # gotta access the namespace of the interaction to get the given creator name
         editor_name = interaction.namespace.editor_name
 
-        # if an editor name has not been passed in, return first 25 creators
+        # if an editor name has not been passed in, return the first 10 matching creators
         if not editor_name:
-            creators = await Creator.filter(is_active=True).limit(10)
-            choices = [
-                discord.app_commands.Choice(name=creator.name, value=creator.name)
-                for creator in creators
-            ]
-        # else, return first 25 creators that the editor is assigned to AND contains current string
+            names = creator_index.search(current)
+        # else, return the first 10 matching creators that the editor is assigned to
         else:
-            creators = await Creator.filter(
-                assigned_editors__discord_username=editor_name,
-                name__icontains=current,
-                is_active=True
-            ).limit(10)
-            choices = [
-                discord.app_commands.Choice(name=creator.name, value=creator.name)
-                for creator in creators
-            ]
+            creator_ids = set().union(*(assignments.creators_for(editor_id) for editor_id in editor_index.keys(editor_name)))
+            names = creator_index.search(current, keys=creator_ids)
+        choices = [discord.app_commands.Choice(name=name, value=name) for name in names]
         
         return choices
 
@@ -188,8 +161,7 @@ class StaffManagement(commands.Cog):
                 return
             
             # Check if assignment between editor and creator exists
-            is_assigned = await editor.assigned_creators.filter(name=creator_name).exists()
-            if not is_assigned:
+            if not assignments.is_assigned(editor.discord_id, creator.id):
                 await interaction.response.send_message(
                     f"❌ Editor '{editor_name}' is not assigned to creator '{creator_name}'!",
                     ephemeral=True
@@ -198,6 +170,7 @@ class StaffManagement(commands.Cog):
             
             # Unassign creator from editor
             await editor.assigned_creators.remove(creator)
+            assignments.unassign(editor.discord_id, creator.id)
             await interaction.response.send_message(
                 f"✅ **Editor:** {editor_name} has been unassigned from **Creator:** {creator_name}",
                 ephemeral=True
@@ -212,20 +185,18 @@ class StaffManagement(commands.Cog):
 
     async def editor_all_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for all editors"""
-        editors = await Editor.filter(discord_username__icontains=current).limit(5)
         choices = [
-            discord.app_commands.Choice(name=editor.discord_username, value=editor.discord_username)
-            for editor in editors
+            discord.app_commands.Choice(name=name, value=name)
+            for name in editor_index.search(current, limit=5, active_only=False)
         ]
         return choices
 
 
     async def creator_all_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for all creators"""
-        creators = await Creator.filter(name__icontains=current).limit(5)
         choices = [
-            discord.app_commands.Choice(name=creator.name, value=creator.name)
-            for creator in creators
+            discord.app_commands.Choice(name=name, value=name)
+            for name in creator_index.search(current, limit=5, active_only=False)
         ]
         return choices
     
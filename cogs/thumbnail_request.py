@@ -1,307 +1,544 @@
 import discord
+from datetime import timedelta
 from discord.ext import commands
-from database.models import GuildConfig, ThumbnailCategory, Editor, Creator, Overseer, ThumbnailDesigner, Thumbnail
-from dataclasses import dataclass
+from database.models import ThumbnailCategory, Editor, Creator, Overseer, ThumbnailDesigner, RequestStatus
+# the model shares its name with the cog below
+from database.models import ThumbnailRequest as ThumbnailRequestRecord
+from database.cache import guild_configs, creator_index, category_index, assignments, interaction_keys
+from database.stats import record_thumbnail
+from utils.side_effects import side_effects, Priority, schedule_edit, log_failure
+from utils.youtube import parse_video_id
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+def category_label(thumbnail_request: ThumbnailRequestRecord):
+    return thumbnail_request.category.name if thumbnail_request.category else None
+
+
+def request_message_content(thumbnail_request: ThumbnailRequestRecord):
+    """Content of the message with the claim button, rebuilt from the saved request"""
+    return (
+        f"New thumbnail request for **{thumbnail_request.creator.name}**\n"
+        f"Category: {category_label(thumbnail_request)}\n"
+        f"Video URL: {thumbnail_request.video_url}\n"
+    )
 
-def is_valid_youtube_url(url: str):
-    """Check if the provided URL is a valid YouTube URL"""
-    return "youtube.com" in url or "youtu.be" in url
 
+# action -> (label, style, emoji) of its button
+REQUEST_BUTTONS = {
+    "claim": ("Claim", discord.ButtonStyle.green, "✋"),
+    "unclaim": ("Unclaim", discord.ButtonStyle.red, "✋"),
+    "approve": ("Approve Thumbnail", discord.ButtonStyle.success, "✅"),
+    "confirm": ("Yes", discord.ButtonStyle.success, "✅"),
+    "cancel": ("No", discord.ButtonStyle.danger, "❌")
+}
+
+# actions that change a request, duplicate clicks and deliveries of these are dropped
+STATE_CHANGING_ACTIONS = {"claim", "unclaim", "confirm"}
+# interaction tokens expire after 15 minutes, a redelivered interaction can't come later
+INTERACTION_KEY_TTL = timedelta(minutes=15)
+# a request is held while one of its actions runs, this frees it if the bot stops mid-action
+REQUEST_KEY_TTL = timedelta(minutes=2)
+
+
+class RequestButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    # custom ids look like "thumbnail:claim:42", far below discord's 100 character limit
+    template=rf"thumbnail:(?P<action>{'|'.join(REQUEST_BUTTONS)}):(?P<id>[0-9]+)"
+):
+    """A thumbnail request button, its custom id only carries the action and the request id
+
+    The class is registered once with bot.add_dynamic_items and the request
+    is loaded from the database on click, so nothing is kept in memory per
+    open request and the buttons keep working after a restart.
+    """
+
+    def __init__(self, action: str, request_id: int):
+        label, style, emoji = REQUEST_BUTTONS[action]
+        super().__init__(discord.ui.Button(
+            label=label,
+            style=style,
+            emoji=emoji,
+            custom_id=f"thumbnail:{action}:{request_id}"
+        ))
+        self.action = action
+        self.request_id = request_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["action"], int(match["id"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        handler = REQUEST_ACTIONS[self.action]
+        if self.action not in STATE_CHANGING_ACTIONS:
+            await handler(interaction, self.request_id)
+            return
+
+        # the interaction id catches the same interaction delivered twice, the
+        # request key catches double clicks while the first click is handled
+        request_key = f"thumbnail:{self.request_id}"
+        keys = {
+            f"interaction:{interaction.id}": INTERACTION_KEY_TTL,
+            request_key: REQUEST_KEY_TTL
+        }
+        # duplicates seen by this process are turned away from memory, before anything is awaited
+        if not interaction_keys.reserve(keys):
+            try:
+                await interaction.response.send_message(
+                    "⏳ This thumbnail request is already being updated!",
+                    ephemeral=True
+                )
+            except discord.HTTPException:
+                # a redelivered interaction was already answered by the first delivery
+                pass
+            return
 
-@dataclass
-class ThumbnailRequestData:
-    creator_id: int
-    creator_name: str
-    video_url: str
-    category_id: int
-    category_name: str
-    original_message_id: int = None
-    original_message_channel_id: int = None
-    designer_id: int = None
+        # acknowledge before the database check, discord only waits 3 seconds for it
+        try:
+            await interaction.response.defer()
+        except discord.HTTPException:
+            # answered by an earlier delivery of this interaction
+            interaction_keys.unreserve(*keys)
+            return
+        if not await interaction_keys.persist(keys):
+            await interaction.followup.send(
+                "⏳ This thumbnail request is already being updated!",
+                ephemeral=True
+            )
+            return
+
+        try:
+            await handler(interaction, self.request_id)
+        finally:
+            await interaction_keys.release(request_key)
 
 
 # Big Note: ComponentsV2 cannot be sent with message content / embeds
 class ThumbnailClaimView(discord.ui.View):
-    def __init__(self, thumbnail_request_data: ThumbnailRequestData):
+    def __init__(self, request_id: int):
         super().__init__(timeout=None)
-        self.thumbnail_request_data = thumbnail_request_data
+        self.add_item(RequestButton("claim", request_id))
+
 
-        self.claim_button = discord.ui.Button(
-            label="Claim",
-            style=discord.ButtonStyle.green,
-            emoji="✋",
-            custom_id=f"claim_button_{self.thumbnail_request_data.video_url}"
+class PrivateChannelView(discord.ui.View):
+    def __init__(self, request_id: int):
+        super().__init__(timeout=None)
+        self.add_item(RequestButton("unclaim", request_id))
+        self.add_item(RequestButton("approve", request_id))
+
+
+def disabled_view(label: str, emoji: str):
+    """A view with a single greyed out button, for requests that can't be claimed"""
+    view = discord.ui.View(timeout=None)
+    view.add_item(discord.ui.Button(
+        label=label,
+        style=discord.ButtonStyle.gray,
+        emoji=emoji,
+        disabled=True
+    ))
+    return view
+
+
+async def get_thumbnail_request(interaction: discord.Interaction, request_id: int):
+    """Load a request with its creator and category, telling the user if it no longer exists"""
+    thumbnail_request = await ThumbnailRequestRecord.filter(
+        id=request_id
+    ).select_related("creator", "category").first()
+    if not thumbnail_request:
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(
+            "❌ This thumbnail request no longer exists!",
+            ephemeral=True
         )
-        self.claim_button.callback = self.claim_callback
-        
-        self.add_item(self.claim_button)
+    return thumbnail_request
+
+
+async def create_workspace(interaction: discord.Interaction, guild_config, overseer_role: discord.Role):
+    """Create the claimant's workspace, a private thread in thread workspace mode or a private channel"""
+    name = f"thumbnail-{interaction.user.name.lower().replace(' ', '-')}"
+    if guild_config.thread_workspaces:
+        parent = interaction.guild.get_channel(guild_config.workspace_parent_channel_id or 0)
+        if not parent:
+            raise ValueError("thread workspaces are enabled but no parent channel is configured")
+        thread = await side_effects.schedule(
+            f"channel:{parent.id}",
+            lambda: parent.create_thread(name=name, type=discord.ChannelType.private_thread, invitable=False),
+            Priority.WORKFLOW
+        )
+        # private threads are only visible to their members (overseers are added by the role mention)
+        await side_effects.schedule(f"channel:{thread.id}", lambda: thread.add_user(interaction.user), Priority.WORKFLOW)
+        return thread
+
+    overwrites = {
+        # everyone
+        interaction.guild.default_role: discord.PermissionOverwrite(view_channel=False),
+        # claimant
+        interaction.user: discord.PermissionOverwrite(view_channel=True, send_messages=True),
+        # all overseers (for now)
+        overseer_role: discord.PermissionOverwrite(view_channel=True, send_messages=True),
+        # bot itself
+        interaction.guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True)
+    }
+    return await side_effects.schedule(
+        f"guild:{interaction.guild.id}",
+        lambda: interaction.guild.create_text_channel(name=name, overwrites=overwrites),
+        Priority.WORKFLOW
+    )
 
-    async def claim_callback(self, interaction: discord.Interaction):
-        try:
-            await interaction.response.defer(ephemeral=True)
-            self.claim_button.disabled = True
-            self.claim_button.label = f"Claimed by {interaction.user.name}"
-            self.claim_button.style = discord.ButtonStyle.gray
-            content = interaction.message.content
-            await interaction.message.edit(content=content, view=self)
-
-            # create private channel (thumbnail + username of claimant)
-            channel_name = f"thumbnail-{interaction.user.name.lower().replace(' ', '-')}"
-            guild_config = await GuildConfig.filter(guild_id=interaction.guild.id).first()
-            overseer_role = interaction.guild.get_role(guild_config.overseer_role_id)
-            overwrites = {
-                # everyone
-                interaction.guild.default_role: discord.PermissionOverwrite(view_channel=False),
-                # claimant
-                interaction.user: discord.PermissionOverwrite(view_channel=True, send_messages=True),
-                # all overseers (for now)
-                overseer_role: discord.PermissionOverwrite(view_channel=True, send_messages=True),
-                # bot itself
-                interaction.guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True)
-            }
-            private_channel = await interaction.guild.create_text_channel(
-                name=channel_name,
-                overwrites=overwrites
-            )
 
-            # create private channel view (submit and unclaim buttons)
-            self.thumbnail_request_data.designer_id = interaction.user.id
-            self.thumbnail_request_data.original_message_id = interaction.message.id
-            self.thumbnail_request_data.original_message_channel_id = interaction.message.channel.id
-            view = PrivateChannelView(thumbnail_request_data=self.thumbnail_request_data)
-            private_channel_msg = await private_channel.send(
-                f"**{interaction.user.name}** has offered to help out with a thumbnail request\n"
-                f"Creator: {self.thumbnail_request_data.creator_name}\n"
-                f"Category: {self.thumbnail_request_data.category_name}\n"
-                f"Video URL: {self.thumbnail_request_data.video_url}",
-                view=view
-            )
+def remove_workspace_buttons(workspace, private_message_id: int):
+    """Take the unclaim and approve buttons off the workspace message once the claim is over"""
+    if private_message_id:
+        schedule_edit(workspace.get_partial_message(private_message_id), Priority.WORKFLOW, view=None)
 
-            # pin the message
-            await private_channel_msg.pin()
 
-            # confirmation message
-            await interaction.followup.send(
-                f"You have claimed the thumbnail request for **{self.thumbnail_request_data.creator_name}**",
-                ephemeral=True
-            )
-        except Exception as e:
+def close_workspace(workspace, private_message_id: int):
+    """Archive a finished thread workspace, or delete a private channel"""
+    if isinstance(workspace, discord.Thread):
+        # archived threads stay readable, their buttons would still send clicks
+        remove_workspace_buttons(workspace, private_message_id)
+        close = lambda: workspace.edit(archived=True, locked=True)
+        description = "archiving the workspace thread"
+    else:
+        close = workspace.delete
+        description = "deleting the private channel"
+    log_failure(side_effects.schedule(f"channel:{workspace.id}", close, Priority.WORKFLOW), description)
+
+
+async def claim_request(interaction: discord.Interaction, request_id: int):
+    # the button callback has already acknowledged the interaction
+
+    # the claimant's designer record is stored with the claim so approving
+    # the request later does not have to look it up
+    designer = await ThumbnailDesigner.filter(discord_id=interaction.user.id, is_active=True).first()
+
+    # claim in the database first, only one of several simultaneous clicks can
+    # move the request from open to claimed
+    claimed = await ThumbnailRequestRecord.filter(id=request_id, status=RequestStatus.OPEN).update(
+        status=RequestStatus.CLAIMED,
+        claimant_id=interaction.user.id,
+        designer_id=designer.id if designer else None,
+        claimed_at=timezone.now(),
+        updated_at=timezone.now()
+    )
+    if not claimed:
+        await interaction.followup.send(
+            "❌ This thumbnail request has already been claimed!",
+            ephemeral=True
+        )
+        return
+
+    try:
+        thumbnail_request = await get_thumbnail_request(interaction, request_id)
+        if not thumbnail_request:
+            return
+        schedule_edit(
+            interaction.message,
+            content=interaction.message.content,
+            view=disabled_view(f"Claimed by {interaction.user.name}", "✋")
+        )
+
+        # create private workspace (thumbnail + username of claimant)
+        guild_config = await guild_configs.get(interaction.guild.id)
+        overseer_role = interaction.guild.get_role(guild_config.overseer_role_id)
+        private_channel = await create_workspace(interaction, guild_config, overseer_role)
+
+        # create private channel view (submit and unclaim buttons)
+        content = (
+            f"**{interaction.user.name}** has offered to help out with a thumbnail request\n"
+            f"Creator: {thumbnail_request.creator.name}\n"
+            f"Category: {category_label(thumbnail_request)}\n"
+            f"Video URL: {thumbnail_request.video_url}"
+        )
+        if isinstance(private_channel, discord.Thread) and overseer_role:
+            # mentioning the role adds the overseers to the private thread
+            content += f"\n{overseer_role.mention}"
+        view = PrivateChannelView(request_id)
+        private_channel_msg = await side_effects.schedule(
+            f"channel:{private_channel.id}",
+            lambda: private_channel.send(
+                content,
+                view=view,
+                allowed_mentions=discord.AllowedMentions(roles=True)
+            ),
+            Priority.WORKFLOW
+        )
+
+        # pin the message
+        log_failure(
+            side_effects.schedule(f"channel:{private_channel.id}", private_channel_msg.pin),
+            "pinning the thumbnail request message"
+        )
+
+        # remember where the claim is being worked on
+        thumbnail_request.private_channel_id = private_channel.id
+        thumbnail_request.private_message_id = private_channel_msg.id
+        await thumbnail_request.save(update_fields=["private_channel_id", "private_message_id", "updated_at"])
+
+        # confirmation message
+        await interaction.followup.send(
+            f"You have claimed the thumbnail request for **{thumbnail_request.creator.name}**",
+            ephemeral=True
+        )
+    except Exception as e:
+        # give the request back so someone else can claim it
+        released = await ThumbnailRequestRecord.filter(
+            id=request_id,
+            status=RequestStatus.CLAIMED,
+            claimant_id=interaction.user.id
+        ).update(
+            status=RequestStatus.OPEN,
+            claimant_id=None,
+            designer_id=None,
+            claimed_at=None,
+            updated_at=timezone.now()
+        )
+        if released:
+            schedule_edit(interaction.message, content=interaction.message.content, view=ThumbnailClaimView(request_id))
+        await interaction.followup.send(
+            f"❌ Error claiming thumbnail request: {str(e)}",
+            ephemeral=True
+        )
+
+
+async def unclaim_request(interaction: discord.Interaction, request_id: int):
+    try:
+        # the request is open again, unless it was already unclaimed or approved, or
+        # this is the workspace of an earlier claim
+        reopened = await ThumbnailRequestRecord.filter(
+            id=request_id,
+            status=RequestStatus.CLAIMED,
+            private_channel_id=interaction.channel.id
+        ).update(
+            status=RequestStatus.OPEN,
+            claimant_id=None,
+            designer_id=None,
+            claimed_at=None,
+            private_channel_id=None,
+            private_message_id=None,
+            updated_at=timezone.now()
+        )
+        if not reopened:
             await interaction.followup.send(
-                f"❌ Error claiming thumbnail request: {str(e)}",
+                "❌ This thumbnail request is not claimed anymore!",
                 ephemeral=True
             )
+            return
+        thumbnail_request = await get_thumbnail_request(interaction, request_id)
+        if not thumbnail_request:
+            return
+
+        # re-enable the claim button on the original message with a single edit,
+        # no fetch needed since the message id and content come from the saved request
+        original_channel = interaction.guild.get_channel(thumbnail_request.message_channel_id)
+        schedule_edit(
+            original_channel.get_partial_message(thumbnail_request.message_id),
+            Priority.WORKFLOW,
+            content=request_message_content(thumbnail_request),
+            view=ThumbnailClaimView(request_id)
+        )
 
+        # archive the private thread, or delete the private channel, the unclaim
+        # button is on the workspace message itself
+        close_workspace(interaction.channel, interaction.message.id)
+    except Exception as e:
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(
+            f"❌ Error unclaiming request: {str(e)}",
+            ephemeral=True
+        )
 
-class PrivateChannelView(discord.ui.View): 
-    def __init__(self, thumbnail_request_data: ThumbnailRequestData):
-        super().__init__(timeout=None)
-        self.thumbnail_request_data = thumbnail_request_data
 
-        self.unclaim_button = discord.ui.Button(
-            label="Unclaim",
-            style=discord.ButtonStyle.red,
-            emoji="✋",
-            custom_id=f"unclaim_button_{self.thumbnail_request_data.video_url}"
+async def approve_request(interaction: discord.Interaction, request_id: int):
+    try:
+        # check if user is an overseer or administrator
+        if not interaction.user.guild_permissions.administrator:
+            if not await Overseer.filter(discord_id=interaction.user.id, is_active=True).exists():
+                await interaction.response.send_message(
+                    "❌ You are not authorized to approve thumbnails!",
+                    ephemeral=True
+                )
+                return
+        
+        # ask if the clicker wants to record the thumbnail in the database
+        view = discord.ui.LayoutView(timeout=None)
+        view.add_item(discord.ui.TextDisplay(
+            "Would you like to record this thumbnail in the database?"
+        ))
+        view.add_item(discord.ui.ActionRow(
+            RequestButton("confirm", request_id),
+            RequestButton("cancel", request_id)
+        ))
+        await interaction.response.send_message(view=view, ephemeral=True)
+    except Exception as e:
+        await interaction.response.send_message(
+            f"❌ Error approving thumbnail: {str(e)}",
+            ephemeral=True
         )
-        self.unclaim_button.callback = self.unclaim_callback
 
-        self.add_item(self.unclaim_button)
 
-        self.approve_button = discord.ui.Button(
-            label="Approve Thumbnail",
-            style=discord.ButtonStyle.success,
-            emoji="✅",
-            custom_id=f"approve_button_{self.thumbnail_request_data.video_url}"
+async def cancel_approval(interaction: discord.Interaction, request_id: int):
+    try:
+        await interaction.response.send_message(
+            "✅ Approval cancelled!",
+            ephemeral=True
         )
-        self.approve_button.callback = self.approve_callback
 
-        self.add_item(self.approve_button)
-        
-    async def unclaim_callback(self, interaction: discord.Interaction):
-        try:
-            # delete original claim view
-            message_id = self.thumbnail_request_data.original_message_id
-            channel_id = self.thumbnail_request_data.original_message_channel_id
-            original_channel = interaction.guild.get_channel(channel_id)
-            original_message = await original_channel.fetch_message(message_id)
-            await original_message.delete()
-
-            # create brand new claim view
-            view = ThumbnailClaimView(thumbnail_request_data=self.thumbnail_request_data)
-            await original_channel.send(content=original_message.content, view=view)
-
-            # delete private channel
-            private_channel = interaction.channel
-            await private_channel.delete()
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Error unclaiming request: {str(e)}",
-                ephemeral=True
-            )
+    except Exception as e:
+        await interaction.response.send_message(
+            f"❌ Error cancelling approval: {str(e)}",
+            ephemeral=True
+        )
 
-    async def approve_callback(self, interaction: discord.Interaction):
-        try:
-            # check if user is an overseer or administrator
-            if not interaction.user.guild_permissions.administrator:
-                guild_config = await GuildConfig.filter(guild_id=interaction.guild.id).first()
-                overseer = await Overseer.filter(discord_id=interaction.user.id, is_active=True).first()
-                if not overseer:
-                    await interaction.response.send_message(
-                        "❌ You are not authorized to approve thumbnails!",
-                        ephemeral=True
-                    )
-                    return
-            
-            # ask if the clicker wants to record the thumbnail in the database
-            view = discord.ui.LayoutView(timeout=None)
-            view.add_item(discord.ui.TextDisplay(
-                "Would you like to record this thumbnail in the database?"
-            ))
-            confirm_button = discord.ui.Button(
-                label="Yes",
-                style=discord.ButtonStyle.success,
-                emoji="✅",
-                custom_id=f"confirm_button_{self.thumbnail_request_data.video_url}"
-            )
-            confirm_button.callback = self.confirm_callback
-            cancel_button = discord.ui.Button(
-                label="No",
-                style=discord.ButtonStyle.danger,
-                emoji="❌",
-                custom_id=f"cancel_button_{self.thumbnail_request_data.video_url}"
-            )
-            cancel_button.callback = self.cancel_callback
-            view.add_item(discord.ui.ActionRow(
-                confirm_button,
-                cancel_button
-            ))
-            await interaction.response.send_message(view=view, ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Error approving thumbnail: {str(e)}",
-                ephemeral=True
-            )
 
-    async def cancel_callback(self, interaction: discord.Interaction):
-        try:
-            await interaction.response.send_message(
-                "✅ Approval cancelled!",
+async def confirm_approval(interaction: discord.Interaction, request_id: int):
+    try:
+        # a single query loads the request with everything that needs validating
+        thumbnail_request = await ThumbnailRequestRecord.filter(
+            id=request_id
+        ).select_related("creator", "category", "designer").first()
+        if not thumbnail_request:
+            await interaction.followup.send(
+                "❌ This thumbnail request no longer exists!",
                 ephemeral=True
             )
+            return
 
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Error cancelling approval: {str(e)}",
+        if thumbnail_request.status != RequestStatus.CLAIMED or thumbnail_request.private_channel_id != interaction.channel.id:
+            await interaction.followup.send(
+                "❌ This thumbnail request is not claimed anymore!",
                 ephemeral=True
             )
+            return
 
-    async def confirm_callback(self, interaction: discord.Interaction):
-        try:
-            # get the designer object
+        designer = thumbnail_request.designer
+        if designer is None and thumbnail_request.claimant_id:
+            # claimed before the claimant had a designer record, e.g. while their
+            # role event was still queued, look it up now instead
             designer = await ThumbnailDesigner.filter(
-                discord_id=self.thumbnail_request_data.designer_id,
+                discord_id=thumbnail_request.claimant_id,
                 is_active=True
             ).first()
-            if not designer:
-                await interaction.response.send_message(
-                    "❌ Designer not found!",
-                    ephemeral=True
-                )
-                return
-            
-            # get the creator object
-            creator = await Creator.filter(
-                id=self.thumbnail_request_data.creator_id,
-                is_active=True
-            ).first()
-            if not creator:
-                await interaction.response.send_message(
-                    "❌ Creator not found!",
-                    ephemeral=True
-                )
-                return
-
-            # get the category object
-            category = await ThumbnailCategory.filter(
-                id=self.thumbnail_request_data.category_id,
-                is_active=True
-            ).first()
-            if not category:
-                await interaction.response.send_message(
-                    "❌ Category not found!",
-                    ephemeral=True
-                )
-                return
-                        
-            # create a thumbnail record in the database
-            thumbnail_record = await Thumbnail.create(
-                designer=designer,
-                creator=creator,
-                category=category,
-                youtube_url=self.thumbnail_request_data.video_url
+        if not designer or not designer.is_active:
+            await interaction.followup.send(
+                "❌ Designer not found!",
+                ephemeral=True
             )
+            return
 
-            # mark original claim view as completed
-            completed_view = discord.ui.View(timeout=None)
-            completed_button = discord.ui.Button(
-                label="Completed",
-                style=discord.ButtonStyle.gray,
-                emoji="✅",
-                disabled=True
+        creator = thumbnail_request.creator
+        if not creator.is_active:
+            await interaction.followup.send(
+                "❌ Creator not found!",
+                ephemeral=True
             )
-            completed_view.add_item(completed_button)
-            original_channel = interaction.guild.get_channel(self.thumbnail_request_data.original_message_channel_id)
-            original_message = await original_channel.fetch_message(self.thumbnail_request_data.original_message_id)
-            await original_message.edit(content=original_message.content, view=completed_view)
-            
-            # confirmation message
-            view = discord.ui.LayoutView()
-            view.add_item(discord.ui.TextDisplay(
-                f"✅ Thumbnail recorded in the database!\n"
-                f"Creator: {creator.name}\n"
-                f"Category: {category.name}\n"
-                f"Designer: {designer.discord_username}\n"
-                f"Video URL: {self.thumbnail_request_data.video_url}"
-            ))
-            await interaction.response.send_message(view=view, ephemeral=True)
+            return
 
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Error approving thumbnail: {str(e)}",
+        category = thumbnail_request.category
+        if not category or not category.is_active:
+            await interaction.followup.send(
+                "❌ Category not found!",
+                ephemeral=True
+            )
+            return
+
+        # complete the request and record the thumbnail (with its monthly stats) in
+        # one transaction, the conditional update keeps a second approval from
+        # recording the thumbnail twice
+        async with in_transaction() as connection:
+            completed = await ThumbnailRequestRecord.filter(
+                id=request_id,
+                status=RequestStatus.CLAIMED,
+                private_channel_id=interaction.channel.id
+            ).using_db(connection).update(
+                status=RequestStatus.COMPLETED,
+                completed_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+            if completed:
+                await record_thumbnail(
+                    designer=designer,
+                    creator=creator,
+                    category=category,
+                    youtube_url=thumbnail_request.video_url,
+                    connection=connection
+                )
+        if not completed:
+            await interaction.followup.send(
+                "❌ This thumbnail request is not claimed anymore!",
                 ephemeral=True
             )
+            return
+
+        # mark original claim view as completed, the content is rebuilt from the
+        # saved request so the message doesn't have to be fetched first
+        original_channel = interaction.guild.get_channel(thumbnail_request.message_channel_id)
+        schedule_edit(
+            original_channel.get_partial_message(thumbnail_request.message_id),
+            Priority.WORKFLOW,
+            content=request_message_content(thumbnail_request),
+            view=disabled_view("Completed", "✅")
+        )
+
+        # finished thread workspaces are archived, private channels are kept as before
+        if isinstance(interaction.channel, discord.Thread):
+            close_workspace(interaction.channel, thumbnail_request.private_message_id)
+        else:
+            remove_workspace_buttons(interaction.channel, thumbnail_request.private_message_id)
+        
+        # confirmation message
+        view = discord.ui.LayoutView()
+        view.add_item(discord.ui.TextDisplay(
+            f"✅ Thumbnail recorded in the database!\n"
+            f"Creator: {creator.name}\n"
+            f"Category: {category.name}\n"
+            f"Designer: {designer.discord_username}\n"
+            f"Video URL: {thumbnail_request.video_url}"
+        ))
+        await interaction.followup.send(view=view, ephemeral=True)
+
+    except Exception as e:
+        await interaction.followup.send(
+            f"❌ Error approving thumbnail: {str(e)}",
+            ephemeral=True
+        )
+
+
+# button action -> handler
+REQUEST_ACTIONS = {
+    "claim": claim_request,
+    "unclaim": unclaim_request,
+    "approve": approve_request,
+    "confirm": confirm_approval,
+    "cancel": cancel_approval
+}
 
 
 async def creator_autocomplete(interaction: discord.Interaction, current: str):
     """Autocomplete for creators (Assumes the user is an administrator or editor)"""
     if interaction.user.guild_permissions.administrator:
-        creators = await Creator.filter(
-            name__icontains=current,
-            is_active=True
-        ).limit(10)
-        return [discord.app_commands.Choice(name=creator.name, value=creator.name) for creator in creators]
+        names = creator_index.search(current)
     else:
-        creators = await Creator.filter(
-            name__icontains=current,
-            is_active=True,
-            assigned_editors__discord_id=interaction.user.id
-        ).limit(10)
-        return [discord.app_commands.Choice(name=creator.name, value=creator.name) for creator in creators]
+        names = creator_index.search(current, keys=assignments.creators_for(interaction.user.id))
+    return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def category_autocomplete(interaction: discord.Interaction, current: str):
     """Autocomplete for categories"""
-    categories = await ThumbnailCategory.filter(
-        name__icontains=current,
-        is_active=True
-    ).limit(10)
-    return [discord.app_commands.Choice(name=category.name, value=category.name) for category in categories]
+    return [discord.app_commands.Choice(name=name, value=name) for name in category_index.search(current)]
 
 
 
 class ThumbnailRequest(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+
+    async def cog_load(self):
+        # one handler for every request's buttons, matched by custom id
+        self.bot.add_dynamic_items(RequestButton)
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(RequestButton)
     
     thumbnail = discord.app_commands.Group(name="thumbnail", description="Thumbnail request commands")
 
@@ -323,10 +560,22 @@ class ThumbnailRequest(commands.Cog):
     ):
         """Send a thumbnail request"""
         try:
+            # every url of the same video parses to the same canonical video id
+            video_id = parse_video_id(video_url)
+            if not video_id:
+                await interaction.response.send_message(
+                    "❌ That is not a YouTube video URL!",
+                    ephemeral=True
+                )
+                return
+
+            # acknowledge before the lookups and the channel send, discord only waits 3 seconds for it
+            await interaction.response.defer(ephemeral=True)
+
             # Check if all required roles are configured
-            guild_config = await GuildConfig.filter(guild_id=interaction.guild.id).first()
+            guild_config = await guild_configs.get(interaction.guild.id)
             if not guild_config:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Role configuration not found\n"
                     "Make sure to set the editor, designer, and overseer roles first",
                     ephemeral=True
@@ -343,17 +592,18 @@ class ThumbnailRequest(commands.Cog):
             
             if missing_roles:
                 roles_text = ", ".join(missing_roles)
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ The following roles are not configured: **{roles_text}**",
                     ephemeral=True
                 )
                 return
             
             # if all roles are configured, check if single thumbnail channel is enabled
+            category_obj = None
             if guild_config.single_thumbnail_channel:
                 # if single channel is enabled but no channel is configured, return an error
                 if not guild_config.single_thumbnail_channel_id:
-                    await interaction.response.send_message(
+                    await interaction.followup.send(
                         "❌ Single thumbnail channel mode is enabled but no channel is configured! Please use `/set-single-thumbnail-channel` to set a channel first",
                         ephemeral=True
                     )
@@ -361,9 +611,9 @@ class ThumbnailRequest(commands.Cog):
                 
                 # if a category is optionally provided, check if the category exists
                 if category:
-                    category_obj = await ThumbnailCategory.filter(category_name=category, is_active=True).first()
+                    category_obj = await ThumbnailCategory.filter(name=category, is_active=True).first()
                     if not category_obj:
-                        await interaction.response.send_message(
+                        await interaction.followup.send(
                             f"❌ Category **{category}** does not exist!",
                             ephemeral=True
                         )
@@ -376,7 +626,7 @@ class ThumbnailRequest(commands.Cog):
             else:
                 # check if a category is provided
                 if not category:
-                    await interaction.response.send_message(
+                    await interaction.followup.send(
                         "❌ Category is required when single thumbnail channel mode is not enabled",
                         ephemeral=True
                     )
@@ -385,7 +635,7 @@ class ThumbnailRequest(commands.Cog):
                 # check if the category exists
                 category_obj = await ThumbnailCategory.filter(name=category, is_active=True).first()
                 if not category_obj:
-                    await interaction.response.send_message(
+                    await interaction.followup.send(
                         f"❌ Category **{category}** does not exist!",
                         ephemeral=True
                     )
@@ -393,7 +643,7 @@ class ThumbnailRequest(commands.Cog):
 
                 # if the category doesn't have a corresponding channel configured, return an error
                 if not category_obj.channel_id:
-                    await interaction.response.send_message(
+                    await interaction.followup.send(
                         f"❌ Category **{category}** does not have a corresponding channel configured!",
                         ephemeral=True
                     )
@@ -405,7 +655,7 @@ class ThumbnailRequest(commands.Cog):
             # check if the creator exists
             creator_obj = await Creator.filter(name=creator, is_active=True).first()
             if not creator_obj:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Creator **{creator}** does not exist!",
                     ephemeral=True
                 )
@@ -415,44 +665,81 @@ class ThumbnailRequest(commands.Cog):
             if not interaction.user.guild_permissions.administrator:
                 # check if invoked by an editor
                 if not guild_config.editor_role_id in [role.id for role in interaction.user.roles]:
-                    await interaction.response.send_message(
+                    await interaction.followup.send(
                         "❌ You are not authorized to use this command! (Editors and Administrators only)",
                         ephemeral=True
                     )
                     return
                 # check if the editor is one of the assigned editors to the creator
-                if not creator_obj.assigned_editors.filter(discord_id=interaction.user.id).exists():
-                    await interaction.response.send_message(
+                if not assignments.is_assigned(interaction.user.id, creator_obj.id):
+                    await interaction.followup.send(
                         "❌ You are not assigned to the selected creator!",
                         ephemeral=True
                     )
                     return
 
-            # get the destination channel
-            destination_channel = interaction.guild.get_channel(destination_channel_id)
-            thumbnail_request_data = ThumbnailRequestData(
-                creator_id=creator_obj.id,
-                creator_name=creator,
-                video_url=video_url,
-                category_name=category,
-                category_id=category_obj.id
-            )
-            view = ThumbnailClaimView(thumbnail_request_data=thumbnail_request_data)
-            await destination_channel.send(
-                f"New thumbnail request for **{creator}**\n"
-                f"Category: {category}\n"
-                f"Video URL: {video_url}\n",
-                view=view
-            )
+            # only one request per video can be open, the video key keeps two
+            # requests for the same video sent at once from both passing the check
+            video_key = f"video:{interaction.guild.id}:{video_id}"
+            if not await interaction_keys.acquire({video_key: REQUEST_KEY_TTL}):
+                await interaction.followup.send(
+                    "❌ A thumbnail request for this video is already being sent!",
+                    ephemeral=True
+                )
+                return
+            try:
+                existing = await ThumbnailRequestRecord.filter(
+                    guild_id=interaction.guild.id,
+                    video_id=video_id,
+                    status__in=[RequestStatus.OPEN, RequestStatus.CLAIMED]
+                ).first()
+                if existing:
+                    existing_channel = interaction.guild.get_channel(existing.message_channel_id or 0)
+                    location = (
+                        f": {existing_channel.get_partial_message(existing.message_id).jump_url}"
+                        if existing_channel and existing.message_id else ""
+                    )
+                    await interaction.followup.send(
+                        f"❌ This video already has a thumbnail request that is {existing.status.value}{location}",
+                        ephemeral=True
+                    )
+                    return
+
+                # get the destination channel
+                destination_channel = interaction.guild.get_channel(destination_channel_id)
+                # the request is saved first, its id goes into the button custom ids
+                thumbnail_request = await ThumbnailRequestRecord.create(
+                    guild_id=interaction.guild.id,
+                    creator=creator_obj,
+                    category=category_obj,
+                    video_url=video_url,
+                    video_id=video_id,
+                    message_channel_id=destination_channel.id
+                )
+                view = ThumbnailClaimView(thumbnail_request.id)
+                try:
+                    message = await side_effects.schedule(
+                        f"channel:{destination_channel.id}",
+                        lambda: destination_channel.send(request_message_content(thumbnail_request), view=view),
+                        Priority.WORKFLOW
+                    )
+                except Exception:
+                    await thumbnail_request.delete()
+                    raise
+                thumbnail_request.message_id = message.id
+                await thumbnail_request.save(update_fields=["message_id", "updated_at"])
+            finally:
+                await interaction_keys.release(video_key)
 
             # confirmation message
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Thumbnail request sent to {destination_channel.mention}",
                 ephemeral=True
             )
  
         except Exception as e:
-            await interaction.response.send_message(
+            send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+            await send(
                 f"❌ Error sending thumbnail request: {str(e)}",
                 ephemeral=True
             )
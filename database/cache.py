@@ -0,0 +1,363 @@
+"""
+In-memory caches for the Live Channel Bot
+
+Each bot process keeps its own copy and updates it on its own writes. Writes
+made by another process sharing the database show up once the copy is re-read,
+at most CACHE_TTL later.
+"""
+import asyncio
+import logging
+import time
+from bisect import bisect_left, insort
+from heapq import heapify, heappop
+from datetime import timedelta
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+from .models import GuildConfig, Creator, Editor, ThumbnailCategory, InteractionKey
+
+log = logging.getLogger(__name__)
+
+# cached rows older than this are read from the database again
+CACHE_TTL = timedelta(minutes=1)
+
+
+class GuildConfigCache:
+    """Per-guild GuildConfig rows, loaded at startup, updated on save and re-read after a time to live"""
+
+    def __init__(self, ttl: timedelta = CACHE_TTL):
+        self.ttl = ttl.total_seconds()
+        # guild_id -> (GuildConfig or None if the guild has no config yet, time.monotonic() it was read)
+        self._configs = {}
+
+    async def load(self):
+        """Load every guild config into memory"""
+        configs = await GuildConfig.all()
+        now = time.monotonic()
+        self._configs = {config.guild_id: (config, now) for config in configs}
+
+    async def get(self, guild_id: int):
+        """Get the config for a guild, or None if it hasn't been set up"""
+        cached = self._configs.get(guild_id)
+        if cached is None or time.monotonic() - cached[1] >= self.ttl:
+            # not cached yet, or possibly changed (or created) by another process since
+            guild_config = await GuildConfig.filter(guild_id=guild_id).first()
+            self._configs[guild_id] = (guild_config, time.monotonic())
+            return guild_config
+        return cached[0]
+
+    async def get_or_create(self, guild_id: int):
+        """Get the config for a guild, creating it if it doesn't exist"""
+        guild_config = await self.get(guild_id)
+        if guild_config:
+            return guild_config, False
+        guild_config, created = await GuildConfig.get_or_create(guild_id=guild_id)
+        self._configs[guild_id] = (guild_config, time.monotonic())
+        return guild_config, created
+
+    async def save(self, guild_config: GuildConfig):
+        """Save a config to the database and keep the cached copy in sync"""
+        try:
+            await guild_config.save()
+        except Exception:
+            # the cached object may hold unsaved changes, reload it on next access
+            self._configs.pop(guild_config.guild_id, None)
+            raise
+        self._configs[guild_config.guild_id] = (guild_config, time.monotonic())
+
+
+guild_configs = GuildConfigCache()
+
+
+class SearchIndex:
+    """Case-insensitive name index for autocomplete, ranking prefix matches first
+
+    Entries are keyed by id (database or discord id) with the display name as
+    the value, so records that share a name are all kept. Prefix matches come
+    from a bisect over the sorted names; names that only contain the text
+    further in come from an n-gram map, so a keystroke only looks at names
+    sharing the text's trigrams instead of scanning every entry.
+    """
+
+    # every substring of a name up to this length is indexed, longer
+    # text is looked up by its substrings of this length
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        # key -> name, and name -> keys with that exact name
+        self._names = {}
+        self._keys = {}
+        # keys that are currently active
+        self._active = set()
+        # sorted (lowercase name, name, key) entries, prefix matches are a contiguous run
+        self._sorted = []
+        # lowercase substring up to GRAM_SIZE characters -> keys whose name contains it
+        self._grams = {}
+
+    def load(self, entries):
+        """Replace the index contents with (name, key, is_active) entries"""
+        self._names.clear()
+        self._keys.clear()
+        self._active.clear()
+        self._sorted.clear()
+        self._grams.clear()
+        for name, key, is_active in entries:
+            self.add(name, key, is_active)
+
+    def add(self, name: str, key, is_active: bool = True):
+        """Add or update an entry, replacing its old name if it was renamed"""
+        old_name = self._names.get(key)
+        if old_name != name:
+            if old_name is not None:
+                self._unlink(old_name, key)
+            insort(self._sorted, (name.lower(), name, key))
+            self._names[key] = name
+            self._keys.setdefault(name, set()).add(key)
+            for gram in self._name_grams(name):
+                self._grams.setdefault(gram, set()).add(key)
+        if is_active:
+            self._active.add(key)
+        else:
+            self._active.discard(key)
+
+    def set_active(self, key, is_active: bool):
+        if key not in self._names:
+            return
+        if is_active:
+            self._active.add(key)
+        else:
+            self._active.discard(key)
+
+    def remove(self, key):
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        self._unlink(name, key)
+        self._active.discard(key)
+
+    def _unlink(self, name: str, key):
+        """Drop the sorted entry and the name -> key link of an entry"""
+        keys = self._keys.get(name, set())
+        keys.discard(key)
+        if not keys:
+            self._keys.pop(name, None)
+        entry = (name.lower(), name, key)
+        i = bisect_left(self._sorted, entry)
+        if i < len(self._sorted) and self._sorted[i] == entry:
+            del self._sorted[i]
+        for gram in self._name_grams(name):
+            gram_keys = self._grams.get(gram, set())
+            gram_keys.discard(key)
+            if not gram_keys:
+                self._grams.pop(gram, None)
+
+    def _name_grams(self, name: str):
+        """Every lowercase substring of a name up to GRAM_SIZE characters long"""
+        lower_name = name.lower()
+        return {
+            lower_name[i:i + size]
+            for size in range(1, self.GRAM_SIZE + 1)
+            for i in range(len(lower_name) - size + 1)
+        }
+
+    def _containing(self, current: str):
+        """Keys of the entries whose lowercase name may contain current (lowercase, not empty)"""
+        if len(current) <= self.GRAM_SIZE:
+            return self._grams.get(current, set())
+        # a name containing the text contains each of its trigrams, start from the rarest
+        gram_keys = sorted(
+            (self._grams.get(current[i:i + self.GRAM_SIZE], set()) for i in range(len(current) - self.GRAM_SIZE + 1)),
+            key=len
+        )
+        return gram_keys[0].intersection(*gram_keys[1:])
+
+    def keys(self, name: str):
+        """Get the keys of every entry with exactly this name"""
+        return self._keys.get(name, set())
+
+    def name(self, key):
+        """Get the name stored for a key, or None"""
+        return self._names.get(key)
+
+    def search(self, current: str, limit: int = 10, active_only: bool = True, keys=None):
+        """Names containing the current text, prefix matches first
+
+        If keys is given, only entries whose key is in it are returned. A name
+        shared by several entries is only returned once.
+        """
+        current = current.lower()
+
+        def wanted(name, key):
+            if name in seen:
+                return False
+            if active_only and key not in self._active:
+                return False
+            return keys is None or key in keys
+
+        results = []
+        seen = set()
+        # prefix matches, straight from the sorted list
+        i = bisect_left(self._sorted, (current,))
+        while i < len(self._sorted) and self._sorted[i][0].startswith(current):
+            lower_name, name, key = self._sorted[i]
+            if wanted(name, key):
+                results.append(name)
+                seen.add(name)
+                if len(results) >= limit:
+                    return results
+            i += 1
+
+        # then names that contain the text somewhere after the start, in name order
+        if current:
+            matches = []
+            for key in self._containing(current):
+                name = self._names[key]
+                lower_name = name.lower()
+                if current in lower_name and not lower_name.startswith(current):
+                    matches.append((lower_name, name, key))
+            heapify(matches)
+            while matches and len(results) < limit:
+                lower_name, name, key = heappop(matches)
+                if wanted(name, key):
+                    results.append(name)
+                    seen.add(name)
+        return results
+
+
+creator_index = SearchIndex()
+editor_index = SearchIndex()
+category_index = SearchIndex()
+
+
+class AssignmentGraph:
+    """Editor discord_id <-> creator id assignments, mirrored from the join table"""
+
+    def __init__(self):
+        self._creators_by_editor = {}
+        self._editors_by_creator = {}
+
+    async def load(self):
+        """Load every editor/creator assignment into memory"""
+        assignments = await Editor.filter(
+            assigned_creators__id__isnull=False
+        ).values_list("discord_id", "assigned_creators__id")
+        # replaced only once the rows are read, so lookups never see an empty graph
+        self._creators_by_editor.clear()
+        self._editors_by_creator.clear()
+        for editor_id, creator_id in assignments:
+            self.assign(editor_id, creator_id)
+
+    def assign(self, editor_id: int, creator_id: int):
+        self._creators_by_editor.setdefault(editor_id, set()).add(creator_id)
+        self._editors_by_creator.setdefault(creator_id, set()).add(editor_id)
+
+    def unassign(self, editor_id: int, creator_id: int):
+        self._creators_by_editor.get(editor_id, set()).discard(creator_id)
+        self._editors_by_creator.get(creator_id, set()).discard(editor_id)
+
+    def is_assigned(self, editor_id: int, creator_id: int):
+        return creator_id in self._creators_by_editor.get(editor_id, ())
+
+    def creators_for(self, editor_id: int):
+        """Creator ids assigned to an editor"""
+        return self._creators_by_editor.get(editor_id, set())
+
+    def editors_for(self, creator_id: int):
+        """Editor discord ids assigned to a creator"""
+        return self._editors_by_creator.get(creator_id, set())
+
+
+assignments = AssignmentGraph()
+
+
+class InteractionKeyCache:
+    """Idempotency keys with a time to live, kept in memory and in the interaction_keys table
+
+    A key taken in this process is rejected from memory without touching the
+    database, the table's unique constraint catches the duplicates memory
+    can't see (keys taken before a restart or by another process).
+    """
+
+    def __init__(self):
+        # key -> expiry
+        self._expiry = {}
+
+    def _prune(self, now):
+        for key in [key for key, expires_at in self._expiry.items() if expires_at <= now]:
+            del self._expiry[key]
+
+    def reserve(self, keys: dict[str, timedelta]):
+        """Take every key (key -> time to live) in this process only, False if any of them is already taken
+
+        Doesn't wait on anything, so duplicates can be turned away before the
+        interaction is acknowledged. persist() then takes the keys in the database.
+        """
+        now = timezone.now()
+        self._prune(now)
+        if any(key in self._expiry for key in keys):
+            return False
+        for key, ttl in keys.items():
+            self._expiry[key] = now + ttl
+        return True
+
+    def unreserve(self, *keys: str):
+        """Drop keys reserved in memory that were never persisted"""
+        for key in keys:
+            self._expiry.pop(key, None)
+
+    async def persist(self, keys: dict[str, timedelta]):
+        """Take reserved keys in the database, False if another process or an earlier run holds one"""
+        now = timezone.now()
+        try:
+            async with in_transaction() as connection:
+                # expired keys are free again, clear them out before inserting
+                await InteractionKey.filter(expires_at__lte=now).using_db(connection).delete()
+                await InteractionKey.bulk_create(
+                    [InteractionKey(key=key, expires_at=now + ttl) for key, ttl in keys.items()],
+                    using_db=connection
+                )
+        except Exception as e:
+            self.unreserve(*keys)
+            if isinstance(e, IntegrityError):
+                return False
+            raise
+        return True
+
+    async def acquire(self, keys: dict[str, timedelta]):
+        """Take every key (key -> time to live), False if any of them is already taken"""
+        # reserved in memory before awaiting, so a duplicate arriving meanwhile is rejected there
+        return self.reserve(keys) and await self.persist(keys)
+
+    async def release(self, *keys: str):
+        """Free keys early, once the work they guard is finished"""
+        self.unreserve(*keys)
+        await InteractionKey.filter(key__in=keys).delete()
+
+
+interaction_keys = InteractionKeyCache()
+
+
+async def load_search_indexes():
+    """Load the autocomplete indexes and the editor/creator assignment graph"""
+    creators = await Creator.all().values_list("name", "id", "is_active")
+    editors = await Editor.all().values_list("discord_username", "discord_id", "is_active")
+    categories = await ThumbnailCategory.all().values_list("name", "id", "is_active")
+    # swapped in together after every read, autocomplete never sees a half loaded index
+    creator_index.load(creators)
+    editor_index.load(editors)
+    category_index.load(categories)
+    await assignments.load()
+
+
+async def refresh_caches():
+    """Re-read the search indexes and assignments every CACHE_TTL, runs until cancelled
+
+    An index entry written by this process while the rows are being read can
+    be reverted by that read, the next refresh puts it back.
+    """
+    while True:
+        await asyncio.sleep(CACHE_TTL.total_seconds())
+        try:
+            await load_search_indexes()
+        except Exception:
+            log.exception("Error refreshing the search indexes, keeping the current ones")
@@ -1,6 +1,7 @@
 """
 Database models for the Live Channel Bot
 """
+from enum import Enum
 from tortoise import fields, models
 
 
@@ -18,6 +19,9 @@ class GuildConfig(models.Model, TimestampMixin):
     overseer_role_id = fields.BigIntField(null=True)
     single_thumbnail_channel = fields.BooleanField(default=False)
     single_thumbnail_channel_id = fields.BigIntField(null=True)
+    # claims get a private thread under this channel instead of a new text channel
+    thread_workspaces = fields.BooleanField(default=False)
+    workspace_parent_channel_id = fields.BigIntField(null=True)
     
     class Meta:
         table = "guild_configs"
@@ -30,6 +34,7 @@ class Creator(models.Model, TimestampMixin):
     
     class Meta:
         table = "creators"
+        indexes = (("name", "is_active"),)
 
 
 class Editor(models.Model, TimestampMixin):
@@ -42,6 +47,7 @@ class Editor(models.Model, TimestampMixin):
     
     class Meta:
         table = "editors"
+        indexes = (("discord_username", "is_active"),)
 
 
 class ThumbnailDesigner(models.Model, TimestampMixin):
@@ -80,6 +86,81 @@ class Thumbnail(models.Model, TimestampMixin):
     creator = fields.ForeignKeyField('models.Creator', related_name='thumbnail_records')
     category = fields.ForeignKeyField('models.ThumbnailCategory', related_name='thumbnail_records')
     youtube_url = fields.CharField(max_length=200)
+    # canonical id parsed from youtube_url, null if the url isn't a youtube video url
+    video_id = fields.CharField(max_length=11, null=True, index=True)
     
     class Meta:
-        table = "thumbnails"
\ No newline at end of file
+        table = "thumbnails"
+        # month exports range-scan created_at and order by it
+        indexes = (("created_at", "id"),)
+
+
+class ThumbnailMonthlyStat(models.Model, TimestampMixin):
+    """Completed thumbnail counts per month, designer, creator and category"""
+    # first day of the month
+    month = fields.DateField()
+    designer = fields.ForeignKeyField('models.ThumbnailDesigner', related_name='monthly_stats')
+    creator = fields.ForeignKeyField('models.Creator', related_name='monthly_stats')
+    category = fields.ForeignKeyField('models.ThumbnailCategory', related_name='monthly_stats')
+    count = fields.IntField(default=0)
+    
+    class Meta:
+        table = "thumbnail_monthly_stats"
+        unique_together = (("month", "designer", "creator", "category"),)
+
+
+class ExportCursor(models.Model, TimestampMixin):
+    """Last thumbnail record delivered by a guild's incremental export"""
+    guild_id = fields.BigIntField(unique=True)
+    # (created_at, id) of the last exported record, null before the first export
+    last_created_at = fields.DatetimeField(null=True)
+    last_thumbnail_id = fields.IntField(null=True)
+    
+    class Meta:
+        table = "export_cursors"
+
+
+
+class RequestStatus(str, Enum):
+    OPEN = "open"
+    CLAIMED = "claimed"
+    COMPLETED = "completed"
+
+
+class ThumbnailRequest(models.Model, TimestampMixin):
+    """Thumbnail requests, from being sent until the thumbnail is approved"""
+    guild_id = fields.BigIntField()
+    creator = fields.ForeignKeyField('models.Creator', related_name='thumbnail_requests')
+    # optional in single channel mode
+    category = fields.ForeignKeyField('models.ThumbnailCategory', related_name='thumbnail_requests', null=True)
+    video_url = fields.CharField(max_length=200)
+    # canonical id parsed from video_url, open requests for the same video are rejected
+    video_id = fields.CharField(max_length=11, null=True, index=True)
+    status = fields.CharEnumField(RequestStatus, default=RequestStatus.OPEN)
+    # discord id of the designer who claimed the request
+    claimant_id = fields.BigIntField(null=True)
+    # the claimant's designer record, resolved when the request is claimed
+    designer = fields.ForeignKeyField('models.ThumbnailDesigner', related_name='thumbnail_requests', null=True)
+    # the message with the claim button
+    message_id = fields.BigIntField(null=True)
+    message_channel_id = fields.BigIntField(null=True)
+    # the claimant's private channel and the message with the unclaim/approve buttons
+    private_channel_id = fields.BigIntField(null=True)
+    private_message_id = fields.BigIntField(null=True)
+    claimed_at = fields.DatetimeField(null=True)
+    completed_at = fields.DatetimeField(null=True)
+    
+    class Meta:
+        table = "thumbnail_requests"
+        # open and claimed requests are loaded on startup
+        indexes = (("status",),)
+
+
+class InteractionKey(models.Model):
+    """Keys of interactions being or already handled, so duplicate deliveries are dropped"""
+    key = fields.CharField(max_length=100, unique=True)
+    # expired keys can be taken again, and are cleaned up when new keys are taken
+    expires_at = fields.DatetimeField(index=True)
+
+    class Meta:
+        table = "interaction_keys"
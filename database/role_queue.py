@@ -0,0 +1,180 @@
+"""
+Write-behind queue for staff role events
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from .models import Editor
+from .cache import editor_index
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingRoleChange:
+    member_id: int
+    member_name: str
+    model_class: type
+    role_type: str
+    # state before the first queued event, and the latest requested state
+    was_active: bool
+    is_active: bool
+
+
+class RoleEventQueue:
+    """Coalesces staff role changes per (member, role type) and flushes them in one transaction"""
+
+    def __init__(self, delay: float = 2.0, max_retry_delay: float = 300.0):
+        self.delay = delay
+        self.max_retry_delay = max_retry_delay
+        # (member_id, model_class) -> PendingRoleChange
+        self._pending = {}
+        self._flush_task = None
+        self._lock = asyncio.Lock()
+        # flushes failed in a row, for the retry backoff
+        self._failures = 0
+
+    def push(self, member_id: int, member_name: str, model_class, role_type: str, is_active: bool):
+        """Queue a role being added (is_active=True) or removed (is_active=False)"""
+        key = (member_id, model_class)
+        pending = self._pending.get(key)
+        if pending is None:
+            # a role being added means the member didn't have it before, and vice versa
+            self._pending[key] = PendingRoleChange(
+                member_id=member_id,
+                member_name=member_name,
+                model_class=model_class,
+                role_type=role_type,
+                was_active=not is_active,
+                is_active=is_active
+            )
+        else:
+            pending.member_name = member_name
+            pending.is_active = is_active
+
+        # start the debounce window if one isn't already running
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later(self.delay))
+
+    async def _flush_later(self, delay: float):
+        await asyncio.sleep(delay)
+        # shielded so drain() cancelling the timer can't interrupt a write halfway
+        if not await asyncio.shield(self.flush()):
+            # the changes are pending again, retry with exponential backoff
+            retry_delay = min(self.delay * 2 ** self._failures, self.max_retry_delay)
+            log.error("Retrying role event flush in %.1f seconds", retry_delay)
+            self._flush_task = asyncio.create_task(self._flush_later(retry_delay))
+        elif self._pending:
+            # events pushed while the flush was writing saw this task still running
+            # and didn't start a window of their own
+            self._flush_task = asyncio.create_task(self._flush_later(self.delay))
+
+    def _requeue(self, pending: dict):
+        """Put the changes of a failed flush back, keeping events queued since then"""
+        for key, change in pending.items():
+            newer = self._pending.get(key)
+            if newer is None:
+                self._pending[key] = change
+            else:
+                # the newer event has the latest state, the failed one the state before both
+                newer.was_active = change.was_active
+
+    async def flush(self):
+        """Write every pending change in a single transaction
+
+        Returns False if the write failed, the changes are queued again then
+        """
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            # added then removed (or the other way round) within the window costs nothing
+            changes = [change for change in pending.values() if change.is_active != change.was_active]
+            if not changes:
+                return True
+
+            changes_by_model = {}
+            for change in changes:
+                changes_by_model.setdefault(change.model_class, []).append(change)
+
+            applied = {}
+            try:
+                async with in_transaction() as connection:
+                    for model_class, model_changes in changes_by_model.items():
+                        applied[model_class] = await self._apply(model_class, model_changes, connection)
+            except Exception:
+                self._failures += 1
+                log.exception("Error flushing %d role events, keeping them queued", len(changes))
+                self._requeue(pending)
+                return False
+            self._failures = 0
+
+            # keep the editor autocomplete index in sync once the writes are committed
+            for change in applied.get(Editor, []):
+                if change.is_active:
+                    editor_index.add(change.member_name, change.member_id)
+                else:
+                    editor_index.set_active(change.member_id, False)
+            return True
+
+    async def _apply(self, model_class, changes: list, connection):
+        """Apply the changes for one staff table with one read and bulk writes
+
+        Returns the changes that actually modified a row
+        """
+        rows = {
+            row.discord_id: row
+            for row in await model_class.filter(
+                discord_id__in=[change.member_id for change in changes]
+            ).using_db(connection)
+        }
+
+        to_create = []
+        to_activate = []
+        to_deactivate = []
+        applied = []
+        for change in changes:
+            existing = rows.get(change.member_id)
+            if change.is_active:
+                if not existing:
+                    to_create.append(model_class(
+                        discord_id=change.member_id,
+                        discord_username=change.member_name,
+                        is_active=True
+                    ))
+                    applied.append(change)
+                    print(f"Added {change.role_type} role for {change.member_name}")
+                elif not existing.is_active:
+                    existing.is_active = True
+                    # update the username if it's different
+                    existing.discord_username = change.member_name
+                    # bulk_update doesn't set updated_at, exports notice renames by it
+                    existing.updated_at = timezone.now()
+                    to_activate.append(existing)
+                    applied.append(change)
+                    print(f"Reactivated {change.role_type} role for {change.member_name}")
+            elif existing and existing.is_active:
+                to_deactivate.append(existing.id)
+                applied.append(change)
+                print(f"Deactivated {change.role_type} role for {change.member_name}")
+
+        if to_create:
+            await model_class.bulk_create(to_create, using_db=connection)
+        if to_activate:
+            await model_class.bulk_update(to_activate, fields=["is_active", "discord_username", "updated_at"], using_db=connection)
+        if to_deactivate:
+            await model_class.filter(id__in=to_deactivate).using_db(connection).update(is_active=False)
+        return applied
+
+    async def drain(self):
+        """Flush everything still pending, called before the database is closed"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        if not await self.flush():
+            log.error(
+                "%d role changes could not be saved before shutdown, run /role reconcile-staff after restarting",
+                len(self._pending)
+            )
+
+
+role_event_queue = RoleEventQueue()
@@ -0,0 +1,90 @@
+"""
+Monthly thumbnail statistics rollup for the Live Channel Bot
+"""
+from datetime import date, datetime
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from utils.youtube import parse_video_id
+from .models import Thumbnail, ThumbnailMonthlyStat, ThumbnailRequest
+
+
+def month_start(moment: datetime):
+    """First day of the month a datetime falls in"""
+    return date(moment.year, moment.month, 1)
+
+
+async def increment_monthly_stat(thumbnail: Thumbnail, connection=None):
+    """Count a newly created thumbnail in its month's rollup row"""
+    stat, created = await ThumbnailMonthlyStat.get_or_create(
+        month=month_start(thumbnail.created_at),
+        designer_id=thumbnail.designer_id,
+        creator_id=thumbnail.creator_id,
+        category_id=thumbnail.category_id,
+        using_db=connection
+    )
+    await ThumbnailMonthlyStat.filter(id=stat.id).using_db(connection).update(count=F("count") + 1)
+
+
+async def record_thumbnail(designer, creator, category, youtube_url: str, connection=None):
+    """Create a thumbnail record and count it in the rollup, atomically
+
+    Pass the connection of an open transaction to commit the record together
+    with the caller's own changes.
+    """
+    if connection is None:
+        async with in_transaction() as connection:
+            return await record_thumbnail(designer, creator, category, youtube_url, connection)
+
+    thumbnail = await Thumbnail.create(
+        designer=designer,
+        creator=creator,
+        category=category,
+        youtube_url=youtube_url,
+        video_id=parse_video_id(youtube_url),
+        using_db=connection
+    )
+    await increment_monthly_stat(thumbnail, connection)
+    return thumbnail
+
+
+async def rebuild_monthly_stats():
+    """Recount the whole rollup from the thumbnail records"""
+    counts = {}
+    rows = await Thumbnail.all().values_list("created_at", "designer_id", "creator_id", "category_id")
+    for created_at, designer_id, creator_id, category_id in rows:
+        key = (month_start(created_at), designer_id, creator_id, category_id)
+        counts[key] = counts.get(key, 0) + 1
+
+    async with in_transaction() as connection:
+        await ThumbnailMonthlyStat.all().using_db(connection).delete()
+        await ThumbnailMonthlyStat.bulk_create([
+            ThumbnailMonthlyStat(
+                month=month,
+                designer_id=designer_id,
+                creator_id=creator_id,
+                category_id=category_id,
+                count=count
+            )
+            for (month, designer_id, creator_id, category_id), count in counts.items()
+        ], batch_size=1000, using_db=connection)
+    print(f"Rebuilt monthly thumbnail stats ({len(counts)} rows)")
+
+
+async def ensure_monthly_stats():
+    """Backfill the rollup for databases that had thumbnails before it existed"""
+    if not await ThumbnailMonthlyStat.exists() and await Thumbnail.exists():
+        await rebuild_monthly_stats()
+
+
+async def ensure_video_ids():
+    """Backfill the parsed video ids of records saved before the column existed"""
+    for model, url_field in ((Thumbnail, "youtube_url"), (ThumbnailRequest, "video_url")):
+        rows = await model.filter(video_id__isnull=True).values_list("id", url_field)
+        records = [
+            model(id=record_id, video_id=video_id)
+            for record_id, url in rows
+            if (video_id := parse_video_id(url))
+        ]
+        if records:
+            await model.bulk_update(records, fields=["video_id"], batch_size=1000)
+            print(f"Backfilled video ids of {len(records)} {model._meta.db_table} rows")
@@ -1,15 +1,24 @@
 from tortoise import Tortoise
-from .config import TORTOISE_ORM
+from .config import get_tortoise_config
+from .cache import guild_configs, load_search_indexes
+from .stats import ensure_monthly_stats, ensure_video_ids
 
 
 async def init_database():
     """Initialize the database"""
-    await Tortoise.init(config=TORTOISE_ORM)
+    # the config is built here rather than at import so .env values are picked up
+    config, backend = get_tortoise_config()
+
+    await Tortoise.init(config=config)
     await Tortoise.generate_schemas(safe=True)
-    print("Database initialized and schemas generated!")
+    await guild_configs.load()
+    await load_search_indexes()
+    await ensure_monthly_stats()
+    await ensure_video_ids()
+    print(f"Database initialized and schemas generated! ({backend})")
 
 
 async def close_database():
     """Close the database connection"""
     await Tortoise.close_connections()
-    print("Database connections closed!")
\ No newline at end of file
+    print("Database connections closed!")
@@ -1,22 +1,42 @@
 """
 Simple Discord Bot - Step 4: Organized with Cogs (using py-cord)
 """
+import asyncio
 import discord
 from discord.ext import commands
 from database.utils import init_database, close_database
+from database.cache import refresh_caches
+from database.role_queue import role_event_queue
+from utils.side_effects import side_effects
 import os
 from dotenv import load_dotenv
 
+class Bot(commands.Bot):
+    async def setup_hook(self):
+        """Runs on the bot's own event loop before it connects"""
+        # the database pool is bound to the loop it's created on, so it has to
+        # be opened here rather than in a separate asyncio.run() before bot.run()
+        await init_database()
+        # picks up creators, editors and categories changed by other bot processes
+        self.cache_refresh = asyncio.create_task(refresh_caches())
+        await load_cogs()
+
+
 # Create a bot instance
 intents = discord.Intents.default()
 intents.members = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = Bot(command_prefix='!', intents=intents)
 
 
 @bot.tree.command(name="close", description="Close the bot")
 async def close(interaction: discord.Interaction):
     await interaction.response.send_message("Closing the bot", ephemeral=True)
+    print("Flushing queued role events")
+    await role_event_queue.drain()
+    print("Finishing queued Discord calls")
+    await side_effects.drain()
     print("Closing database connection")
+    bot.cache_refresh.cancel()
     await close_database()
     print("Closing bot connection")
     await bot.close()
@@ -40,11 +60,6 @@ async def on_ready():
 
 # Run the bot
 if __name__ == "__main__":
-    import asyncio
-    async def setup_bot():
-        load_dotenv()
-        await load_cogs()
-        await init_database()
-    asyncio.run(setup_bot())
+    load_dotenv()
     bot.run(os.getenv('DISCORD_TOKEN'))
     
\ No newline at end of file
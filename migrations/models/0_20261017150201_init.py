@@ -0,0 +1,119 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "creators" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "name" VARCHAR(100) NOT NULL,
+    "is_active" INT NOT NULL
+) /* YouTube content creators */;
+CREATE TABLE IF NOT EXISTS "editors" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "discord_id" BIGINT NOT NULL UNIQUE,
+    "discord_username" VARCHAR(100) NOT NULL,
+    "is_active" INT NOT NULL
+) /* Video editors */;
+CREATE TABLE IF NOT EXISTS "guild_configs" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "guild_id" BIGINT NOT NULL UNIQUE,
+    "thumbnail_designer_role_id" BIGINT,
+    "editor_role_id" BIGINT,
+    "overseer_role_id" BIGINT,
+    "single_thumbnail_channel" INT NOT NULL,
+    "single_thumbnail_channel_id" BIGINT
+) /* Server configuration settings */;
+CREATE TABLE IF NOT EXISTS "overseers" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "discord_id" BIGINT NOT NULL UNIQUE,
+    "discord_username" VARCHAR(100) NOT NULL,
+    "is_active" INT NOT NULL
+) /* Overseers/managers */;
+CREATE TABLE IF NOT EXISTS "thumbnail_categories" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "name" VARCHAR(50) NOT NULL UNIQUE,
+    "channel_id" BIGINT UNIQUE,
+    "is_active" INT NOT NULL
+) /* Thumbnail request category channels */;
+CREATE TABLE IF NOT EXISTS "thumbnail_designers" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "discord_id" BIGINT NOT NULL UNIQUE,
+    "discord_username" VARCHAR(100) NOT NULL,
+    "is_active" INT NOT NULL
+) /* Thumbnail designers */;
+CREATE TABLE IF NOT EXISTS "thumbnails" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "youtube_url" VARCHAR(200) NOT NULL,
+    "category_id" INT NOT NULL REFERENCES "thumbnail_categories" ("id") ON DELETE CASCADE,
+    "creator_id" INT NOT NULL REFERENCES "creators" ("id") ON DELETE CASCADE,
+    "designer_id" INT NOT NULL REFERENCES "thumbnail_designers" ("id") ON DELETE CASCADE
+) /* Completed thumbnail records for export */;
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSON NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "editors_creators" (
+    "editors_id" INT NOT NULL REFERENCES "editors" ("id") ON DELETE CASCADE,
+    "creator_id" INT NOT NULL REFERENCES "creators" ("id") ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "uidx_editors_cre_editors_3cf19e" ON "editors_creators" ("editors_id", "creator_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXW1T4zYQ/iuefKIz9MoFArTfkgB39A5yA+61vU7Ho9iK48GRcrJ8kLnmv1eS5Rf5DS"
+    "cXSAz6Aom0q0jPWrv7rET43plhB/rBmyGBgGLS+c343kFgBtmLfNe+0QHzedrBGygY+0LW"
+    "joREIxgHlACbsvYJ8APImhwY2MSbUw8jLv03Ds1wDA0bIwoRNbLaDraZuofcxwRD5H0NoU"
+    "WxC+kU8qn/8y9r9pADH2AQv53fWRMP+o6yMs/hA4h2iy7mou0S0QshyOcwtmzshzOUCs8X"
+    "dIpRIu0hyltdiCABFPLhKQn5UlHo+xKVePXRTFORaIoZHQdOQOhzwLh2NIG0rWNZ1yPTuj"
+    "03LatTADPWyMAmmxho3BBsqoFYvcun8HP37dHJ0enh8dEpExHTTFpOltFHp8BEigKea7Oz"
+    "FP2AgkhCYJyCKmwDHQvQIrhnrId6M1iOsKqZQ9qRqm/iF3ncY5TrgI8bUuTTJ/M5oGcLdE"
+    "bIX0iT1+BsXl6d35r9q0/842ZB8NUX+PXNc97TFa2LXOve8U+8HbNNF+3GZBDjz0vzvcHf"
+    "Gl9G1+cCXhxQl4hPTOXMLx0+JxBSbCF8bwEn83TGrTFqTDK1ejh31rS6qqmtvitWjzHKmF"
+    "3OPrW6+F2w93AKSLmtY/mclRlabbTrDDxYPkQunbK3bw8Oagz7uX8zfN+/2WNSOWtdy65u"
+    "1LdU8PUCiwVQ71sJyAOMfQhQRazK6uXAHjPFp0I7jmNPgHYNuIPR6KOyYQaXZg7kP64G5w"
+    "x9gT0T8ihMgxlPDyZ3mVjGG8bAvrsHxLGUntQydBrOxgh4vkWgjYkTlFhIDnHx4Qb6QKy3"
+    "aA2ZXJnxcC3cB8v46YtbY0/BccRdXIVssWvWnZWCDYLAcxGLEdDx4rRPxfoKoIWJ+U+xIS"
+    "7ZVACyyx5/Cfi5GGkdtLeavFVhvS8XZuWS9nSZhD+DDMICptlceoKJMM0d5MGqI+G2otQ3"
+    "MZzslYqyl04JDt1pVi07MrMAmxCM9t2wfzvsn4mAZOVTZ/HUzAACrmjiMCz38+spoSfpSq"
+    "vZSebxeZycfPYciI2MisJICr2ahmga0hKH3dKEVNOQ12j1JjTE8QKeg1lljnTguZW+VNV7"
+    "3KfufHogneqv3e7h4Un34PD4tHd0ctI7PUi8a7Grzs0OLt9xT6vYNXa9RfjDAJJVGWGZrm"
+    "aHmh22kR1unu8oufmPEZ5M+b5VLm1VxpNZZyXlydJIlfGonCbPeFQ+tAnGE2UwtZTnXej5"
+    "zhCjied2SnhPtnu/jvy4XJDjyCQbUqBbSL5BYkQ6IRE1DCOAlDKDFSnRo9KaImmK1Jbo3c"
+    "5kWVOk12j1JhQp8v6rEqSslqZHa9Kj9KiATZsnIMQiLDtf2Rj146xlHgn+zuy/rdgnSt7W"
+    "s0lRV9thXTtglj0GcN3dUaatbbGuLQI2JQZj6nLsKUAI+itWGuqGecbCQ9LSqspDE3usvE"
+    "0eGUjvmFV2zPPVhmorBCPp+jol5YGkb7+uNhA7z4Z1gXjQ4JdoTiXno+UiugKgKwCaC+oK"
+    "gLa6PiTdtlPVh6Q7sN30Iak+JN1cIpzeoi3JhJUrttWpcMKMGubCQzyb81M+x0g0DXkl2J"
+    "hgYsCHOSa0kB83V9M5s86Z2+LO25k96Zz5NVq9Sc68wCENx9AKSUnlszpfy6m9wFSt2yhV"
+    "69akat1iqmYzNFxMFqUUpTJu5bQ2Q1C2DfZGYlguZiXXmpoCqyhpXMtIXXwQuxKwOS2NbB"
+    "WLKAJdRPkCE8i6PsCmFyETHnCWGbNlaNdciiTgPmEC+Set9EpimaPYAMw/cN+0JeCq/rEB"
+    "tjJQbfIZHmbGfKkwq/G9HOct1xsSM9TVHbK2alB/sOTCPdiwEmFmCgnMwgE1YugMechbPK"
+    "ZrqKNrELoG0RK30lI2qmsQr9HqTWoQ2/2Ole26UaXm0GtScuhVVxx6xYLDmpeonuDO1C6E"
+    "q2c+EdUnc7t1Mqe/3OYZv9ymGa9IShR1vCJbx2jCK+KiwMq0QlGsoBGKjKYNmja0ZJ+3NI"
+    "HUtOE1Wl1f99v55FZf99PX/TSpUJKP+MabpV6x07zi2XhFHxLPnnZKyITsqWUQIJV5jDRU"
+    "w6ApwW5RAv5nWnKTNQ1PGZUXGJW6vV6Tm029XvXNJt6nRiW+qVZAWIq/QHSfJObL/wpRRP"
+    "j329F1BZ9NVfK0xrOp8Z/he0Ebr+HUgMvBUGJ+jOneVf+vPNzDj6NBnpTwAQbbvuy//B/9"
+    "d0hp"
+)
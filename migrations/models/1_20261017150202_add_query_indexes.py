@@ -0,0 +1,54 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_creators_name_fd0106" ON "creators" ("name", "is_active");
+        CREATE INDEX IF NOT EXISTS "idx_editors_discord_22ed1d" ON "editors" ("discord_username", "is_active");
+        CREATE INDEX IF NOT EXISTS "idx_thumbnails_created_54773c" ON "thumbnails" ("created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_thumbnails_created_54773c";
+        DROP INDEX IF EXISTS "idx_editors_discord_22ed1d";
+        DROP INDEX IF EXISTS "idx_creators_name_fd0106";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2jgQ/isef+rN5HopCUnuvgFN2lyb0Gl8vbt2Oh5hC+OJkagst2V6+e8n2ZJt+Q"
+    "1DScCJvmRA2hXSs9buPitBfphz7MIgfD4iEFBMzD+MHyYCc8heFLsODBMsFlkHb6BgEsSy"
+    "TiIUN4JJSAlwKGufgiCErMmFoUP8BfUx4tL/4siKJtBwMKIQUSOv7WKHqfvIWyUYIf9LBG"
+    "2KPUhnkE/902fW7CMXfochf/spWQpvDG02If8rND9zmcWtPfVh4CrL9V0uGbfbdLmI2y4R"
+    "vYgF+cQmtoODaI4y4cWSzjBKpX1EeasHESSAQj48JRFfP4qCQEAlIUmmn4kk887puHAKoo"
+    "CjyLWTCWRtpm1fjy375tyybbOEsNTIYSmaGJLcOmyqYbx6j0/h196L49Pjs6OT4zMmEk8z"
+    "bTm9Sz46AyZRjOG5tsy7uB9QkEjEwGegxgaDrg1oGdyXrIf6c1iNsKpZQNoVqs/liyLuEu"
+    "Um4GVDhnz2uD4E9GyB7hgFS2HyBpyty6vzG2tw9Y5/3DwMvwQxfgPrnPf04tZlofXZyS+8"
+    "HbOdmGzRdBDj70vrtcHfGh/H1+cxvDikHok/MZOzPpp8TiCi2Eb4mw3c3NMpWyVqTDKzer"
+    "RwN7S6qqmtvi9WlxjlzC5mn1ldOlvV3qMZINW2lvIFKzO0umjXOfhuBxB5dMbevjg8bDDs"
+    "h8H70evB+2dMqmCta9HVS/ruFHyzIFYCeYhxAAGqiVV5vQLYE6Z4X2jLOHYPaDeAOxyP3y"
+    "obZnhpFUD+62p4ztCPsWdCPoVZMOPpwfQ2F8t4wwQ4t98AcW2lJ7MMnUXzCQJ+YBPoYOKG"
+    "FRYSQ1y8eQ8DEK+3bA2RcVlyuA7ugzv59MlW6Sk4jriH65Atd81780qwQRj6HmIxArq+zA"
+    "VVrK8AWlqY/403xCWbCkBO1eMvAD+PR9oE7Z0mb3VYH4iF2YVMPlsm4c8gg7CEaT7BnmIS"
+    "m+YW8mBlCrjtJPVNDSd6haLopTOCI2+WV8uPzCzAJgSTfTca3IwGL+OAZBdT5/ipmQMEvL"
+    "iJw3B3UFxPBWfJVlpPWXKPz2rG8sF3ITZyKgpNKfW24SauH3JfYUchJJqnaJ6yrx69oxmr"
+    "5ilP0epteIp0vFWOdOh7tb5U1VvtU/c+fxBO9fde7+jotHd4dHLWPz497Z8dpt613NXkZo"
+    "eXr7inVewqXW8Z/nzca0sZq3Q1fdT0sYv0cfuESEnef44R5Yr+nXJp61Ki3DprOVGeZ6qU"
+    "SCU9RUqkEqZtUKIkg2nkRK8iP3BHGE19z6wgRvnugyZ25HFBjiOTbMmRbiD5ComR6EQkLn"
+    "IYIaSUGazMmVZKr+ZQmiJpirQf0bubybKmSE/R6m0oUuL91yVIeS1NjzakR9lZAps2T0CI"
+    "TVh2vrYxmsfZyDwC/L3ZfzuxT5K8bWaTsq62w6Z2wCx7DOGmu6NKW9tiU1uEbEoMxszlOD"
+    "OAEAzWrDQ0DfOAhYe0pVOVhzb2WHubrBhI75h1dszD1YYaKwRj4frMivJA2nfQVBuQzrNl"
+    "XUAOGv6WzKniALVaRFcAdAVAc0FdAdBW14eku3aq+pB0D7abPiTVh6TbS4Sza7YVmbByB7"
+    "c+FU6ZUctceITnC37K5xqppiHuDBtTTAz4fYEJLeXH7dXa3DxUszHmqfVlQ51H74mL72ZG"
+    "pfPop2j1Nnn0Ekc0mkA7IhXV0PocrqD2CNO3Xqv0rdeQvvXK6ZvD0PAwWVbSltq4VdDaDm"
+    "nZNdhbiWGFmJVedWoLrKKkca0ievJwdi1gC1oa2TpmUQa6jPIFJpB1vYFtL0em3OBlbsyO"
+    "od1wUZKAbykTKD5pldcUqxzFFmD+iTuoHQFX9Y8tsBWBapvP8Cg35mOFWY3v1TjvuAaRmq"
+    "GpFpG3VYuahC0W7sOW1QkrV1xgFg6pIaEzxMFv+eiupY4+y9M1iI64lY6yUV2DeIpWb1OD"
+    "2O0Ps+zWjSo1h36bkkO/vuLQLxccNrxYdQ/3qPYhXD3wKak+rduv0zr9izgP+Is47XhFWq"
+    "Jo4hX5OkYbXiGLAmvTCkWxhkYoMpo2aNrQkX3e0QRS04anaHV9BXDvk1t9BVBfAdSkQkk+"
+    "5C04W712p3nFg/GKASS+MzMryIToaWQQIJNZRRrqYdCUYL8oAf/qlthkbcNTTuURRqVev9"
+    "/mZlO/X3+zifepUYlvqjUQFuKPEN17ifni/0uUEf7zZnxdw2czlSKt8R1q/GcEftjFazgN"
+    "4HIwlJgvMX12NfinCPfo7XhYJCV8gOGuvwBw9z+6OGGc"
+)
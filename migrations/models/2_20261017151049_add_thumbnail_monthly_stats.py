@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "thumbnail_monthly_stats" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "month" DATE NOT NULL,
+    "count" INT NOT NULL,
+    "category_id" INT NOT NULL REFERENCES "thumbnail_categories" ("id") ON DELETE CASCADE,
+    "creator_id" INT NOT NULL REFERENCES "creators" ("id") ON DELETE CASCADE,
+    "designer_id" INT NOT NULL REFERENCES "thumbnail_designers" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_thumbnail_m_month_0862f9" UNIQUE ("month", "designer_id", "creator_id", "category_id")
+) /* Completed thumbnail counts per month, designer, creator and category */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "thumbnail_monthly_stats";"""
+
+
+MODELS_STATE = (
+    "eJztXV1zmzgU/SsMT90Zbzd14ia7b7abttk2cSdhu7vNdBgZZMwEI1eItp5u/vtKIEDiy9"
+    "h1Yoj1koklXVmcA1f3XN2QH/oC2dALno8xBARh/Q/th+6DBaS/5Lt6mg6Wy6yDNRAw9aKx"
+    "VjwoagTTgGBgEdo+A14AaZMNAwu7S+Iin43+F4VGOIWahXwCfaKJ1jayqLnrO+sGhr77JY"
+    "QmQQ4kc8iWfvuZNru+Db/DgH28jS+FNQYmXZD7Feqf2ZjlnTlzoWdLl+vabGTUbpLVMmq7"
+    "8MnraCBb2NS0kBcu/GzwckXmyE9Huz5hrQ70IQYEsukJDtn1+6HncagSSOLlZ0PidQs2Np"
+    "yB0GMoMut4AVmbbppXE8O8OTdMUy8gnFgIWPImiiRjhy41iK7eYUv4tf/i5PTk7PjlyRkd"
+    "Ei0zbTm9j786AyY2jOC5MvT7qB8QEI+IgM9AjQiDtglIEdxXtIe4C1iOsGyZQ9rmps+TX/"
+    "K4JyjXAZ80ZMhnt+tjQE8v0J743opTXoOzcXF5fmMMLz+wr1sEwRcvwm9onLOeftS6yrU+"
+    "e/kLa0f0SYwf0XQS7e8L463GPmqfJlfnEbwoIA6OvjEbZ3zS2ZpASJDpo28msIW7M2lNUK"
+    "MjM9bDpb0l67KlYr0trCcYCbTz1WesJ85W5ns8B7ic62R8jmWKVhd5XYDvpgd9h8zpxxdH"
+    "RzXEfhxej98Or5/RUTm2rnhXP+67l/DNNrECyCOEPAj8ir1KtMuBPaWGD4V2so89ANo14I"
+    "4mk/fSAzO6MHIg/3U5OqfoR9jTQS6B2WbGwoPZnbCXsYYpsO6+AWybUk/GDJmHi6kPXM/E"
+    "0ELYDkoY4lO8fncNPRBdb5ENHnEZyXQdfA7uk7svaS3zFAsazs29lRkQQHaF1WU85w0BhS"
+    "Csy7Cx2w/1UdUNWexa9Bel9ygIAtfx6dYKbTcJoWXYL4G/MhD7GfmRC7oU4FtlXoNjfx7N"
+    "tA3ae415q7Du8QszcwIou0zMbkcKYQFTUZfMEI6ouYNsj9c53GasGFLieC835L1kjlHozE"
+    "UzcWbKAF0QjN3VeHgzHr6K9nEzrziiu2YBfOBETQyG+17+ekqkXnal1UpPuH3WC72Prg2R"
+    "JphI6q7Q20TS2W7AXKwZBhAreafkXVs9ekcDfSXvDpH1JvIucbxljnTkOpW+VLZb71NbHz"
+    "9wp/p7v398fNo/On55Njg5PR2cHaXetdhV52ZHF2+Yp5V4TVxvEX5x32uqtMtslepWqruL"
+    "qnv3gkgK3n9OEQlnJZ1yaZtKIuE6KzWRqDNlSSSLnrwkkgXTLiRRHMHUaqI3oevZY+TPXE"
+    "cvEUZid69OHTlsIMORjmyokW4g/gqxFtuEOMp3aAEkhBJW1ExrR6/XUEoiKYnUjt27m8Gy"
+    "kkiHyHoTiRR7/00Fkmil5NGW8ig7gqHLZgEINjGNzjcmo36erejh4Lfm+dsLP3Hwth0nRV"
+    "vFw7Y8IBo9BnDbp6PMWnGxLRcBXRKFMXM51hz4PvQ2zDTUTfOIiYe0pVOZhyZ8bPyYrJlI"
+    "PTGbPDGPlxuqzRBMuOvTS9IDaV+vLjeQOM+GeYFk0uC3eE0lB6jlQ1QGQGUAlBZUGQDFuj"
+    "ok3bdTVYekLXjc1CGpOiTdXSCcVSeXRMJS6XJ1KJwqo4ax8BgtluyUz9ZSS42XWmszhDX4"
+    "fYkwKcTHzc2aVB7K0Rj11KrYUMXRLXHx3YyoVBx9iKw3iaNXKCThFJohLsmGVsdwObMnGL"
+    "71G4Vv/ZrwrV8M3yyKhoPwqlS2VO5bOavdiJZ9g72TPSy3Z6WlTk2BlYwUrmVCLzmc3QjY"
+    "nJVCtkpZFIEuovwaYUi73sGmxZGpNnglzNkxtGsKJTH4liqB/J1WWqZY5ih2APNP1KB2BF"
+    "zZPzbAlm9Uu7yHx8KcTxVmeX8vx3nPOYiUhrpchMhVg5yEyS/chQ2zE4aQXKAMB0RLoNP4"
+    "wW/x6K6hjTrLUzmIjriVjqpRlYM4RNab5CD2+z6b/bpRKecwaJJyGFRnHAbFhMOWhVUPUE"
+    "fVhu3qkU9J1Wldu07r1IuE1IuE2v4ioWZyLM3s1MkxMf3TRI4luZSN1ZhkWKG+pDFKbSm1"
+    "1ZHnvKNxt1Jbh8i6qpxsvSZQlZOqclJpMSn4SIoHTblaUckxJcc6IsdE7OoUWQ7jJqKsQP"
+    "V2RbwWCilS2hJiLZqxlwqyXvLPHjTg25p4hLu2xHebSUuk3218P3P2U8kqnNSnE3xWMlHJ"
+    "xDb6n44KBiUTD5H1JjIxdclFwsvJTg3qeO4gxzWcMp7yB25sS9xg60nHP16N5FGrdx9VLP"
+    "0IyKpiaVUs3XpkVbG0KpbuELiqWPrQi6WHELvWXC9JAPGeXl3KB2Rj1mV4qkFVB+vtypiw"
+    "90bx9GvTQx7B5Ame7fQHgyZ/VjkYVP9ZJeuT4y72UG2AMB/+BNF9kJMz/j+Biwj/eTO5ql"
+    "K1qUk+G+BaRPtP89ygi2FtDbgMDCm1k2D67HL4Tx7u8fvJKJ+zYROM9v32kfv/AajMeDQ="
+)
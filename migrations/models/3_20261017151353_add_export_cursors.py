@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "export_cursors" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "guild_id" BIGINT NOT NULL UNIQUE,
+    "last_created_at" TIMESTAMP,
+    "last_thumbnail_id" INT
+) /* Last thumbnail record delivered by a guild's incremental export */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "export_cursors";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zYQ/iuCv6wDvC514ibbN9tN26xNPDRet7UoBFpibCEy6VJUW6PLfx9JvVGvll"
+    "0nluL7UsTkHU0+Jx7vOZ7c750FtbHrPR0xjDhlnd+N7x2CFlj8ke3qGh20XCYdsoGjqatk"
+    "rUBINaKpxxmyuGi/Qa6HRZONPYs5S+5QIqX/pf7En2LDooRjwg1d26aWUHfIbJ2gT5zPPj"
+    "Y5nWE+x3LqHz+JZofY+Bv25MePwVJko2eKCTlfcOeTlFnemjcOdu3Uch1bSqp2k6+Wqu2C"
+    "8JdKUE5salrU9RckEV6u+JySWNohXLbOMMEMcSyH58yX6ye+64ZQRZAE009EgnlrOja+Qb"
+    "4rUZTawQSSto5pXo0n5vX5xDQ7OYQjDQ3LsEkgKa0jpuqp1c/kFH7pPTs5PTk7fn5yJkTU"
+    "NOOW07vgqxNgAkUFz9Wkc6f6EUeBhAI+AVUZDNsm4nlwX4ge7ixwMcJpzQzSdqj6NPoji3"
+    "uEchXwUUOCfPK4PgT0YoH2mLir0OQVOE8uLs+vJ4PLP+XXLTzvs6vwG0zOZU9Pta4yrU+e"
+    "/yzbqdiJwRaNBzH+vpi8NuRH48P46lzBSz0+Y+obE7nJh46cE/I5NQn9aiJbezqj1gg1IZ"
+    "lY3V/aW1o9rQlWb4rVI4w0s4ezT6weOdu0vUdzxIptHclnrCzQaqNdF+ib6WIy43Px8dnR"
+    "UYVh3w/ejV4P3j0RUhlrXYVdvaDvLoVvcojlQB5S6mJESs4qXS8D9lQo3hfa0Tl2D2hXgD"
+    "scj9+mNszwYpIB+a/L4blAX2EvhByOk8NMhgc3t9pZJhumyLr9iphtpnoSy/C5v5gS5Lgm"
+    "wxZltldgoXCIl2/eYRep9eatEUZck2i4Fu6Du+jpi1qLPMVChHNzd2V6HPFdYXUZjHnNUS"
+    "4IazNs8vGjPVr2QOa7Fr1F4TOKPM+ZEXG0YtuJQug07JeIrCZU/qv8yIWYCiJWkdcIsT9X"
+    "I22D9l5j3jKsu+HCzAwBSpbJ5OMoIMxhqvOSG8qUaW6xPOM7IdxmwBhiw4W9oWLYy+eM+r"
+    "O5rqaPLCwgJoQDdzUaXI8GL9Q5bmYZh3pqFoigmWqSMNx1s+spoHrJSsuZnvb4rCd67x0b"
+    "U0NTSbG7XG8dSmc7nnSxpu9hBvQO6F1TPXpLA32gd4do9Tr0LnK8RY506MxKfWlab71PbX"
+    "z8EDrV33q94+PT3tHx87P+yelp/+wo9q75rio3O7x4JT1tyq6R683Dr597dZl2kS6wbmDd"
+    "bWTduydEqeD9xxiRdlfSKpe2KSXS1lnKiXSemaZEadKTpURpwrQLShREMNWc6NuSMj7ymV"
+    "fCjPT+biU/UpKmpURr0qS3yONGnEQygiSSIYYW7oNh25iuDGTMfMe1f/IMhwgAFphw5BrB"
+    "l+WI1Q7GW0/FgGkB02pGENDOmBuY1iFavQ7TUp55Y56lawHL2pJlueLkNLf3tQXqO9h6Ie"
+    "xN2Xnt3Wl5B6sMllzfbRS6FOputfMaZuBdxDIPx+gq4/pX0imOKLlxZp2CsF7vrozqA+dq"
+    "KcmaQf01ZiLaNgIdn6l7TMPDnAvo83cha6UhIIeAHEIzCMjB6hCQH1BAnsRXYtoyschMRl"
+    "28sTGqx3lEUdsD2ydIym5nk7wu2GFbO1ARPXp4291RpA222NYWnpiSgDFxOdYcEYLdDW8Q"
+    "q4Z5wAvFuKVVN4p17LHxNlkzEOyYTXZMQzIE49D1dQrSA3Fftyo3EDnPmnmBaFDv12BOBY"
+    "WRxSKQAYAMAHBByACA1aH4cd9OFYofG7DdoPgRih93Fwgnbx0WRMKpVxLLQ+GYGdWMhUd0"
+    "sZTVe3auWs0zbigrq2+rr1bnjaJ0NCY8NbxEBHF0Q1x8OyMqiKMP0ep14ugV9bk/xabPCr"
+    "Kh5TFcRu0Rhm+9WuFbryJ86+XDN0ugMaNstVldU0ZrN6Rl32Dv5AzLnFnxKwx1gU0pAa5F"
+    "RC+6nN0I2IwWIFvGLPJA51F+SRkWXW9w3ZeeYm7wQhuzZWhXvADF0NeYCWSftMLXj4ocxQ"
+    "5g/oF3y1oCbto/1sA2PKh2+QyPtDEfK8zp870Y5z3nIGIzVOUidFvVyEmY4cIdXDM7MdGS"
+    "C8LCHjci6Izw4jd/dVdTB+7yIAfRErfSUjYKOYhDtHqdHMR+f6dyv240lXPo10k59MszDv"
+    "18wmHLwqp7qKNqwnH1wLekcFvXrNs6+IHQDVjKHfxA6D5+ILQeHYszO1V0TE//1KFjUS5l"
+    "YzaWUixhXykZYFvAtlqyz1sadwPbOkSrQ+Vk4zkBVE5C5SRwsVTwERUPmulqRaBjQMdaQs"
+    "d07KoYWQbjOqQsZ+rtingt6gukjCVmhhqxGxOybvSfuBmI2IZ+hbu2xHebQQuo38fgeQ6t"
+    "H1NW7aY+HuAT0ESgiU30Py0lDEATD9HqdWhi7JLzBi82dqxQZecW2rjCptJO2Qs3eSRucP"
+    "TE8g9XI3nU6NMHiqUfAFkoloZi6cYjC8XSUCzdInChWPrQi6UHmDnWvFOQAAp7ulUpH5TI"
+    "rMvwlIMKF+vNypjI340K0691L3k0lUd4t9Pr9+u8Vtnvl79WKfvScZfcVBsgHIo/QnTv5e"
+    "ZMfCPHRaT2j+vxVRmrjVWy2QDH4sZ/hut4bQxrK8CVYKRSOxGmTy4H/2ThHr0dD7M5GznA"
+    "cN+/PnL3PyxeQ4A="
+)
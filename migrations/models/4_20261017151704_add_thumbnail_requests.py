@@ -0,0 +1,79 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "thumbnail_requests" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "guild_id" BIGINT NOT NULL,
+    "video_url" VARCHAR(200) NOT NULL,
+    "status" VARCHAR(9) NOT NULL /* OPEN: open\nCLAIMED: claimed\nCOMPLETED: completed */,
+    "claimant_id" BIGINT,
+    "message_id" BIGINT,
+    "message_channel_id" BIGINT,
+    "private_channel_id" BIGINT,
+    "private_message_id" BIGINT,
+    "claimed_at" TIMESTAMP,
+    "completed_at" TIMESTAMP,
+    "category_id" INT REFERENCES "thumbnail_categories" ("id") ON DELETE CASCADE,
+    "creator_id" INT NOT NULL REFERENCES "creators" ("id") ON DELETE CASCADE
+) /* Thumbnail requests, from being sent until the thumbnail is approved */;
+CREATE INDEX IF NOT EXISTS "idx_thumbnail_r_status_322551" ON "thumbnail_requests" ("status");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "thumbnail_requests";"""
+
+
+MODELS_STATE = (
+    "eJztXV1T2zgU/SuavGx3JtulgRToWwhpyxZIB7Ld3XY7HsUWiQdHSm2ZNtPlv6/k729sEx"
+    "I73JdOkXQV+Zz4+p6rK+dnZ8E0YlgvhybBnJmdN+hnh+IFEf9JdnVRBy+XYYds4HhqOGNV"
+    "d5DTiKcWN7HKRfsNNiwimjRiqaa+5DqjcvQ/zJ7YU4JURjmhHEWtNaYKc53OHhpoU/2bTR"
+    "TOZoTPiVz6l6+iWaca+UEs+ecX91Jko6WIBel3pPNVjlneKjc6MbTY5eqaHOm0K3y1dNrO"
+    "KH/rDJQLmyoqM+wFDQcvV3zOaDBap1y2zgglJuZETs9NW14/tQ3Dg8qHxF1+OMRdd8RGIz"
+    "fYNiSK0tpdQNjWUZTL8US5Hk0UpZNC2LeIYOk1CSQlO2KplnP1M7mE33qvDg4PjvZfHxyJ"
+    "Ic4yg5bDe/ejQ2BcQweey0nn3unHHLsjHOBDUB3CiKZgngb3VPRwfUGyEY5bJpDWPNOX/n"
+    "+SuPsoFwHvN4TIh1/XTUAvLlAbU2PlUV6A8+TsYnQ9GVx8lB+3sKxvhoPfYDKSPT2ndZVo"
+    "ffH6V9nOxJ3o3qLBJOivs8l7JP9En8eXIwdeZvGZ6XxiOG7yuSPXhG3OFMq+K1iLfDv9Vh"
+    "81MTJk3V5qNVmPWwLrTWHdxyhCu7f6kHXf2cb5Hs6xmc21Pz7BskCrjbwu8A/FIHTG5+LP"
+    "V3t7BcR+GlwN3w+uXohRCbYuva6e23cfwzd8iKVAPmHMIJjmPKuidgmwp8LwqdD2n2NPgH"
+    "YBuCfj8Xnshjk5myRA/vPiZCTQd7AXg3ROwoeZDA9ubiPPMtkwxertd2xqSqwnZIbP7cWU"
+    "Yt1QTKIyU7MyGPKmePvhihjYud40G17ENfGna+F9cO9/+/zWLE+xEOHc3FgpFsd8XVhduH"
+    "Nec5wKwnYFtujXTKzaWht2V+50u4SbvG1Zj+XdyOmuRW+ReW9jy9JnVIQkRNN96RGH/ALT"
+    "1YTJfx3/eyaWgqma5W093EfOTHXQ3qpWyMO6612YkhCO4WWa8qsoIExhGtVzN8x0qLklMj"
+    "bqeHArrtIKiPN6PUOvl89NZs/mUbPozIIBsSDiuvnh4Ho4OHXiHyWp1JxvzQJTPHOaJAz3"
+    "3eT1ZEjk8ErzFXLk6/OwQP6ka4ShiElMFad6y0hhTbfko0mxLWKCLAZZ3FSP3lKBBLL4Ob"
+    "JeRhb7jjfLkZ7os1xfGrd72Kc2Pn7wnOpxr7e/f9jb23991D84POwf7QXeNd1V5GZPzt5J"
+    "Txvj1Xe9afijz72yGYosW8hWQLaijdmK9QuiWPD+OEUU2WNqlUurKoki15mriaI6My6J4q"
+    "InKYnigmkdksiNYIo10Y8lM/nQNq0cZRTt7xbqI2ekojpDS8qkc2xxFGRFkJt8Q2Jq4T5M"
+    "oqHpCmE0s3VD+8VCOhUALAjl2EDuh6WE1Rrme1iKgdICpdWMIKCdMTcorefIehml5Xjmyj"
+    "oragUqq6bKMsSTU6nvazPM13DrebA35c5r752WdrAOYeF+VKXQJdO21p3XMILXEctsTtEV"
+    "xvXvpFMcMnqjzzoZYX20uzCqd52r6owsGdRfE1NE28i1sU1nDxNZhHMBfXov5MHREJBDQA"
+    "6hGQTkwDoE5M8oIA/jK7FsmVg0FZMZpDIZxfPsUNS2YX7cpGw9TtK2wENdHpiIHi1S9+7I"
+    "sgYu6nJhiSUJGEOXo84xpcSouINYNM0GNxSDllbtKJbho/Jt8sBEcMdUuWMakiEYe66vk5"
+    "EeCPq6RbkB33mWzAv4k1q/u2vKKIzMHgIZAMgAgBaEDACwDsWP23aqUPzYgNsNih+h+HF9"
+    "gXB4WjMjEo4d5cwPhQNlVDIWHrLFUlbvaalqNQvdMDOvvq28WZkTRfFoTHhqOEQEcXRDXH"
+    "w7IyqIo58j62Xi6BWzuT0lim1mZEPzY7iE2Q6Gb71S4VuvIHzrpcM3VaAxY+aqWl1Twmo9"
+    "omXbYK/lGZZ4ZgVHGMoCGzMCXLOEnr85WwnYhBUgm6cs0kCnUX7LTCK6PpCyh54CbXAamb"
+    "NlaBccgDLx90AJJL9pmcePshzFGmB+xNmyloAb948lsPUeVOv8Dg8jc+4qzPHnezbOW85B"
+    "BDQU5SKiXJXISSjeheukZHZiEkkuOC8WQj50yNv4TW/dlbSBvTzIQbTErbRUjUIO4jmyXi"
+    "YHsd33e27XjcZyDv0yKYd+fsahn0441CyseoI6qiY8rja8Swq7dc3arYMXq1ZQKffwYtVd"
+    "eLFqw8pZc2HbiIoNEmJFKjaaNSujYv0UVGURGzPMEa2xMSBSQaS2xD22VK6ASH2OrEPBae"
+    "OlFBScQsEpSNhY8OHXXCrxIk9QsaBiWyLHotgVKbIExmVEWYrqerXPKrMFUmhJTOTM2A0E"
+    "Wdf/zUCEqYaiO98PVkbXmTRD+n1xv88e+4FkjRQ4BBN8BZkIMrGJ/qelggFk4nNkvYxMDF"
+    "xymvBssgODIp5byHEBp5Kn5D6lfCRWePQE4zdXWrrX6KcP1JhvAFmoMYca88YjCzXmUGPe"
+    "InChxhxqzBNFDUWpoEjhQ5k0ULTsokZ9udVFNyZboCkRHCCLUI5E3Cn6+ZxEEjq6hcRiTH"
+    "ZHtIKt/EfNWebcvMx12RaclofsTkOcU0t1PmR3niPrZbI7TXnv9LYZ3koJwJ38deqqLyqI"
+    "Ge3gpv+TvKbACyQyYR5Re5GKr2OQh9abw7vDloR2qiHeGX8cXb5B0vJfOjwfCPdw+gapBh"
+    "ZuVxMt44uP56OJ0+Zv4iWjuzIMHZfg5ziXnePUiQ65Pkx59SMdcUN4N25dP7QgliWUTGUC"
+    "4naA/2Pxr3u2Kdse+KjLx9LU7wREtfnItgc+HstHXT+VbQ981OXDiyjqJAhilvDDhc1Rhu"
+    "mEQFiOWYPnhC0w3Wimt7bB3jBSYX+9ubgW7ALD7uTO7k42zEHswObkgJi6Ou9kbEl6Pd2i"
+    "jUgcjnlo8zEfVDj126wNP/lbQN7ZkNJZ6NBkF3PQ/X6ZHHS/n5+Dln3xYEDeVBUQ9obvIL"
+    "pPcqxPfCInWRW3f1yPL/NESmCS1Ce6ytF/yNBLvZCiaWgXgCvBiKkSH9MXF4O/k3APz8cn"
+    "SbkhJzjZ9i9K3P8PnTM0qw=="
+)
@@ -0,0 +1,65 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "guild_configs" ADD "thread_workspaces" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "guild_configs" ADD "workspace_parent_channel_id" BIGINT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "guild_configs" DROP COLUMN "thread_workspaces";
+        ALTER TABLE "guild_configs" DROP COLUMN "workspace_parent_channel_id";"""
+
+
+MODELS_STATE = (
+    "eJztXdty2zYQ/RWMXprOqK2rRHGSN1lRWre2lYnVtE2a4UAkLHFMAQoIJtG0/vcCvN9F0r"
+    "JEyvuSiQEsBJ5DLPcsltK/vRUziGX/OOYEC8Z7r9C/PYpXRP4n3dVHPbxeRx2qQeC55Y7V"
+    "vUFuI57bgmNdyPYbbNlENhnE1rm5FiajavTfzJk5c4J0RgWhAsWtDaZLc5Mutg10qPnZIZ"
+    "pgCyKWRC394yfZbFKDfCO2+vOjdymq0dbkgswvpPdJjVnfajcmsYzE5ZqGGum2a2KzdtvO"
+    "qXjjDlQLm2s6s5wVjQavN2LJaDjapEK1LgglHAuiphfcUddPHcvyoQog8ZYfDfHWHbMxyA"
+    "12LIWisvYWELX1NO1qOtOuJzNN62UQDixiWPpNEknFjlyq7V79Qi3hh8HPz06fvXj6/NkL"
+    "OcRdZthyeud9dASMZ+jCczXr3bn9WGBvhAt8BKpLGDE0LLLgvpY9wlyRfISTlimkDd/0x+"
+    "A/adwDlMuADxoi5KPbdR/Qyws0ptTa+JSX4Dw7v5xcz0aXb9XHrWz7s+XiN5pNVM/Abd2k"
+    "Wp88/161M7kTvS0aToL+PJ/9itSf6MP0auLCy2yx4O4nRuNmH3pqTdgRTKPsq4aN2N0ZtA"
+    "aoyZER687aaMh60hJYbwvrAUYx2v3VR6wHzjbJ93iJeT7XwfgUyxKtLvK6wt80i9CFWMo/"
+    "fz45KSH2/ejd+NfRuydyVIqtK79r4PXdJfCNHmIZkM8YswimBc+quF0K7Lk0fCi0g+fYA6"
+    "BdAu7ZdHqR2DBn57MUyH9cnk0k+i72cpApSPQwU+HBzW3sWaYa5li//Yq5oSV6ImbE0lnN"
+    "KTYtjROdccPOYcif4s3v74iF3evNsuFHXLNgug7ug7vg7gta8zzFSoZzS2uj2QKLXWF16c"
+    "15LXAmCDsW2OK3mVy1vTPs3nnTHRNuatuyASvayNmu1WCVu7exbZsLKkMSYpiB9EhCfonp"
+    "ZsbUv67/PZdLwVTP87Y+7hN3piZoH1QrFGHd9y9MSwnH6DK5uhUlhBlM43ruhnGXmluiYq"
+    "OeD7fmKa2QOL/XN/R7xZIzZ7GMm8VnlgzIBRHPzY9H1+PRazf+0dJKzb1rVpjihdukYLjr"
+    "p68nRyJHV1qskGO3z3aB/N40CEMxk4QqzvRWkcKGaatHk+bYhIMsBlncVo/eUYEEsvgxsl"
+    "5FFgeON8+RnpmLQl+atNvuU1sfP/hO9eVg8PTp6eDk6fMXw2enp8MXJ6F3zXaVudmz81+U"
+    "p03wGrjeLPzx517VDEWeLWQrIFvRxWzF7gVRIni/nyKKnTF1yqXVlUSx6yzURHGdmZRESd"
+    "GTlkRJwbQLSeRFMOWa6NuacTF2uF2gjOL9/VJ95I7UdHdoRZl0gW2BwqwI8pJvSE4t3Qcn"
+    "BppvEEYLx7SM72xkUgnAilCBLeR9WEZY7WC+7VIMlBYorXYEAd2MuUFpPUbWqygt1zPX1l"
+    "lxK1BZDVWWJZ+cWnNfm2O+g63nw96WndfdnZZ1sC5h0XlUrdAl17bRzmsZwbuIZfan6Erj"
+    "+l+UUxwzemMuejlhfby7NKr3nKvujqwY1F8TLqNt5Nk43D3DRDYRQkKfPQvZOhoCcgjIIT"
+    "SDgBxYh4D8EQXkUXwll60Si1zjzCK1ySif54iitj3z4yVlm3GStQUemvLAZPRok6a7I88a"
+    "uGjKhS2XJGGMXI6+xJQSq+YJYtk0ezxQDFs6daJYhY/a22TLRLBjmj/lVfCofWX81l5jne"
+    "QVBJdtlVx72CM19kgInbbGnFDReI9smQj2SJ090pIs2tQPD3o5KbSwr1+WPwsCjIq5s2BS"
+    "+ydvTTnFw/lDIEsGWTLIl0CWDFiHAuFDO1UoEG7BdoMCYSgQ3l0gHL3RnBMJJ153Lg6Fw+"
+    "xBxVh4zFZrVeFqZCo6bXTDeFENaHWzKm/dJaMx6anhRTuIo1vi4rsZUUEc/RhZrxJHb5gj"
+    "nDnRHJ5zYlAcw6XMjjB8G1QK3wYl4dsgG77pEo0F45t6tX8pq92IlkODvZNnWOqZFb7mUx"
+    "XYhBHgmif0ggKGWsCmrADZImWRBTqL8hvGiez6nVR9MTDUBq9jc3YM7ZKXBDn+GiqB9J2W"
+    "+4penqPYAcz3eP+yI+Am/WMFbP0H1S7v4XFszmOFOfl8z8f5wDmIkIayXEScqwo5Cc2/cJ"
+    "NUzE7MYskF98u3UAAd8g9+s0d3FW3gLA9yEB1xKx1Vo5CDeIysV8lBHPY7cA/rRhM5h2GV"
+    "lMOwOOMwzCYcGhZWPUAdVRseV3s+JYXTunad1sGXD9dQKYk7Gb58uKtfPtyyctZC2PaiYs"
+    "OEWJmKjWfNqqjYIAVVW8QmDAtEa2IMiFQQqR1xjx2VKyBSHyPrUHDaeikFBadQcAoSNhF8"
+    "BDWXWrLIE1QsqNiOyLE4dmWKLIVxFVGWobpZ7bPOHIkUWhOO3Bn7oSDrB7+riTA1UPzke2"
+    "tldJNJc6TfR+9+9tkPJWuswCGc4BPIRJCJbfQ/HRUMIBMfI+tVZGLokrOE55MdGpTx3EGO"
+    "SzhVPKXPKdUjscajJxy/v9LSk1Y/faDGfA/IQo051Ji3HlmoMYca8w6BCzXmUGOeKmooSw"
+    "XFCh+qpIHiZRcN6svtPrrhbIXmRHKAbEIFknGn7BdLEkvomDaSi+HsCzFKjvLvNWeV9+ZV"
+    "rsux4W15yO60xDl1VOdDducxsl4lu9OW72Y/NMMHKQH4on7Bve4XFSSMjvDQ/0G+psAPJH"
+    "JhnlBnlYmvE5BH1vvDu8fWhPbqId6bvp1cvULK8h86vhhJ9/D6FdItLN2uIVuml28vJjO3"
+    "LTjES0d3VRh6WYGfl4XsvMy80aHWh6mo/0pH0hC+G7epH1oR25ZKpjYBSTvA/774N323Kd"
+    "8e+GjKx5qbXyREjfnItwc+7stHUz+Vbw98NOXDjyiaJAgSlvDjnu1RhtmEQFSO2YDnlC0w"
+    "3WqmD3bA3jJS4Xy9vbiWnALD6eTRnk62zEEcweHkiHBTX/ZyjiT9nn7ZQSSOxmw7fCwGFd"
+    "76bdeBn/otIP/dkMpZ6MjkGHPQw2GVHPRwWJyDVn3JYEBtqhoI+8OPEN0Hea1PfqIgeRW3"
+    "v11Pr4pESmiS1iemLtB/yDIrfSFF29AuAVeBkVAlAaZPLkd/peEeX0zP0nJDTXB26F+UuP"
+    "sffio1Yw=="
+)
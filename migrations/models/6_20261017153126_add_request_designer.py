@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "thumbnail_requests" ADD "designer_id" INT REFERENCES "thumbnail_designers" ("id") ON DELETE CASCADE;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "thumbnail_requests" DROP COLUMN "designer_id";"""
+
+
+MODELS_STATE = (
+    "eJztXVtz0zgU/iuavCw7k2W7gVDgLQ1h6dI2DM1eWcaj2GriqSMFWQYybP/7Sr7fY5s0sd"
+    "PzwlBJR5W/zzo+39Gx+623Ygax7MdjTrBgvPcSfetRvCLyP+muPurh9TrqUA0Czy13rO4N"
+    "chvx3BYc60K232DLJrLJILbOzbUwGVWj/2bOzJkTpDMqCBUobm0wXZqbdLFtoEPNTw7RBF"
+    "sQsSRq6R8+ymaTGuQrsdWPH7xLUY22Jhdkfia9j2rM+la7MYllJC7XNNRIt10Tm7Xbdk7F"
+    "a3egWthc05nlrGg0eL0RS0bD0SYVqnVBKOFYEDW94I66fupYlg9VAIm3/GiIt+6YjUFusG"
+    "MpFJW1t4CoradpV9OZdj2ZaVovg3BgEcPSb5JIKnbkUm336hdqCT8Nfnl6+vT5k2dPn8sh"
+    "7jLDltM771dHwHiGLjxXs96d248F9ka4wEeguoQRQ8MiC+4r2SPMFclHOGmZQtrwTR8H/0"
+    "njHqBcBnzQECEf3a77gF5eoDGl1sanvATn2fnl5Ho2unynft3Ktj9ZLn6j2UT1DNzWTar1"
+    "0bMfVTuTO9HbouEk6M/z2RukfkT/TK8mLrzMFgvu/sZo3OyfnloTdgTTKPuiYSN2dwatAW"
+    "pyZMS6szYasp60BNbbwnqAUYx2f/UR64GzTfI9XmKez3UwPsWyRKuLvK7wV80idCGW8sdf"
+    "Tk5KiP1j9H78ZvT+kRyVYuvK7xp4fXcJfKOHWAbkM8YsgmnBsypulwJ7Lg3vC+3gOXYPaJ"
+    "eAezadXiQ2zNn5LAXy75dnE4m+i70cZAoSPcxUeHBzG3uWqYY51m+/YG5oiZ6IGbF0VnOK"
+    "TUvjRGfcsHMY8qd4/fY9sbB7vVk2/IhrFkzXwX1wF9x9QWuep1jJcG5pbTRbYLErrC69Oa"
+    "8FzgRhxwJb/DaTq7Z3ht17b7pjwk1tWzZgRRs527UarHL3NrZtc0FlSEIMM5AeScgvMd3M"
+    "mPrX9b/ncimY6nne1sd94s7UBO2DaoUirPv+hWkp4RhdJle3ooQwg2lcz90w7lJzS1Rs1P"
+    "Ph1jylFRLn9/qGfq9YcuYslnGz+MySAbkg4rn58eh6PHrlxj9aWqm5d80KU7xwmxQMd/30"
+    "9eRI5OhKixVy7PbZLpD/MA3CUMwkoYozvVWksGHa6tGkOTbhIItBFrfVo3dUIIEsfoisV5"
+    "HFgePNc6Rn5qLQlybttvvU1scPvlN9MRg8eXI6OHny7Pnw6enp8PlJ6F2zXWVu9uz8V+Vp"
+    "E7wGrjcLf/y5VzVDkWcL2QrIVnQxW7F7QZQI3r9PEcXOmDrl0upKoth1FmqiuM5MSqKk6E"
+    "lLoqRg2oUk8iKYck30dc24GDvcLlBG8f5+qT5yR2q6O7SiTLrAtkBhVgR5yTckp5bugxMD"
+    "zTcIo4VjWsYPNjKpBGBFqMAW8n5ZRljtYL7tUgyUFiitdgQB3Yy5QWk9RNarKC3XM9fWWX"
+    "ErUFkNVZYln5xac1+bY76DrefD3pad192dlnWwLmHReVSt0CXXttHOaxnBu4hl9qfoSuP6"
+    "X5VTHDN6Yy56OWF9vLs0qvecq+6OrBjUXxMuo23k2TjcPcNENhFCQp89C9k6GgJyCMghNI"
+    "OAHFiHgPwBBeRRfCWXrRKLXOPMIrXJKJ/niKK2PfPjJWWbcZK1BR6a8sBk9GiTprsjzxq4"
+    "aMqFLZckYYxcjr7ElBKr5gli2TR7PFAMWzp1oliFj9rbZMtEsGOaP+VV8Kh9YfzWXmOd5B"
+    "UEl22VXHvYIzX2SAidtsacUNF4j2yZCPZInT3Skiza1A8PejkptLCvX5Y/CwKMirmzYFL7"
+    "Z29NOcXD+UMgSwZZMsiXQJYMWIcC4UM7VSgQbsF2gwJhKBDeXSAcvdGcEwknXncuDoXD7E"
+    "HFWHjMVmtV4WpkKjptdMN4UQ1odbMqb90lozHpqeFFO4ijW+LiuxlRQRz9EFmvEkdvmCOc"
+    "OdEcnnNiUBzDpcyOMHwbVArfBiXh2yAbvukSjQXjm3q1fymr3YiWQ4O9k2dY6pkVvuZTFd"
+    "iEEeCaJ/SCAoZawKasANkiZZEFOovya8aJ7HpLqr4YGGqDV7E5O4Z2yUuCHH8JlUD6Tst9"
+    "RS/PUewA5u94/7Ij4Cb9YwVs/QfVLu/hcWzOY4U5+XzPx/nAOYiQhrJcRJyrCjkJzb9wk1"
+    "TMTsxiyQX341sogA75B7/Zo7uKNnCWBzmIjriVjqpRyEE8RNar5CAO+w3cw7rRRM5hWCXl"
+    "MCzOOAyzCYeGhVX3UEfVhsfVnk9J4bSuXad18PHhGiolcSfDx4e7+vHhlpWzFsK2FxUbJs"
+    "TKVGw8a1ZFxQYpqNoiNmFYIFoTY0CkgkjtiHvsqFwBkfoQWYeC09ZLKSg4hYJTkLCJ4COo"
+    "udSSRZ6gYkHFgoo9EGx7UbHxW65MyKZuzSpaNrNDmpWM68yRSKE14cidsR/q2H7w50gRpg"
+    "aKFwxsLShvMmmOYv7guQGf/VDpx+pCwgk+groGdd1Gt91RnQXq+iGyXkVdhy45S3g+2aFB"
+    "Gc8d5LiEU8VT+nhXPRJrPHrC8furyD1p9dMHSvP3gCyU5kNpfuuRhdJ8KM3vELhQmg+l+a"
+    "ksWlkqKJZpq5IGiuf5GpTl2310w9kKzYnkANmECiTjTtkvliSW0DFtJBfD2WdiZBJAO5qz"
+    "yucGVK7LseEjA5DdaYlz6qjOh+zOQ2S9SnanLZ+0PzTDB6mc+Kz+8H3d7zskjI6wVuJevu"
+    "7gBxK5ME+os8rE1wnII+v94d1ja0J79RDvTd9Nrl4iZfkvHV+MpHt49RLpFpZu15At08t3"
+    "F5OZ2xYc4qWjuyoMvajAz4tCdl5kXoRR68NU1H8TJmkInxRu6odWxLalkqlNQNIO8P9e/J"
+    "u+EpZvD3w05WPNzc8SosZ85NsDH9/LR1M/lW8PfDTlw48omiQIEpbwN1HbowyzCYGoirUB"
+    "zylbYLrVTB/sgL1lpML5ejdwPdz5+hHesCXH63Dse7THvi27kXd66pvnKnYJc40KkY7CXK"
+    "lA5DCH6yPCTX3ZyzlS93v6ZQfpOBqz7fC8GFR42b9dB9bqT4D5rzVVPkWJTI7xDGU4rHKG"
+    "MhwWn6GovmTQpTZVDYT94UeI7r28zSt/oyB5FeO/XU+vikR2aJLW16Yu0H/IMiu9wdc2tE"
+    "vAVWAkVHWA6aPL0V9puMcX07O0XFYTnB36D8nc/Q/Wi4P+"
+)
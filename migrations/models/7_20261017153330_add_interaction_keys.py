@@ -0,0 +1,71 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "interaction_keys" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "key" VARCHAR(100) NOT NULL UNIQUE,
+    "expires_at" TIMESTAMP NOT NULL
+) /* Keys of interactions being or already handled, so duplicate deliveries are dropped */;
+CREATE INDEX IF NOT EXISTS "idx_interaction_expires_0eb06a" ON "interaction_keys" ("expires_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "interaction_keys";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2zYS/isYfbl0RtdzlShO8k1WlNaNbWViXe/aNMOBREjimCJYAEyi6fm/H8D3d5"
+    "GMLJHSfsnEABYGnyUW++wu6L97G6oTk/84ZgQLynpv0N89C2+I/E+6q4962LajDtUg8Nx0"
+    "xy68QW4jnnPB8ELI9iU2OZFNOuELZtjCoJYa/Tt1Zs6coAW1BLEEikvrdCHFDWu1a6BjGX"
+    "85RBN0RcSaqKV/+iybDUsn3whXP37yHkU1ck0uyPhCep/VGPtBWxrE1BOPa+hqpNuuia3t"
+    "tl1b4p07UC1sri2o6WysaLC9FWtqhaMNS6jWFbEIw4Ko6QVz1PNbjmn6UAWQeMuPhnjrjs"
+    "noZIkdU6GopL0FRG09TbubzrT7yUzTehmEA4kYln6TRFJpRy6Vu0+/Ukv45+CnF5cvXj1/"
+    "+eKVHOIuM2y5fPR+dQSMJ+jCczfrPbr9WGBvhAt8BKqrMKJrWGTBfSt7hLEh+QgnJVNI67"
+    "7oj8F/0rgHKJcBHzREyEev6yGglw+oTy1z66u8BOfZ9e3kfja6/aB+3Ybzv0wXv9FsonoG"
+    "bus21frs5Q+qncqd6G3RcBL0n+vZL0j9iP6Y3k1ceCkXK+b+xmjc7I+eWhN2BNUs+lXDeu"
+    "ztDFoD1OTISOuOrTfUelIStN4WrQcYxdTurz7SemBsk/oerzHL13UwPqVliVYX9brB3zST"
+    "WCuxlj/+dHFRotjfRh/Hv4w+PpOjUtq687sGXt9jAt/oEMuAfEWpSbBVcFbF5VJgz6XgU6"
+    "EdnGNPgHYJuFfT6U1iw1xdz1Ig//v2aiLRd7GXgwxBosNMuQfLh9hZphrmePHwFTNdS/RE"
+    "mhFrZzO3sGFqjCwo03mOhvwp3r3/SEzsPm9WG77HNQum6+A+eAzevqA1z1JspDu3NrcaF1"
+    "jsC6tbb857gTNO2KnAFn/N5Kr53rD76E13SripbUsHtGgjZ7s2g03u3sacGytLuiRENwLq"
+    "kYT8FlvbGVX/uvb3Wi4FW4s8a+vjPnFnaoL2UblCEdZ9/8G0FHGMHpOpV1FCmME0zueWlL"
+    "mqeSDKN+r5cGse0woV5/f6gn6vWDPqrNZxsfjMUgNyQcQz8+PR/Xj01vV/tDRTc9+aDbbw"
+    "ym1SMDz208+TQ5GjJy1myLHXZzdB/s3QCUUxkQQrzvRWocK6wdXRpDmcMKDFQIvbatE7Sp"
+    "CAFp+j1qvQ4sDw5hnSK2NVaEuTcrttauv9B9+ovh4Mnj+/HFw8f/lq+OLycvjqIrSu2a4y"
+    "M3t1/bOytAm9BqY3C3/83KsaociThWgFRCu6GK3YPyFKOO/fx4hiOaZOmbS6lCj2nIWcKM"
+    "4zk5QoSXrSlChJmPZBiTwPppwTfbMpE2OH8QJmFO/vl/Ijd6S2cIdWpEk3mAsURkWQF3xD"
+    "cmppPhjR0XyLMFo5hqn/gyPDkgBsiCWwibxfliFWe5hvNxUDpgVMqx1OQDd9bmBa56j1Kk"
+    "zLtcy1eVZcClhWQ5ZlypNTa25rc8T3sPV82Nuy87q707IG1lVYlI+q5brkyjbaeS1T8D58"
+    "mcMxulK//mdlFMfUWhqrXo5bH+8u9eo947pwR1Z06u8Jk9428mQc5uYwESdCSOizuZCdo8"
+    "EhB4ccXDNwyEHr4JCfkUMe+Vdy2SqwyDRGTVJbGeXznJDXdmD9eEHZZjrJyoIemuqBSu+R"
+    "k6a7I08adNFUF1wuScIYmZzFGlsWMWtmEMumOWBCMWzpVEaxij5qb5MdE8GOaX7KK+dR+0"
+    "rZA7fxguQVBJdtlVx52CM19kgInWZjRizReI/smAj2SJ090pIomlQ2UcEuidN7N0mfCaSl"
+    "RvTLYmlGNFbl/CuG0+S0HNEliklzNCdST4gyhE1lALZIvmu6SfQ+4hTpjm0aC/lWBZlvg3"
+    "Ak30mkM2rbRM/E4J7mV0Dgrl2Buwfv/axaO+cP30+53HGBffpiOfLNNhjhDcJjScnDhMeO"
+    "UGHVwWhYVD3VgpNo6hPVvDMo7Cs9fQKqW/HYCSbl//LWlHONJX8ImP12mX3I1xRD383IPe"
+    "RrzlHrcFWllUwVrqoc3/uGqyondVWl1BGOvq2R4wknPrxR7AqHceyKvvCYbmx110LP3C3g"
+    "aElZ0W2E6mJV7n8nvTFpqeHKN/jRLTHx3fSowI8+R61X8aO31BHOnGgOy8ldF/twKbETdN"
+    "8Gldy3QYn7Nsi6byqPsKJsW68KPSW1H9JybLD3coalzqzwwmlVYBNCgGse0QtK6WoBm5IC"
+    "ZIuYRRboLMrvKCOy6z2pekU95AZvY3N2DO2S6+oMfw2ZQPpNy70snmco9gDzd3wJoCPgJu"
+    "1jBWz9g2qf7/A4Nuepwpw83/NxPnIMIlRDWSwirqsKMQnNf3CDVIxOzGLBBfczkCiADvkl"
+    "SNnUXUUZyOVBDKIjZqWjbBRiEOeo9SoxiON+jb1FBVvDKiGHYXHEYZgNODQs8X2Cit42HF"
+    "cHzpJCtq5d2Tr4DH4NlpJ4k+Ez+F39DH7LLlYUwnYQFhsGxMpYbDxqVoXFBiGo2iQ2IVhA"
+    "WhNjgKQCSe2IeewoXQGSeo5ah4LT1lMpKDiFglOgsAnnI6i51JJFnsBigcUCiz0SbAdhsf"
+    "FXrozIpl7NKlw2s0OalYwvqCORQjZhyJ2xH/LYfvCHsRG2dBQvGNhZUN5k0hzG/MkzA772"
+    "Q6YfqwsJJ/gM7BrYdRvNdkd5FrDrc9R6FXYdmuSswvOVHQqU6bmDOi7RqdJTOr2rjsQaR0"
+    "84/nAVuRetPn2gNP8AyEJpPpTmtx5ZKM2H0vwOgQul+VCan4qilYWCYpG2KmGgeJyvQVk+"
+    "76Mloxv/w4qcWAJJv1P2izWJBXQMjuRiGP2S86HGPc1Z5XMDKtblcPjIAER3WmKcOsrzIb"
+    "pzjlqvEt1pyx9XObaGj1I58cXQCa37fYeE0AnWSjzJ1x18RyIX5onlbDL+dQLySPpwePeo"
+    "TaxePcR70w+TuzdISf5pjW9G0jy8fYMWJpZmV5ct09sPN5OZ2xYk8dLeXRUNva6gn9eF2n"
+    "mduQij1octUf8mTFIQPm7f1A5tCOeSydRWQFIO8P9e/JteCcuXB3001YfNjC8Sosb6yJcH"
+    "fXyvPpraqXx50EdTffgeRZMAQUIS/jp3e5hhNiAQVbE20HNKFjTdak0fLcHeMqVCfr0buB"
+    "4vv36CL2xJeh3Svieb9m3Zi7zXrG+eqdgnzDUqRDoKc6UCkeMk10eEGYt1Lyel7vf0yxLp"
+    "OBqzK3leDCpc9m9Xwlr9CTD/WlPlLEokcoo5lOGwSg5lOCzOoai+pNOlNlUNhP3hJ4juk9"
+    "zmlb9RkLyK8V/vp3dFJDsUSfNrYyHQ/5BpVLrB1za0S8BVYCRYdYDps9vRf9Nwj2+mV2m6"
+    "rCa4OvYfknn8Py1bodI="
+)
@@ -0,0 +1,72 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "thumbnails" ADD "video_id" VARCHAR(11);
+        ALTER TABLE "thumbnail_requests" ADD "video_id" VARCHAR(11);
+        CREATE INDEX IF NOT EXISTS "idx_thumbnails_video_i_3335ff" ON "thumbnails" ("video_id");
+        CREATE INDEX IF NOT EXISTS "idx_thumbnail_r_video_i_316787" ON "thumbnail_requests" ("video_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_thumbnail_r_video_i_316787";
+        DROP INDEX IF EXISTS "idx_thumbnails_video_i_3335ff";
+        ALTER TABLE "thumbnails" DROP COLUMN "video_id";
+        ALTER TABLE "thumbnail_requests" DROP COLUMN "video_id";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2zYS/isYfbl0RtezlThO8k1WlNaNbWViXdtrLsOBREjimCJYAEyiaf3fC/D9XS"
+    "QjS6S0XzIxgIXAZ4HFPosF+VdvTXVi8h9HjGBBWe8N+qtn4TWR/0lX9VEP23ZUoQoEnplu"
+    "27nXyC3EMy4YngtZvsAmJ7JIJ3zODFsY1FKt/0edqTMjaE4tQSyB4tI6nUtxw1pua+hYxp"
+    "8O0QRdErEiauifPstiw9LJN8LVn5+8R1GFXJMDMr6Q3mfVxn7QFgYx9cTjGrpq6ZZrYmO7"
+    "ZdeWeOc2VAObaXNqOmsramxvxIpaYWvDEqp0SSzCsCCqe8Ec9fyWY5o+VAEk3vCjJt64Yz"
+    "I6WWDHVCgqaW8AUVlP0+4mU+1+PNW0XgbhQCKGpV8kkVTakUPl7tMv1RD+PTh/cfni1fOX"
+    "L17JJu4ww5LLR++nI2A8QReeu2nv0a3HAnstXOAjUF2FEV3DIgvuW1kjjDXJRzgpmUJa90"
+    "V/DP6Txj1AuQz4oCBCPpqu+4BePqA+scyNr/ISnKfXt+P76fD2g/q5Ned/mi5+w+lY1Qzc"
+    "0k2q9NnLH1Q5lSvRW6JhJ+i36+nPSP2J/pjcjV14KRdL5v5i1G76R0+NCTuCahb9qmE9Nj"
+    "uD0gA12TLSumPrDbWelAStt0XrAUYxtfujj7QeGNukvkcrzPJ1HbRPaVmi1UW9rvE3zSTW"
+    "Uqzkn+dnZyWK/XX4cfTz8OMz2SqlrTu/auDVPSbwjTaxDMhXlJoEWwV7VVwuBfZMCj4V2s"
+    "E+9gRol4B7NZncJBbM1fU0BfJ/b6/GEn0Xe9nIECTazJR7sHiI7WWqYIbnD18x07VETaQZ"
+    "sXLWMwsbpsbInDKd52jI7+Ld+4/ExO7zZrXhe1zToLsOroPHYPYFpXmWYi3duZW50bjAYl"
+    "dY3Xp93gucccKOBbb4NJOj5jvD7qPX3THhppYtHdCihZytWg/WuWsbc24sLemSEN0IqEcS"
+    "8ltsbaZU/eva32s5FGzN86ytj/vY7akJ2gflCkVY9/0H01LEMXpMpqaihDCDaZzPLShzVf"
+    "NAlG/U8+HWPKYVKs6v9QX9WrFi1Fmu4mLxnqUG5ICIZ+ZHw/vR8K3r/2hppubOmjW28NIt"
+    "UjA89tPPk0ORoyctZsix6bOdIP9q6ISimEiCFWdqq1Bh3eBqa9IcThjQYqDFbbXoHSVIQI"
+    "tPUetVaHFgePMM6ZWxLLSlSbntNrX1/oNvVF8PBs+fXw7Onr98dfHi8vLi1VloXbNVZWb2"
+    "6vonZWkTeg1Mbxb++L5XNUKRJwvRCohWdDFasXtClHDev48Rxc6YOmXS6lKi2HMWcqI4z0"
+    "xSoiTpSVOiJGHaBSXyPJhyTvTNpkyMHMYLmFG8vl/Kj9yW2txtWpEm3WAuUBgVQV7wDcmu"
+    "pflgREezDcJo6Rim/i+ODEsCsCaWwCbyfixDrHbQ33YqBkwLmFY7nIBu+tzAtE5R61WYlm"
+    "uZa/OsuBSwrIYsy5Q7p9bc1uaI72Dp+bC3ZeV1d6VlDayrsOg8qpbrkivbaOW1TMG78GX2"
+    "x+hK/fqflFEcUWthLHs5bn28utSr94zr3G1Z0am/J0x628iTcZh7hok4EUJCnz0L2doaHH"
+    "JwyME1A4cctA4O+Qk55JF/JYetAotMY9QktZVR3s8ReW171o8XlG2mk6ws6KGpHqj0Hjlp"
+    "ujrypEEXTXXB5ZAkjJHJma+wZRGz5gliWTd7PFAMSzp1olhFH7WXyZaOYMU03+WV86h9pe"
+    "yB23hO8hKCy5ZKrjyskRprJIROszEjlmi8RrZ0BGukzhppSRRNKpuoYJfE6b17SJ8JpKVa"
+    "9MtiaUbUVp35VwynyW45ogsUk+ZoRqSeEGUIm8oAbJCca7pJ9D7iFOmObRpzOauCk2+DcC"
+    "TnJNIZtW2iZ2JwT/MTELhrV+DuwZufVXPn/Oa7SZc7LLBPnyxHvtkGI7xBeCwpuZ/w2AEy"
+    "rDoYDYuyp1qwE018opq3B4V1pbtPQHUrbjtBp/w/3phyrrHkNwGz3y6zD+c1xdB3M3IP5z"
+    "WnqHW4qtJKpgpXVQ7vfcNVlaO6qlLqCEfv1sjxhBMv3ih2hcM4dkVfeETXtrproWfuFnC0"
+    "oKzoNkJ1sSr3v5PemLTUcOUb/OiWmPhuelTgR5+i1qv40RvqCGdGNIflnF0X+3ApsSN03w"
+    "aV3LdBifs2yLpvX9TrUHI5SzHUcZlGOG8/WjtgiPq8io98Xuwin6chVkc1S8o29RL9U1K7"
+    "4YWHns87cRNSbkF4p7cqsAkhwDWPSwfZirWATUkBskXkLQt0FuV3lBFZ9Z5UfQtASL/exv"
+    "rsGNolbwRg+GtIttIzLfc+fp6h2AHM3/GyhY6Am7SPFbD1N6pdzuFRrM9jhTm5v+fjfOAw"
+    "T6iGsnBPXFcVwj6a/+AGqRgAmsbiN+6bNlEAHfKzvLKnoxVl4LgUwjwdMSsdJfwQ5jlFrV"
+    "cJ8xz2hfctyom7qBLVuSgO6lxkYjpNs6ifIGm6DdvVng+i4UC0XQei8KWBGiwlMZPhSwNd"
+    "/dJAy+6uFMK2FxYbBsTKWGw8alaFxQYhqNokNiFYQFoTbYCkAkntiHnsKF0BknqKWoec3t"
+    "ZTKcjphZxeoLAJ5yNIa9WSebTAYoHFAos9EGx7YbHxKVdGZFNTswqXzayQZln5c+pIpJBN"
+    "GHJ77Ic8th98exxhS0fxhIGtOftNOs1hzJ88M+BrP2T6sbyQsIPPwK6BXbfRbHeUZwG7Pk"
+    "WtV2HXoUnOKjxf2aFAmZ47qOMSnSo9pY931ZZYY+sJ2+8vI/es1bsPpObvAVlIzYfU/NYj"
+    "C6n5kJrfIXAhNR9S81NRtLJQUCzSViUMFI/zNUjL5320YHTtv7uSE0sg6XfKerEisYCOwZ"
+    "EcDKNfct6FuaM+q7zRQcW6HA7vcYDoTkuMU0d5PkR3TlHrVaI7bfl+zaE1fJDMCe8VDTVf"
+    "oZEQOsJcCXiBxj5Q3v0LNHxfLRfgseWsMxQmAXYkvb8p3aM2sXr14O5NPozv3iAl+X9rdD"
+    "OUFvjtGzQ3sdzZdFkyuf1wM566ZcE5adqBrqKe1xW087pQOa8zd43U+LAl6l82SgrCJxqa"
+    "mvo14VySxdoKSMoB/t+Lf9Nbd/nyoI+m+rCZ8UVC1Fgf+fKgj+/VR1M7lS8P+miqD9+jaB"
+    "KDSUjCN+bbQ76zMZcoUbiBnlOyoOlWa/pgOQwtUyqkMHQD18OlMBzhhC3JYICT9aM9WW/Z"
+    "RN7pwXqeqdglzDWScDoKc6UcnMPkLwwJM+arXk7Wgl/TL8tVwFGbbfkJxaDC+xTalROgPm"
+    "Tn3xyrfH4SiRzjMdXFRZVjqouL4mMqVZd0utSiqoGw3/wI0X2SC9PyFwXJS8r/5X5yV0Sy"
+    "Q5E0vzbmAv2NTKPSJcm2oV0CrgIjwaoDTJ/dDn9Pwz26mVyl6bLq4OrQn0N6/AehJIPB"
+)
@@ -0,0 +1,22 @@
+"""
+Shared test case setup
+"""
+import unittest
+from tortoise import Tortoise
+
+
+class DatabaseTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs each test against a fresh in-memory database"""
+
+    async def asyncSetUp(self):
+        # same settings as database/config.py
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["database.models"]},
+            use_tz=False,
+            timezone="UTC"
+        )
+        await Tortoise.generate_schemas()
+
+    async def asyncTearDown(self):
+        await Tortoise.close_connections()
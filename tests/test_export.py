@@ -0,0 +1,75 @@
+"""
+Export query tests, run with: python -m unittest discover tests
+"""
+import unittest
+from datetime import datetime, timedelta
+from database.models import Thumbnail, ThumbnailDesigner, Creator, ThumbnailCategory
+from tests.base import DatabaseTestCase
+from cogs.export import EXPORT_CHUNK_SIZE, ExportQuery, iter_thumbnail_rows, new_thumbnails_query, advance_export_cursor
+
+
+class ExportTestCase(DatabaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.designer = await ThumbnailDesigner.create(discord_id=1, discord_username="designer")
+        self.creator = await Creator.create(name="creator")
+        self.category = await ThumbnailCategory.create(name="category")
+
+    async def add_thumbnails(self, count: int):
+        """Create thumbnails the way the bot does, returning their ids"""
+        thumbnails = [
+            await Thumbnail.create(
+                designer=self.designer,
+                creator=self.creator,
+                category=self.category,
+                youtube_url="https://youtu.be/dQw4w9WgXcQ"
+            )
+            for _ in range(count)
+        ]
+        return [thumbnail.id for thumbnail in thumbnails]
+
+    async def export_ids(self, query: ExportQuery):
+        return [row["id"] async for rows in iter_thumbnail_rows(query) for row in rows]
+
+
+class IterThumbnailRowsTests(ExportTestCase):
+    async def test_chunks_do_not_repeat_rows(self):
+        ids = await self.add_thumbnails(EXPORT_CHUNK_SIZE * 2 + 1)
+        query = ExportQuery(start=datetime.min, end=datetime.now() + timedelta(days=1))
+
+        exported = await self.export_ids(query)
+
+        self.assertEqual(len(exported), len(set(exported)))
+        self.assertEqual(sorted(exported), ids)
+
+
+class ExportCursorTests(ExportTestCase):
+    async def run_export(self, now: datetime):
+        """One thumbnails-new run: export after the cursor, then advance it"""
+        cursor, query = await new_thumbnails_query(1, now)
+        rows = [row async for chunk in iter_thumbnail_rows(query) for row in chunk]
+        if rows:
+            self.assertTrue(await advance_export_cursor(cursor, query.after, (rows[-1]["created_at"], rows[-1]["id"])))
+        return [row["id"] for row in rows]
+
+    async def test_consecutive_runs_do_not_overlap(self):
+        first_ids = await self.add_thumbnails(3)
+        first = await self.run_export(datetime.now() + timedelta(days=1))
+        second_ids = await self.add_thumbnails(2)
+        second = await self.run_export(datetime.now() + timedelta(days=1))
+        third = await self.run_export(datetime.now() + timedelta(days=1))
+
+        self.assertEqual(first, first_ids)
+        self.assertEqual(second, second_ids)
+        self.assertEqual(third, [])
+
+    async def test_stale_cursor_is_not_advanced(self):
+        await self.add_thumbnails(2)
+        cursor, query = await new_thumbnails_query(1, datetime.now() + timedelta(days=1))
+        rows = [row async for chunk in iter_thumbnail_rows(query) for row in chunk]
+        self.assertTrue(await advance_export_cursor(cursor, query.after, (rows[0]["created_at"], rows[0]["id"])))
+        self.assertFalse(await advance_export_cursor(cursor, query.after, (rows[1]["created_at"], rows[1]["id"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
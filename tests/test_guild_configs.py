@@ -0,0 +1,39 @@
+"""
+Guild config cache tests, run with: python -m unittest discover tests
+"""
+import unittest
+from datetime import timedelta
+from database.cache import GuildConfigCache
+from database.models import GuildConfig
+from tests.base import DatabaseTestCase
+
+
+class GuildConfigCacheTests(DatabaseTestCase):
+    async def test_cached_until_the_ttl(self):
+        cache = GuildConfigCache(ttl=timedelta(hours=1))
+        self.assertIsNone(await cache.get(1))
+        # written by another process, this one keeps its cached answer for now
+        await GuildConfig.create(guild_id=1, overseer_role_id=3)
+
+        self.assertIsNone(await cache.get(1))
+
+    async def test_missing_config_is_read_again_after_the_ttl(self):
+        cache = GuildConfigCache(ttl=timedelta(0))
+        self.assertIsNone(await cache.get(1))
+        await GuildConfig.create(guild_id=1, overseer_role_id=3)
+
+        guild_config = await cache.get(1)
+        self.assertEqual(guild_config.overseer_role_id, 3)
+
+    async def test_changed_config_is_read_again_after_the_ttl(self):
+        cache = GuildConfigCache(ttl=timedelta(0))
+        await GuildConfig.create(guild_id=1, overseer_role_id=3)
+        await cache.load()
+        await GuildConfig.filter(guild_id=1).update(overseer_role_id=4)
+
+        guild_config = await cache.get(1)
+        self.assertEqual(guild_config.overseer_role_id, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Role event queue tests, run with: python -m unittest discover tests
+"""
+import asyncio
+import unittest
+from database.models import ThumbnailDesigner
+from database.role_queue import RoleEventQueue
+from tests.base import DatabaseTestCase
+
+
+class RoleEventQueueTests(DatabaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.queue = RoleEventQueue(delay=0.01)
+
+    async def active_designers(self):
+        return await ThumbnailDesigner.filter(is_active=True).order_by("discord_id").values_list("discord_id", flat=True)
+
+    async def test_push_during_flush_is_written(self):
+        flushing = asyncio.Event()
+        release = asyncio.Event()
+        apply = self.queue._apply
+
+        async def slow_apply(*args):
+            flushing.set()
+            await release.wait()
+            return await apply(*args)
+
+        self.queue._apply = slow_apply
+        self.queue.push(1, "first", ThumbnailDesigner, "designer", True)
+        await flushing.wait()
+        # the timer task is still inside its flush when this arrives
+        self.queue.push(2, "second", ThumbnailDesigner, "designer", True)
+        release.set()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.active_designers(), [1, 2])
+        self.assertFalse(self.queue._pending)
+
+    async def test_failed_flush_is_retried(self):
+        apply = self.queue._apply
+        failures = [1]
+
+        async def flaky_apply(*args):
+            if failures[0]:
+                failures[0] -= 1
+                raise RuntimeError("database is locked")
+            return await apply(*args)
+
+        self.queue._apply = flaky_apply
+        self.queue.push(1, "first", ThumbnailDesigner, "designer", True)
+        with self.assertLogs("database.role_queue", "ERROR"):
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.active_designers(), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Autocomplete index tests, run with: python -m unittest discover tests
+"""
+import random
+import unittest
+from database.cache import SearchIndex
+
+
+def expected_search(entries: dict, current: str, limit: int = 10):
+    """What search() should return for {key: (name, is_active)}, by scanning every entry"""
+    current = current.lower()
+    active = sorted((name.lower(), name) for name, is_active in entries.values() if is_active)
+    prefix = [name for lower_name, name in active if lower_name.startswith(current)]
+    infix = [name for lower_name, name in active if current in lower_name and not lower_name.startswith(current)]
+    return list(dict.fromkeys(prefix + infix))[:limit]
+
+
+class SearchIndexTests(unittest.TestCase):
+    def test_infix_matches_past_the_start_of_a_large_index(self):
+        index = SearchIndex()
+        index.load((f"Creator {number:05}", number, True) for number in range(20000))
+        index.add("zzz Special Creator", "special")
+
+        self.assertEqual(index.search("special"), ["zzz Special Creator"])
+        self.assertEqual(index.search("ecia"), ["zzz Special Creator"])
+
+    def test_matches_a_full_scan(self):
+        rng = random.Random(0)
+        entries = {}
+        index = SearchIndex()
+        for key in range(2000):
+            name = "".join(rng.choice("abcAB ") for _ in range(rng.randint(1, 8)))
+            entries[key] = (name, rng.random() > 0.2)
+            index.add(name, key, entries[key][1])
+        # renames and removals must drop the old name from the n-gram map
+        for key in rng.sample(sorted(entries), 300):
+            name = "".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+            entries[key] = (name, entries[key][1])
+            index.add(name, key, entries[key][1])
+        for key in rng.sample(sorted(entries), 300):
+            del entries[key]
+            index.remove(key)
+
+        for current in ["", "a", "B", "ab", " a", "abc", "abca", "cab b", "zz"]:
+            with self.subTest(current=current):
+                self.assertEqual(index.search(current), expected_search(entries, current))
+
+
+if __name__ == "__main__":
+    unittest.main()
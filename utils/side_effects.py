@@ -0,0 +1,209 @@
+"""
+Scheduler for Discord REST side effects
+"""
+import asyncio
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+import discord
+
+
+class Priority(IntEnum):
+    # something the user is waiting on, like the private channel after a claim
+    WORKFLOW = 0
+    # edits and pins nobody waits for
+    COSMETIC = 1
+
+
+@dataclass
+class SideEffect:
+    route: str
+    priority: Priority
+    make_call: object
+    future: asyncio.Future
+    key: object = None
+    seq: int = 0
+    attempts: int = 0
+
+
+@dataclass
+class RouteState:
+    busy: bool = False
+    # time.monotonic() before which the route isn't used, after a rate limit
+    cooldown_until: float = 0.0
+    waiting: list = field(default_factory=list)
+
+
+class SideEffectScheduler:
+    """Runs Discord REST calls through per-route queues
+
+    A route is a rate limit bucket such as "channel:<id>" or "guild:<id>".
+    Each route runs one call at a time and backs off when it is rate limited,
+    workflow calls go before cosmetic ones, calls are spread under a global
+    rate, and a queued call with the same key as a newer one (e.g. two edits
+    of the same message) is replaced by the newer one.
+
+    Interaction responses are never queued here, they have their own limits
+    and a 3 second deadline, so handlers respond first and schedule the rest.
+    """
+
+    def __init__(self, global_rate: int = 40, max_attempts: int = 3):
+        self.global_rate = global_rate
+        self.max_attempts = max_attempts
+        self._routes = {}
+        # key -> queued SideEffect that hasn't started yet
+        self._queued_by_key = {}
+        self._running = set()
+        # start times of the calls in the last second
+        self._recent = deque()
+        self._seq = itertools.count()
+        self._wakeup = None
+        self._dispatcher = None
+
+    def schedule(self, route: str, make_call, priority: Priority = Priority.COSMETIC, key=None):
+        """Queue make_call() (which returns an awaitable) and return a future for its result
+
+        Awaiting the future is optional, cosmetic calls are usually left to run on their own.
+        """
+        if key is not None and key in self._queued_by_key:
+            # a newer version of a call that hasn't run yet, only the newest one matters
+            queued = self._queued_by_key[key]
+            queued.make_call = make_call
+            queued.priority = min(queued.priority, priority)
+            return queued.future
+
+        loop = asyncio.get_running_loop()
+        side_effect = SideEffect(
+            route=route,
+            priority=priority,
+            make_call=make_call,
+            future=loop.create_future(),
+            key=key,
+            seq=next(self._seq)
+        )
+        self._routes.setdefault(route, RouteState()).waiting.append(side_effect)
+        if key is not None:
+            self._queued_by_key[key] = side_effect
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        self._wakeup.set()
+        return side_effect.future
+
+    def _next_ready(self, now: float):
+        """The most urgent queued call whose route is free, or None"""
+        best = None
+        for state in self._routes.values():
+            if state.busy or state.cooldown_until > now or not state.waiting:
+                continue
+            candidate = min(state.waiting, key=lambda side_effect: (side_effect.priority, side_effect.seq))
+            if best is None or (candidate.priority, candidate.seq) < (best.priority, best.seq):
+                best = candidate
+        return best
+
+    async def _dispatch(self):
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 1.0:
+                self._recent.popleft()
+
+            side_effect = None
+            if len(self._recent) < self.global_rate:
+                side_effect = self._next_ready(now)
+
+            if side_effect is None:
+                if not any(state.waiting for state in self._routes.values()):
+                    if not self._running:
+                        return
+                    await self._wakeup.wait()
+                    continue
+                # sleep until a cooldown or the global window ends, or something changes
+                wake_times = [state.cooldown_until for state in self._routes.values() if state.waiting and state.cooldown_until > now]
+                if len(self._recent) >= self.global_rate:
+                    wake_times.append(self._recent[0] + 1.0)
+                timeout = max(min(wake_times) - now, 0) if wake_times else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            state = self._routes[side_effect.route]
+            state.waiting.remove(side_effect)
+            if side_effect.key is not None:
+                self._queued_by_key.pop(side_effect.key, None)
+            state.busy = True
+            self._recent.append(now)
+            self._running.add(asyncio.create_task(self._run(side_effect, state)))
+
+    async def _run(self, side_effect: SideEffect, state: RouteState):
+        try:
+            result = await side_effect.make_call()
+        except discord.RateLimited as e:
+            self._retry(side_effect, state, e.retry_after)
+        except discord.HTTPException as e:
+            if e.status == 429:
+                self._retry(side_effect, state, 1.0, e)
+            elif not side_effect.future.done():
+                side_effect.future.set_exception(e)
+        except Exception as e:
+            if not side_effect.future.done():
+                side_effect.future.set_exception(e)
+        else:
+            if not side_effect.future.done():
+                side_effect.future.set_result(result)
+        finally:
+            self._running.discard(asyncio.current_task())
+            state.busy = False
+            if not state.waiting and state.cooldown_until <= time.monotonic():
+                self._routes.pop(side_effect.route, None)
+            self._wakeup.set()
+
+    def _retry(self, side_effect: SideEffect, state: RouteState, retry_after: float, error: Exception = None):
+        """Back the route off and put the call back at the front of its queue"""
+        state.cooldown_until = time.monotonic() + retry_after
+        side_effect.attempts += 1
+        if side_effect.attempts >= self.max_attempts:
+            side_effect.future.set_exception(error or discord.RateLimited(retry_after))
+            return
+        state.waiting.append(side_effect)
+        if side_effect.key is not None:
+            self._queued_by_key.setdefault(side_effect.key, side_effect)
+        self._routes[side_effect.route] = state
+
+    async def drain(self, timeout: float = 10.0):
+        """Wait for queued calls to finish, called before the bot shuts down"""
+        if self._dispatcher and not self._dispatcher.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._dispatcher), timeout)
+            except asyncio.TimeoutError:
+                print("Gave up waiting for queued Discord calls")
+
+
+def log_failure(future: asyncio.Future, description: str):
+    """Print the error of a scheduled call nobody awaits"""
+    def report(done):
+        if not done.cancelled() and done.exception():
+            print(f"Error {description}: {done.exception()}")
+    future.add_done_callback(report)
+    return future
+
+
+side_effects = SideEffectScheduler()
+
+
+def schedule_edit(message: discord.Message | discord.PartialMessage, priority: Priority = Priority.COSMETIC, **kwargs):
+    """Queue an edit of a message, replacing any queued edit of the same message"""
+    return log_failure(
+        side_effects.schedule(
+            f"channel:{message.channel.id}",
+            lambda: message.edit(**kwargs),
+            priority,
+            key=("edit", message.id)
+        ),
+        f"editing message {message.id}"
+    )
@@ -0,0 +1,19 @@
+"""
+YouTube URL parsing
+"""
+import re
+
+# youtu.be/<id>, youtube.com/watch?v=<id>, /shorts/<id>, /embed/<id>, /live/<id> and /v/<id>,
+# with or without the scheme and on the www/m/music subdomains, the id is always 11 characters
+VIDEO_ID_PATTERN = re.compile(
+    r"(?:https?://)?(?:(?:www|m|music)\.)?"
+    r"(?:youtu\.be/|youtube(?:-nocookie)?\.com/(?:(?:shorts|embed|live|v)/|watch/?\?(?:[^#]*&)?v=))"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])",
+    re.IGNORECASE
+)
+
+
+def parse_video_id(url: str):
+    """Canonical video id of a YouTube URL, or None if it isn't a YouTube video URL"""
+    match = VIDEO_ID_PATTERN.match(url.strip())
+    return match.group(1) if match else None